@@ -15,14 +15,15 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import json
-import yaml
+import warnings
 from pathlib import Path
 import sys
 import traceback
 from datetime import datetime
+from dataclasses import fields
 
 # Add src to path for imports
 sys.path.append('src')
@@ -31,7 +32,7 @@ sys.path.append('src')
 try:
     from src.pulse_jet_models import (
         PulseJetModel, EngineGeometry, ValveSystem, 
-        OperatingConditions, OptimizationAnalyzer
+        OperatingConditions, OptimizationAnalyzer, warm_up_kernels
     )
     from src.utils import (
         load_config, load_fuel_properties, save_configuration,
@@ -47,6 +48,44 @@ except ImportError as e:
     st.error("Please ensure all required modules are installed and in the correct location.")
     st.stop()
 
+# Silence plotly UserWarnings where plotly is actually used
+warnings.filterwarnings('ignore', category=UserWarning, module='plotly')
+
+# Fragments (Streamlit >= 1.37) rerun independently of the rest of the page;
+# on older versions the decorated functions simply run inline
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', lambda func: func)
+
+# Selectbox options and their name -> index lookups
+VALVE_TYPES = ("Reed Valves", "Flapper Valves", "Rotary Valves")
+FUEL_TYPES = ("Gasoline", "Propane", "Hydrogen", "Kerosene")
+_VALVE_IDX = {v: i for i, v in enumerate(VALVE_TYPES)}
+_FUEL_IDX = {f: i for i, f in enumerate(FUEL_TYPES)}
+
+# Resolve the plot template once instead of by name for every figure
+_PLOT_TEMPLATE = pio.templates["plotly_white"]
+
+# Static design trade-off table shown in the analysis tab
+_TRADEOFF_DF = pd.DataFrame({
+    "Design Aspect": [
+        "Exhaust Length",
+        "Chamber Diameter", 
+        "Intake Area",
+        "Operating Frequency"
+    ],
+    "Increase Benefits": [
+        "Lower frequency, better resonance",
+        "Higher thrust, more fuel flow",
+        "Better breathing, higher mass flow",
+        "Higher power density"
+    ],
+    "Increase Drawbacks": [
+        "Heavier, more complex mounting",
+        "Heavier, higher fuel consumption",
+        "Larger frontal area, more drag",
+        "Higher stress, shorter life"
+    ]
+})
+
 # Page configuration
 st.set_page_config(
     page_title="Pulse Jet Design Modeler",
@@ -60,8 +99,10 @@ st.set_page_config(
     }
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling. Streamlit drops any element a rerun does not
+# re-emit, so this has to be sent every run; it is collapsed to a single line
+# once at import to keep the per-rerun payload small.
+CUSTOM_CSS = " ".join("""
 <style>
     .main-header {
         font-size: 3rem;
@@ -103,12 +144,31 @@ st.markdown("""
         padding-right: 20px;
     }
 </style>
-""", unsafe_allow_html=True)
+""".split())
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Page footer, collapsed to a single line like CUSTOM_CSS
+FOOTER_HTML = " ".join("""
+<div style="text-align: center; color: #666; font-size: 0.9em;">
+<p><strong>⚠️ Important Disclaimer:</strong> This is a simplified model for educational and preliminary design purposes. 
+Actual pulse jet performance depends on many additional factors including combustion dynamics, 
+heat transfer, materials, and manufacturing tolerances. Always consult detailed engineering 
+analysis and testing for final designs.</p>
+
+<p>🔬 <strong>Model Accuracy:</strong> Results are order-of-magnitude estimates. Use for comparative analysis and design trends.</p>
+
+<p>🚀 <strong>Version:</strong> Pulse Jet Modeler v1.0.0 | 
+<a href="https://github.com/your-username/pulse-jet-modeler" target="_blank">GitHub</a> | 
+<a href="https://github.com/your-username/pulse-jet-modeler/issues" target="_blank">Report Issues</a></p>
+</div>
+""".split())
 
 def initialize_session_state():
     """Initialize session state variables"""
     if 'model' not in st.session_state:
         st.session_state.model = PulseJetModel()
+        warm_up_kernels()
     
     if 'saved_designs' not in st.session_state:
         st.session_state.saved_designs = []
@@ -119,18 +179,142 @@ def initialize_session_state():
     if 'validation_passed' not in st.session_state:
         st.session_state.validation_passed = True
 
-def load_sample_configurations():
-    """Load sample configurations from file"""
+@st.cache_data(show_spinner=False)
+def load_sample_configurations(config_path: str = 'data/sample_configurations.json'):
+    """Load sample configurations from file as a name -> config dict (parsed once, then served from cache)"""
     try:
-        config_file = Path('data/sample_configurations.json')
+        config_file = Path(config_path)
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)['configurations']
+            configurations = json.loads(config_file.read_bytes())['configurations']
+            return {c['name']: c for c in configurations}
         else:
-            return []
+            return {}
     except Exception as e:
         st.warning(f"Could not load sample configurations: {e}")
-        return []
+        return {}
+
+# Dataclass field order used to flatten the sidebar params into a cache key.
+# The key is built once per rerun and passed to every cached wrapper, so
+# st.cache_data hashes flat tuples of primitives instead of nested dicts.
+# Derived (init=False) fields are recomputed on construction, so only the
+# constructor arguments go into the key.
+_GEOMETRY_FIELDS = tuple(f.name for f in fields(EngineGeometry) if f.init)
+_VALVE_FIELDS = tuple(f.name for f in fields(ValveSystem) if f.init)
+_OPERATING_FIELDS = tuple(f.name for f in fields(OperatingConditions) if f.init)
+
+def make_analysis_key(params):
+    """Flatten params into a hashable (geometry, valves, operating) key"""
+    return (
+        tuple(params['geometry'][name] for name in _GEOMETRY_FIELDS),
+        tuple(params['valves'][name] for name in _VALVE_FIELDS),
+        tuple(params['operating'][name] for name in _OPERATING_FIELDS)
+    )
+
+def _objects_from_key(key):
+    """Rebuild (geometry, valves, conditions) from an analysis key"""
+    geom_tuple, valve_tuple, cond_tuple = key
+    return EngineGeometry(*geom_tuple), ValveSystem(*valve_tuple), OperatingConditions(*cond_tuple)
+
+@st.cache_data(max_entries=4096, show_spinner=False)
+def _cached_analysis(key):
+    """Memoized run_complete_analysis keyed on the analysis key"""
+    return st.session_state.model.run_complete_analysis(*_objects_from_key(key))
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_batch_analysis(key, parameter_name, parameter_values):
+    """Memoized run_batch_analysis keyed on the analysis key"""
+    return st.session_state.model.run_batch_analysis(
+        *_objects_from_key(key), parameter_name, parameter_values)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_frequency_sweep(key, exhaust_lengths):
+    """Memoized calculate_operating_frequency_vec keyed on the analysis key"""
+    geom_tuple, _, cond_tuple = key
+    return st.session_state.model.calculate_operating_frequency_vec(
+        EngineGeometry(*geom_tuple), OperatingConditions(*cond_tuple), exhaust_lengths)
+
+# Plot figures are cached as serialized JSON so a rerun with unchanged inputs
+# skips both the sweep and Plotly's figure construction/serialization. Sweep
+# data is float32: plenty for plotting and half the payload to the browser.
+@st.cache_data(show_spinner=False, max_entries=256)
+def _frequency_figure_json(key, current_frequency):
+    """Frequency vs exhaust length figure as Plotly JSON"""
+    geometry = EngineGeometry(*key[0])
+    exhaust_lengths = np.linspace(20, 200, 50, dtype=np.float32)
+    frequencies = _cached_frequency_sweep(key, exhaust_lengths).astype(np.float32)
+    
+    fig_freq = go.Figure()
+    fig_freq.add_trace(go.Scatter(
+        x=exhaust_lengths, y=frequencies, 
+        mode='lines', name='Frequency',
+        line=dict(color='#FF4B4B', width=3)
+    ))
+    fig_freq.add_trace(go.Scatter(
+        x=[geometry.exhaust_length], y=[current_frequency], 
+        mode='markers', marker=dict(size=12, color='red'), 
+        name='Current Design'
+    ))
+    fig_freq.update_layout(
+        title="Operating Frequency vs Exhaust Length",
+        xaxis_title="Exhaust Length (cm)",
+        yaxis_title="Frequency (Hz)",
+        template=_PLOT_TEMPLATE
+    )
+    return fig_freq.to_json()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _thrust_figure_json(key, current_thrust):
+    """Thrust vs combustion chamber diameter figure as Plotly JSON"""
+    geometry = EngineGeometry(*key[0])
+    diameters = np.linspace(5, 30, 20, dtype=np.float32)
+    thrust_values = _cached_batch_analysis(
+        key, 'combustion_chamber_diameter', diameters)['thrust'].astype(np.float32)
+    
+    fig_thrust = go.Figure()
+    fig_thrust.add_trace(go.Scatter(
+        x=diameters, y=thrust_values, 
+        mode='lines', name='Thrust',
+        line=dict(color='#00D4AA', width=3)
+    ))
+    fig_thrust.add_trace(go.Scatter(
+        x=[geometry.combustion_chamber_diameter], y=[current_thrust], 
+        mode='markers', marker=dict(size=12, color='green'), 
+        name='Current Design'
+    ))
+    fig_thrust.update_layout(
+        title="Thrust vs Combustion Chamber Diameter",
+        xaxis_title="Chamber Diameter (cm)",
+        yaxis_title="Thrust (N)",
+        template=_PLOT_TEMPLATE
+    )
+    return fig_thrust.to_json()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _efficiency_figure_json(key, current_efficiency):
+    """Thermal efficiency vs air-fuel ratio figure as Plotly JSON"""
+    conditions = OperatingConditions(*key[2])
+    afr_range = np.linspace(10, 20, 20, dtype=np.float32)
+    efficiency_values = _cached_batch_analysis(
+        key, 'air_fuel_ratio', afr_range)['thermal_efficiency'].astype(np.float32)
+    
+    fig_eff = go.Figure()
+    fig_eff.add_trace(go.Scatter(
+        x=afr_range, y=efficiency_values, 
+        mode='lines', name='Thermal Efficiency',
+        line=dict(color='#FFC107', width=3)
+    ))
+    fig_eff.add_trace(go.Scatter(
+        x=[conditions.air_fuel_ratio], y=[current_efficiency], 
+        mode='markers', marker=dict(size=12, color='orange'), 
+        name='Current Design'
+    ))
+    fig_eff.update_layout(
+        title="Thermal Efficiency vs Air-Fuel Ratio",
+        xaxis_title="Air-Fuel Ratio",
+        yaxis_title="Thermal Efficiency (%)",
+        template=_PLOT_TEMPLATE
+    )
+    return fig_eff.to_json()
 
 def create_sidebar_inputs():
     """Create sidebar input controls"""
@@ -142,12 +326,12 @@ def create_sidebar_inputs():
     # Configuration selector
     if sample_configs:
         st.sidebar.markdown("### 📁 Load Sample Design")
-        config_names = ["Custom"] + [config['name'] for config in sample_configs]
+        config_names = ["Custom"] + list(sample_configs)
         selected_config = st.sidebar.selectbox("Sample Configurations", config_names)
         
         if selected_config != "Custom":
             # Load selected configuration
-            config = next(c for c in sample_configs if c['name'] == selected_config)
+            config = sample_configs[selected_config]
             st.sidebar.info(f"Loaded: {config['description']}")
             
             # Set default values from configuration
@@ -157,70 +341,76 @@ def create_sidebar_inputs():
     else:
         default_values = None
     
+    # Design parameters live in a form so slider edits are applied together
+    # on submit instead of triggering a full rerun per change
+    form = st.sidebar.form("design_params")
+    
     # Engine geometry section
-    st.sidebar.markdown("### 🔧 Engine Geometry")
+    form.markdown("### 🔧 Engine Geometry")
     
     # Get default values or use standard defaults
     if default_values:
         geom = default_values['geometry']
-        combustion_chamber_length = st.sidebar.slider(
+        combustion_chamber_length = form.slider(
             "Combustion Chamber Length (cm)", 10, 100, geom['combustion_chamber_length']
         )
-        combustion_chamber_diameter = st.sidebar.slider(
+        combustion_chamber_diameter = form.slider(
             "Combustion Chamber Diameter (cm)", 5, 30, geom['combustion_chamber_diameter']
         )
-        intake_diameter = st.sidebar.slider(
+        intake_diameter = form.slider(
             "Intake Diameter (cm)", 2, 15, geom['intake_diameter']
         )
-        exhaust_diameter = st.sidebar.slider(
+        exhaust_diameter = form.slider(
             "Exhaust Diameter (cm)", 3, 20, geom['exhaust_diameter']
         )
-        exhaust_length = st.sidebar.slider(
+        exhaust_length = form.slider(
             "Exhaust Length (cm)", 20, 200, geom['exhaust_length']
         )
     else:
-        combustion_chamber_length = st.sidebar.slider("Combustion Chamber Length (cm)", 10, 100, 40)
-        combustion_chamber_diameter = st.sidebar.slider("Combustion Chamber Diameter (cm)", 5, 30, 16)
-        intake_diameter = st.sidebar.slider("Intake Diameter (cm)", 2, 15, 9)
-        exhaust_diameter = st.sidebar.slider("Exhaust Diameter (cm)", 3, 20, 7)
-        exhaust_length = st.sidebar.slider("Exhaust Length (cm)", 20, 200, 83)
+        combustion_chamber_length = form.slider("Combustion Chamber Length (cm)", 10, 100, 40)
+        combustion_chamber_diameter = form.slider("Combustion Chamber Diameter (cm)", 5, 30, 16)
+        intake_diameter = form.slider("Intake Diameter (cm)", 2, 15, 9)
+        exhaust_diameter = form.slider("Exhaust Diameter (cm)", 3, 20, 7)
+        exhaust_length = form.slider("Exhaust Length (cm)", 20, 200, 83)
     
     # Valve system section
-    st.sidebar.markdown("### ⚙️ Valve System")
+    form.markdown("### ⚙️ Valve System")
     
     if default_values:
         valve_defaults = default_values['valves']
-        valve_type = st.sidebar.selectbox(
-            "Valve Type", ["Reed Valves", "Flapper Valves", "Rotary Valves"], 
-            index=["Reed Valves", "Flapper Valves", "Rotary Valves"].index(valve_defaults['valve_type'])
+        valve_type = form.selectbox(
+            "Valve Type", VALVE_TYPES, 
+            index=_VALVE_IDX[valve_defaults['valve_type']]
         )
-        num_valves = st.sidebar.slider("Number of Valves", 1, 12, valve_defaults['num_valves'])
-        valve_area = st.sidebar.slider("Total Valve Area (cm²)", 5, 50, valve_defaults['valve_area'])
+        num_valves = form.slider("Number of Valves", 1, 12, valve_defaults['num_valves'])
+        valve_area = form.slider("Total Valve Area (cm²)", 5, 50, valve_defaults['valve_area'])
     else:
-        valve_type = st.sidebar.selectbox("Valve Type", ["Reed Valves", "Flapper Valves", "Rotary Valves"])
-        num_valves = st.sidebar.slider("Number of Valves", 1, 12, 4)
-        valve_area = st.sidebar.slider("Total Valve Area (cm²)", 5, 50, 20)
+        valve_type = form.selectbox("Valve Type", VALVE_TYPES)
+        num_valves = form.slider("Number of Valves", 1, 12, 4)
+        valve_area = form.slider("Total Valve Area (cm²)", 5, 50, 20)
     
     # Operating conditions section
-    st.sidebar.markdown("### 🌡️ Operating Conditions")
+    form.markdown("### 🌡️ Operating Conditions")
     
     if default_values:
         op_defaults = default_values['operating']
-        fuel_type = st.sidebar.selectbox(
-            "Fuel Type", ["Gasoline", "Propane", "Hydrogen", "Kerosene"],
-            index=["Gasoline", "Propane", "Hydrogen", "Kerosene"].index(op_defaults['fuel_type'])
+        fuel_type = form.selectbox(
+            "Fuel Type", FUEL_TYPES,
+            index=_FUEL_IDX[op_defaults['fuel_type']]
         )
         # FIX: Convert to float to match step parameter
-        air_fuel_ratio = st.sidebar.slider("Air-Fuel Ratio", 10.0, 20.0, float(op_defaults['air_fuel_ratio']), 0.1)
+        air_fuel_ratio = form.slider("Air-Fuel Ratio", 10.0, 20.0, float(op_defaults['air_fuel_ratio']), 0.1)
         # FIX: Convert to float to match step parameter  
-        ambient_pressure = st.sidebar.slider("Ambient Pressure (kPa)", 80.0, 120.0, float(op_defaults['ambient_pressure']), 0.1)
-        ambient_temp = st.sidebar.slider("Ambient Temperature (°C)", -20, 50, op_defaults['ambient_temp'])
+        ambient_pressure = form.slider("Ambient Pressure (kPa)", 80.0, 120.0, float(op_defaults['ambient_pressure']), 0.1)
+        ambient_temp = form.slider("Ambient Temperature (°C)", -20, 50, op_defaults['ambient_temp'])
     else:
-        fuel_type = st.sidebar.selectbox("Fuel Type", ["Gasoline", "Propane", "Hydrogen", "Kerosene"])
+        fuel_type = form.selectbox("Fuel Type", FUEL_TYPES)
         # FIX: All parameters should be float when using float step
-        air_fuel_ratio = st.sidebar.slider("Air-Fuel Ratio", 10.0, 20.0, 14.7, 0.1)
-        ambient_pressure = st.sidebar.slider("Ambient Pressure (kPa)", 80.0, 120.0, 101.3, 0.1)
-        ambient_temp = st.sidebar.slider("Ambient Temperature (°C)", -20, 50, 20)
+        air_fuel_ratio = form.slider("Air-Fuel Ratio", 10.0, 20.0, 14.7, 0.1)
+        ambient_pressure = form.slider("Ambient Pressure (kPa)", 80.0, 120.0, 101.3, 0.1)
+        ambient_temp = form.slider("Ambient Temperature (°C)", -20, 50, 20)
+    
+    form.form_submit_button("Apply", use_container_width=True)
     
     return {
         'geometry': {
@@ -497,8 +687,8 @@ def create_technical_diagram(params):
     
     return fig
 
-def run_performance_analysis(params):
-    """Run complete performance analysis"""
+def run_performance_analysis(params, key):
+    """Run complete performance analysis (key is make_analysis_key(params))"""
     try:
         # Create data objects
         geometry = EngineGeometry(
@@ -523,7 +713,7 @@ def run_performance_analysis(params):
         )
         
         # Run analysis
-        results = st.session_state.model.run_complete_analysis(geometry, valves, conditions)
+        results = _cached_analysis(key)
         
         return results, geometry, valves, conditions
         
@@ -540,8 +730,8 @@ def display_performance_metrics(results):
     
     st.markdown("## 📊 Performance Results")
     
-    # Main metrics in columns
-    col1, col2, col3, col4 = st.columns(4)
+    # Headline metrics
+    col1, col2, col3 = st.columns(3)
     
     with col1:
         st.metric(
@@ -565,45 +755,19 @@ def display_performance_metrics(results):
             help="Fuel efficiency measure - higher is better"
         )
     
-    with col4:
-        st.metric(
-            "Power Output", 
-            f"{results.power:.1f} kW",
-            help="Estimated power output of the engine"
-        )
-    
-    # Secondary metrics
-    col5, col6, col7, col8 = st.columns(4)
-    
-    with col5:
-        st.metric(
-            "Thermal Efficiency",
-            f"{results.thermal_efficiency:.1f}%",
-            help="Efficiency of fuel energy conversion"
-        )
-    
-    with col6:
-        st.metric(
-            "Air Mass Flow",
-            f"{results.air_mass_flow:.3f} kg/s",
-            help="Air mass flow rate through the engine"
-        )
-    
-    with col7:
-        st.metric(
-            "Fuel Mass Flow",
-            f"{results.fuel_mass_flow:.4f} kg/s",
-            help="Fuel mass flow rate"
-        )
-    
-    with col8:
-        st.metric(
-            "Exhaust Velocity",
-            f"{results.exhaust_velocity:.0f} m/s",
-            help="Exhaust gas velocity"
-        )
+    # Secondary metrics as a single table rather than one widget each
+    metrics_df = pd.DataFrame({
+        "Metric": ["Power Output", "Thermal Efficiency", "Air Mass Flow",
+                   "Fuel Mass Flow", "Exhaust Velocity"],
+        "Value": [f"{results.power:.1f}", f"{results.thermal_efficiency:.1f}",
+                  f"{results.air_mass_flow:.3f}", f"{results.fuel_mass_flow:.4f}",
+                  f"{results.exhaust_velocity:.0f}"],
+        "Unit": ["kW", "%", "kg/s", "kg/s", "m/s"]
+    })
+    st.dataframe(metrics_df, hide_index=True, use_container_width=True)
 
-def create_performance_plots(results, geometry, params):
+@_fragment
+def create_performance_plots(results, key):
     """Create performance analysis plots"""
     if results is None:
         return
@@ -614,131 +778,113 @@ def create_performance_plots(results, geometry, params):
     plot_tab1, plot_tab2, plot_tab3 = st.tabs(["Frequency Analysis", "Thrust Analysis", "Efficiency Analysis"])
     
     with plot_tab1:
-        # Frequency vs exhaust length plot
-        exhaust_lengths = np.linspace(20, 200, 50)
-        frequencies = []
-        
-        for length in exhaust_lengths:
-            # Calculate frequency for each length
-            temp_geometry = EngineGeometry(
-                combustion_chamber_length=geometry.combustion_chamber_length,
-                combustion_chamber_diameter=geometry.combustion_chamber_diameter,
-                intake_diameter=geometry.intake_diameter,
-                exhaust_diameter=geometry.exhaust_diameter,
-                exhaust_length=length
-            )
-            temp_conditions = OperatingConditions(
-                fuel_type=params['operating']['fuel_type'],
-                air_fuel_ratio=params['operating']['air_fuel_ratio'],
-                ambient_pressure=params['operating']['ambient_pressure'],
-                ambient_temp=params['operating']['ambient_temp']
-            )
-            freq = st.session_state.model.calculate_operating_frequency(temp_geometry, temp_conditions)
-            frequencies.append(freq)
-        
-        fig_freq = go.Figure()
-        fig_freq.add_trace(go.Scatter(
-            x=exhaust_lengths, y=frequencies, 
-            mode='lines', name='Frequency',
-            line=dict(color='#FF4B4B', width=3)
-        ))
-        fig_freq.add_trace(go.Scatter(
-            x=[geometry.exhaust_length], y=[results.frequency], 
-            mode='markers', marker=dict(size=12, color='red'), 
-            name='Current Design'
-        ))
-        fig_freq.update_layout(
-            title="Operating Frequency vs Exhaust Length",
-            xaxis_title="Exhaust Length (cm)",
-            yaxis_title="Frequency (Hz)",
-            template="plotly_white"
-        )
-        st.plotly_chart(fig_freq, use_container_width=True)
+        fig_json = _frequency_figure_json(key, results.frequency)
+        st.plotly_chart(go.Figure(json.loads(fig_json)), use_container_width=True)
     
     with plot_tab2:
-        # Thrust vs chamber diameter
-        diameters = np.linspace(5, 30, 20)
-        thrust_values = []
-        
-        for diameter in diameters:
-            temp_geometry = EngineGeometry(
-                combustion_chamber_length=geometry.combustion_chamber_length,
-                combustion_chamber_diameter=diameter,
-                intake_diameter=geometry.intake_diameter,
-                exhaust_diameter=geometry.exhaust_diameter,
-                exhaust_length=geometry.exhaust_length
+        fig_json = _thrust_figure_json(key, results.thrust)
+        st.plotly_chart(go.Figure(json.loads(fig_json)), use_container_width=True)
+    
+    with plot_tab3:
+        fig_json = _efficiency_figure_json(key, results.thermal_efficiency)
+        st.plotly_chart(go.Figure(json.loads(fig_json)), use_container_width=True)
+
+@_fragment
+def render_parameter_sweep_tab(geometry, valves, conditions):
+    """Parameter sweep tab (reruns on its own when its widgets change)"""
+    st.markdown("### Parameter Sensitivity Analysis")
+    
+    param_to_analyze = st.selectbox(
+        "Parameter to Analyze", 
+        ["exhaust_length", "combustion_chamber_diameter", "air_fuel_ratio", "intake_diameter"]
+    )
+    
+    if st.button("Run Parameter Sweep"):
+        with st.spinner("Running parameter sweep..."):
+            optimizer = OptimizationAnalyzer(st.session_state.model)
+            
+            # Define parameter range
+            if param_to_analyze == "exhaust_length":
+                param_range = np.linspace(20, 200, 20)
+            elif param_to_analyze == "combustion_chamber_diameter":
+                param_range = np.linspace(5, 30, 20)
+            elif param_to_analyze == "air_fuel_ratio":
+                param_range = np.linspace(10, 20, 20)
+            else:  # intake_diameter
+                param_range = np.linspace(2, 15, 20)
+            
+            sweep_results = optimizer.parameter_sweep_vec(
+                geometry, valves, conditions, param_to_analyze, param_range
             )
-            temp_valves = ValveSystem(
-                valve_type=params['valves']['valve_type'],
-                num_valves=params['valves']['num_valves'],
-                valve_area=params['valves']['valve_area']
+            
+            # Create sweep plot
+            fig_sweep = make_subplots(specs=[[{"secondary_y": True}]])
+            
+            fig_sweep.add_trace(
+                go.Scatter(x=sweep_results['parameter_values'], y=sweep_results['thrust'], 
+                         name="Thrust (N)", line=dict(color='red')), 
+                secondary_y=False
             )
-            temp_conditions = OperatingConditions(
-                fuel_type=params['operating']['fuel_type'],
-                air_fuel_ratio=params['operating']['air_fuel_ratio'],
-                ambient_pressure=params['operating']['ambient_pressure'],
-                ambient_temp=params['operating']['ambient_temp']
+            fig_sweep.add_trace(
+                go.Scatter(x=sweep_results['parameter_values'], y=sweep_results['frequency'], 
+                         name="Frequency (Hz)", line=dict(color='blue')), 
+                secondary_y=True
             )
-            temp_results = st.session_state.model.run_complete_analysis(temp_geometry, temp_valves, temp_conditions)
-            thrust_values.append(temp_results.thrust)
-        
-        fig_thrust = go.Figure()
-        fig_thrust.add_trace(go.Scatter(
-            x=diameters, y=thrust_values, 
-            mode='lines', name='Thrust',
-            line=dict(color='#00D4AA', width=3)
-        ))
-        fig_thrust.add_trace(go.Scatter(
-            x=[geometry.combustion_chamber_diameter], y=[results.thrust], 
-            mode='markers', marker=dict(size=12, color='green'), 
-            name='Current Design'
-        ))
-        fig_thrust.update_layout(
-            title="Thrust vs Combustion Chamber Diameter",
-            xaxis_title="Chamber Diameter (cm)",
-            yaxis_title="Thrust (N)",
-            template="plotly_white"
-        )
-        st.plotly_chart(fig_thrust, use_container_width=True)
-    
-    with plot_tab3:
-        # Efficiency analysis
-        afr_range = np.linspace(10, 20, 20)
-        efficiency_values = []
-        
-        for afr in afr_range:
-            temp_conditions = OperatingConditions(
-                fuel_type=params['operating']['fuel_type'],
-                air_fuel_ratio=afr,
-                ambient_pressure=params['operating']['ambient_pressure'],
-                ambient_temp=params['operating']['ambient_temp']
+            
+            fig_sweep.update_xaxes(title_text=f"{param_to_analyze.replace('_', ' ').title()}")
+            fig_sweep.update_yaxes(title_text="Thrust (N)", secondary_y=False)
+            fig_sweep.update_yaxes(title_text="Frequency (Hz)", secondary_y=True)
+            fig_sweep.update_layout(title=f"Parameter Sweep: {param_to_analyze}")
+            
+            st.plotly_chart(fig_sweep, use_container_width=True)
+
+@_fragment
+def render_export_tab(params, results, suggestions):
+    """Export tab (reruns on its own when its widgets change)"""
+    st.markdown("### Export Results")
+    
+    col_export1, col_export2 = st.columns(2)
+    
+    with col_export1:
+        if st.button("Download Results CSV"):
+            results_dict = {
+                'thrust_N': results.thrust,
+                'frequency_Hz': results.frequency,
+                'specific_impulse_s': results.specific_impulse,
+                'power_kW': results.power,
+                'thermal_efficiency_percent': results.thermal_efficiency,
+                'air_mass_flow_kg_s': results.air_mass_flow,
+                'fuel_mass_flow_kg_s': results.fuel_mass_flow,
+                'exhaust_velocity_m_s': results.exhaust_velocity,
+                'combustion_volume_L': results.combustion_volume
+            }
+            
+            csv_data = export_results_to_csv(results_dict)
+            st.download_button(
+                label="Download CSV",
+                data=csv_data,
+                file_name=f"pulse_jet_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv"
             )
-            temp_valves = ValveSystem(
-                valve_type=params['valves']['valve_type'],
-                num_valves=params['valves']['num_valves'],
-                valve_area=params['valves']['valve_area']
+    
+    with col_export2:
+        if st.button("Generate Design Report"):
+            report = generate_design_report(params['geometry'], {
+                'thrust': results.thrust,
+                'frequency': results.frequency,
+                'specific_impulse': results.specific_impulse,
+                'thermal_efficiency': results.thermal_efficiency,
+                'air_mass_flow': results.air_mass_flow,
+                'fuel_mass_flow': results.fuel_mass_flow,
+                'exhaust_velocity': results.exhaust_velocity
+            }, suggestions)
+            
+            st.download_button(
+                label="Download Report",
+                data=report,
+                file_name=f"pulse_jet_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                mime="text/markdown"
             )
-            temp_results = st.session_state.model.run_complete_analysis(geometry, temp_valves, temp_conditions)
-            efficiency_values.append(temp_results.thermal_efficiency)
-        
-        fig_eff = go.Figure()
-        fig_eff.add_trace(go.Scatter(
-            x=afr_range, y=efficiency_values, 
-            mode='lines', name='Thermal Efficiency',
-            line=dict(color='#FFC107', width=3)
-        ))
-        fig_eff.add_trace(go.Scatter(
-            x=[params['operating']['air_fuel_ratio']], y=[results.thermal_efficiency], 
-            mode='markers', marker=dict(size=12, color='orange'), 
-            name='Current Design'
-        ))
-        fig_eff.update_layout(
-            title="Thermal Efficiency vs Air-Fuel Ratio",
-            xaxis_title="Air-Fuel Ratio",
-            yaxis_title="Thermal Efficiency (%)",
-            template="plotly_white"
-        )
-        st.plotly_chart(fig_eff, use_container_width=True)
 
 def create_design_summary(results, geometry, params):
     """Create design summary sidebar"""
@@ -832,8 +978,9 @@ def main():
     st.markdown("---")
     
     # Run performance analysis
+    analysis_key = make_analysis_key(params)
     with st.spinner("Running performance analysis..."):
-        results, geometry, valves, conditions = run_performance_analysis(params)
+        results, geometry, valves, conditions = run_performance_analysis(params, analysis_key)
     
     if results is None:
         st.error("Failed to complete analysis. Please check your parameters.")
@@ -843,7 +990,7 @@ def main():
     display_performance_metrics(results)
     
     # Create performance plots
-    create_performance_plots(results, geometry, params)
+    create_performance_plots(results, analysis_key)
     
     # Design summary in sidebar
     create_design_summary(results, geometry, params)
@@ -855,51 +1002,7 @@ def main():
     ])
     
     with analysis_tab1:
-        st.markdown("### Parameter Sensitivity Analysis")
-        
-        param_to_analyze = st.selectbox(
-            "Parameter to Analyze", 
-            ["exhaust_length", "combustion_chamber_diameter", "air_fuel_ratio", "intake_diameter"]
-        )
-        
-        if st.button("Run Parameter Sweep"):
-            with st.spinner("Running parameter sweep..."):
-                optimizer = OptimizationAnalyzer(st.session_state.model)
-                
-                # Define parameter range
-                if param_to_analyze == "exhaust_length":
-                    param_range = np.linspace(20, 200, 20)
-                elif param_to_analyze == "combustion_chamber_diameter":
-                    param_range = np.linspace(5, 30, 20)
-                elif param_to_analyze == "air_fuel_ratio":
-                    param_range = np.linspace(10, 20, 20)
-                else:  # intake_diameter
-                    param_range = np.linspace(2, 15, 20)
-                
-                sweep_results = optimizer.parameter_sweep(
-                    geometry, valves, conditions, param_to_analyze, param_range
-                )
-                
-                # Create sweep plot
-                fig_sweep = make_subplots(specs=[[{"secondary_y": True}]])
-                
-                fig_sweep.add_trace(
-                    go.Scatter(x=sweep_results['parameter_values'], y=sweep_results['thrust'], 
-                             name="Thrust (N)", line=dict(color='red')), 
-                    secondary_y=False
-                )
-                fig_sweep.add_trace(
-                    go.Scatter(x=sweep_results['parameter_values'], y=sweep_results['frequency'], 
-                             name="Frequency (Hz)", line=dict(color='blue')), 
-                    secondary_y=True
-                )
-                
-                fig_sweep.update_xaxes(title_text=f"{param_to_analyze.replace('_', ' ').title()}")
-                fig_sweep.update_yaxes(title_text="Thrust (N)", secondary_y=False)
-                fig_sweep.update_yaxes(title_text="Frequency (Hz)", secondary_y=True)
-                fig_sweep.update_layout(title=f"Parameter Sweep: {param_to_analyze}")
-                
-                st.plotly_chart(fig_sweep, use_container_width=True)
+        render_parameter_sweep_tab(geometry, valves, conditions)
     
     with analysis_tab2:
         st.markdown("### Design Optimization Suggestions")
@@ -916,27 +1019,7 @@ def main():
         
         # Trade-offs analysis
         st.markdown("### Design Trade-offs")
-        tradeoff_data = {
-            "Design Aspect": [
-                "Exhaust Length",
-                "Chamber Diameter", 
-                "Intake Area",
-                "Operating Frequency"
-            ],
-            "Increase Benefits": [
-                "Lower frequency, better resonance",
-                "Higher thrust, more fuel flow",
-                "Better breathing, higher mass flow",
-                "Higher power density"
-            ],
-            "Increase Drawbacks": [
-                "Heavier, more complex mounting",
-                "Heavier, higher fuel consumption",
-                "Larger frontal area, more drag",
-                "Higher stress, shorter life"
-            ]
-        }
-        st.dataframe(pd.DataFrame(tradeoff_data), use_container_width=True)
+        st.dataframe(_TRADEOFF_DF, use_container_width=True)
     
     with analysis_tab3:
         st.markdown("### Configuration Management")
@@ -969,67 +1052,11 @@ def main():
             st.info("Load functionality available in full deployment")
     
     with analysis_tab4:
-        st.markdown("### Export Results")
-        
-        col_export1, col_export2 = st.columns(2)
-        
-        with col_export1:
-            if st.button("Download Results CSV"):
-                results_dict = {
-                    'thrust_N': results.thrust,
-                    'frequency_Hz': results.frequency,
-                    'specific_impulse_s': results.specific_impulse,
-                    'power_kW': results.power,
-                    'thermal_efficiency_percent': results.thermal_efficiency,
-                    'air_mass_flow_kg_s': results.air_mass_flow,
-                    'fuel_mass_flow_kg_s': results.fuel_mass_flow,
-                    'exhaust_velocity_m_s': results.exhaust_velocity,
-                    'combustion_volume_L': results.combustion_volume
-                }
-                
-                csv_data = export_results_to_csv(results_dict)
-                st.download_button(
-                    label="Download CSV",
-                    data=csv_data,
-                    file_name=f"pulse_jet_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-        
-        with col_export2:
-            if st.button("Generate Design Report"):
-                report = generate_design_report(params['geometry'], {
-                    'thrust': results.thrust,
-                    'frequency': results.frequency,
-                    'specific_impulse': results.specific_impulse,
-                    'thermal_efficiency': results.thermal_efficiency,
-                    'air_mass_flow': results.air_mass_flow,
-                    'fuel_mass_flow': results.fuel_mass_flow,
-                    'exhaust_velocity': results.exhaust_velocity
-                }, suggestions if 'suggestions' in locals() else {})
-                
-                st.download_button(
-                    label="Download Report",
-                    data=report,
-                    file_name=f"pulse_jet_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                    mime="text/markdown"
-                )
+        render_export_tab(params, results, suggestions)
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; font-size: 0.9em;">
-    <p><strong>⚠️ Important Disclaimer:</strong> This is a simplified model for educational and preliminary design purposes. 
-    Actual pulse jet performance depends on many additional factors including combustion dynamics, 
-    heat transfer, materials, and manufacturing tolerances. Always consult detailed engineering 
-    analysis and testing for final designs.</p>
-    
-    <p>🔬 <strong>Model Accuracy:</strong> Results are order-of-magnitude estimates. Use for comparative analysis and design trends.</p>
-    
-    <p>🚀 <strong>Version:</strong> Pulse Jet Modeler v1.0.0 | 
-    <a href="https://github.com/your-username/pulse-jet-modeler" target="_blank">GitHub</a> | 
-    <a href="https://github.com/your-username/pulse-jet-modeler/issues" target="_blank">Report Issues</a></p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 def run_app():
     """Entry point for running the application"""
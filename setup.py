@@ -7,40 +7,52 @@ This package provides physics-based models for performance prediction, optimizat
 and validation utilities for pulse jet engines.
 """
 
-import os
+import json
+import re
 import sys
 from pathlib import Path
-from setuptools import setup, find_packages
+from setuptools import Extension, setup
 
 # Ensure we're using Python 3.8+
 if sys.version_info < (3, 8):
     raise RuntimeError("This package requires Python 3.8 or later")
 
+# Project root, resolved once for all file helpers
+_HERE = Path(__file__).resolve().parent
+
+# Cache of file contents keyed by (path, mtime_ns), so repeated reads of the
+# same file within one interpreter (metadata, wheel, sdist) hit memory
+_FILE_CACHE = {}
+
+# Matched against raw bytes: the version line is ASCII, so the file is
+# never decoded
+_VERSION_RE = re.compile(rb'''^__version__\s*=\s*['"]([^'"]+)['"]''', re.M)
+
 # Read the contents of README file
 def read_file(filename):
     """Read contents of a file"""
-    here = Path(__file__).parent
+    path = _HERE / filename
     try:
-        with open(here / filename, 'r', encoding='utf-8') as f:
-            return f.read()
+        key = (str(path), path.stat().st_mtime_ns)
     except FileNotFoundError:
         return ""
-
-# Get long description from README
-long_description = read_file('README.md')
+    if key not in _FILE_CACHE:
+        # Unbuffered raw read: FileIO sizes it from fstat, so even a large
+        # README comes back in a single read() instead of 8 KiB chunks
+        with open(path, 'rb', buffering=0) as f:
+            _FILE_CACHE[key] = f.read().decode('utf-8')
+    return _FILE_CACHE[key]
 
 # Get version from package
 def get_version():
     """Get version from package __init__.py"""
-    here = Path(__file__).parent
-    version_file = here / 'src' / '__init__.py'
-    
-    if version_file.exists():
-        with open(version_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.startswith('__version__'):
-                    # Extract version string
-                    return line.split('=')[1].strip().strip('"').strip("'")
+    version_file = _HERE / 'src' / '__init__.py'
+    try:
+        match = _VERSION_RE.search(version_file.read_bytes())
+    except FileNotFoundError:
+        match = None
+    if match:
+        return match.group(1).decode()
     
     # Fallback version
     return "1.0.0"
@@ -48,21 +60,12 @@ def get_version():
 # Read requirements from requirements.txt
 def get_requirements():
     """Get requirements from requirements.txt"""
-    requirements = []
-    req_file = Path(__file__).parent / 'requirements.txt'
-    
-    if req_file.exists():
-        with open(req_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith('#'):
-                    requirements.append(line)
-    
-    return requirements
+    # Strip full-line and trailing comments, then skip empty lines
+    lines = (line.partition('#')[0].strip() for line in read_file('requirements.txt').splitlines())
+    return [line for line in lines if line]
 
 # Development requirements
-dev_requirements = [
+dev_requirements = (
     'pytest>=7.0.0',
     'pytest-cov>=4.0.0',
     'black>=22.0.0',
@@ -72,28 +75,96 @@ dev_requirements = [
     'sphinx>=5.0.0',
     'sphinx-rtd-theme>=1.0.0',
     'twine>=4.0.0'
-]
+)
 
 # Documentation requirements
-docs_requirements = [
+docs_requirements = (
     'sphinx>=5.0.0',
     'sphinx-rtd-theme>=1.0.0',
     'myst-parser>=0.18.0',
     'sphinx-autoapi>=2.0.0'
-]
+)
 
 # Testing requirements
-test_requirements = [
+test_requirements = (
     'pytest>=7.0.0',
     'pytest-cov>=4.0.0',
     'pytest-mock>=3.8.0',
     'hypothesis>=6.0.0'
-]
+)
+
+# Optional accelerators, each with a pure-Python fallback
+performance_requirements = (
+    'numba>=0.57.0',
+    'orjson>=3.9.0'
+)
+
+# Union of the extras above, deduplicated in first-seen order
+all_requirements = tuple(dict.fromkeys(dev_requirements + docs_requirements + test_requirements
+                                       + performance_requirements))
+
+# Metadata parsed from files on disk is cached under build/, keyed by the
+# files' mtimes, so the repeated setup.py runs of one pip install reuse it
+_METADATA_SOURCES = ('README.md', 'requirements.txt', 'src/__init__.py')
+_METADATA_CACHE = _HERE / 'build' / '.setup_metadata.json'
+
+def _source_mtimes():
+    """Modification times (ns) of the metadata source files, None if missing"""
+    mtimes = []
+    for filename in _METADATA_SOURCES:
+        try:
+            mtimes.append((_HERE / filename).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return mtimes
+
+def get_metadata():
+    """Get version, long description and requirements, cached across runs"""
+    key = _source_mtimes()
+    try:
+        cached = json.loads(_METADATA_CACHE.read_text(encoding='utf-8'))
+        if cached.get('key') == key:
+            return cached['metadata']
+    except (OSError, ValueError):
+        pass
+    
+    metadata = {
+        'version': get_version(),
+        'long_description': read_file('README.md'),
+        'install_requires': get_requirements()
+    }
+    
+    try:
+        _METADATA_CACHE.parent.mkdir(exist_ok=True)
+        _METADATA_CACHE.write_text(json.dumps({'key': key, 'metadata': metadata}), encoding='utf-8')
+    except OSError:
+        pass  # Read-only source tree: run uncached
+    
+    return metadata
+
+metadata = get_metadata()
+
+# Optional C build of the analysis kernel, for installs without numba. It is
+# only compiled when Cython is present, and marked optional so a missing or
+# failing C compiler skips it instead of aborting the install; the package
+# then falls back to the numba or pure-Python kernel at runtime.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension('src._pulse_jet_kernel', ['src/_pulse_jet_kernel.pyx'])],
+        compiler_directives={'language_level': 3}
+    )
+    # cythonize rebuilds the Extension objects without the optional flag,
+    # so it is set on the returned ones
+    for extension in ext_modules:
+        extension.optional = True
+except ImportError:
+    ext_modules = []
 
 setup(
     # Basic package information
     name="pulse-jet-modeler",
-    version=get_version(),
+    version=metadata['version'],
     author="Pulse Jet Modeler Contributors",
     author_email="contributors@pulse-jet-modeler.org",
     maintainer="Pulse Jet Modeler Team",
@@ -101,7 +172,7 @@ setup(
     
     # Description
     description="A Streamlit app for pulse jet engine design and performance modeling",
-    long_description=long_description,
+    long_description=metadata['long_description'],
     long_description_content_type="text/markdown",
     
     # URLs
@@ -115,14 +186,16 @@ setup(
         "Changelog": "https://github.com/your-username/pulse-jet-modeler/blob/main/CHANGELOG.md"
     },
     
-    # Package discovery
-    packages=find_packages(include=['src', 'src.*']),
+    # Packages are listed explicitly: src has no subpackages, so there is
+    # nothing for find_packages() to discover beyond a walk of the tree
+    packages=['src'],
     package_dir={'': '.'},
+    ext_modules=ext_modules,
     
     # Include non-Python files
     include_package_data=True,
     package_data={
-        'src': ['*.yaml', '*.json'],
+        'src': ['*.yaml', '*.json', '*.pyx'],
         '': [
             'data/*.json',
             'config.yaml',
@@ -134,14 +207,15 @@ setup(
     
     # Requirements
     python_requires=">=3.8",
-    install_requires=get_requirements(),
+    install_requires=metadata['install_requires'],
     
     # Optional dependencies
     extras_require={
         'dev': dev_requirements,
         'docs': docs_requirements,
         'test': test_requirements,
-        'all': dev_requirements + docs_requirements + test_requirements
+        'performance': performance_requirements,
+        'all': all_requirements
     },
     
     # Entry points for command-line scripts
@@ -225,7 +299,6 @@ setup(
 def post_install():
     """Perform post-installation setup"""
     import os
-    from pathlib import Path
     
     # Create necessary directories
     directories = [
@@ -237,12 +310,11 @@ def post_install():
     ]
     
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
         
-        # Create .gitkeep files for empty directories
-        gitkeep_file = Path(directory) / '.gitkeep'
-        if not gitkeep_file.exists():
-            gitkeep_file.touch()
+        # Create .gitkeep files for empty directories ('a' creates if missing
+        # and never truncates, so no exists() check is needed)
+        open(os.path.join(directory, '.gitkeep'), 'a').close()
     
     print("✅ Post-installation setup completed!")
     print("📁 Created necessary directories")
@@ -256,7 +328,6 @@ class DevelopmentSetup:
     def setup_dev_environment():
         """Set up development environment"""
         import subprocess
-        import sys
         
         try:
             # Install development dependencies
@@ -282,9 +353,6 @@ class DataSetup:
     @staticmethod
     def setup_sample_data():
         """Set up sample data and configurations"""
-        import json
-        from pathlib import Path
-        
         # Create sample fuel properties if not exists
         fuel_properties_file = Path('data/fuel_properties.json')
         if not fuel_properties_file.exists():
@@ -305,8 +373,7 @@ class DataSetup:
                 }
             }
             
-            with open(fuel_properties_file, 'w') as f:
-                json.dump(sample_fuel_data, f, indent=2)
+            fuel_properties_file.write_text(json.dumps(sample_fuel_data, indent=2))
         
         print("✅ Sample data setup completed!")
 
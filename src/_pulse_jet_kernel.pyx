@@ -0,0 +1,113 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled analysis kernel for Pulse Jet Modeler
+
+Optional C build of pulse_jet_models._analysis_kernel for environments
+without numba. It has the same signature and return tuple, and
+pulse_jet_models prefers it when it has been built (requires Cython at
+install time).
+"""
+
+from libc.math cimport sqrt, M_PI, INFINITY
+
+
+cdef double _INV_TWO_PI = 1.0 / (2.0 * M_PI)
+cdef double _HELMHOLTZ_UNIT_FACTOR = 10.0
+
+# Unit conversion factors (as in pulse_jet_models)
+cdef double _KPA_TO_PA = 1e3
+cdef double _KJ_TO_J = 1e3
+cdef double _W_TO_KW = 1e-3
+cdef double _CM2_TO_M2 = 1e-4
+cdef double _PER_S_TO_PER_H = 3600.0
+
+
+cdef inline double _helmholtz_frequency(double sound_speed, double volume_l,
+                                        double neck_area_cm2, double neck_length_cm):
+    """Helmholtz resonator frequency in Hz (volume in L, neck area in cm², length in cm)"""
+    if volume_l > 0 and neck_length_cm > 0:
+        return sound_speed * _INV_TWO_PI * sqrt(
+            _HELMHOLTZ_UNIT_FACTOR * neck_area_cm2 / (volume_l * neck_length_cm))
+    return 0.0
+
+
+def run_analysis(double combustion_volume, double exhaust_area, double intake_diameter,
+                 double exhaust_diameter, double exhaust_length, double valve_area,
+                 double air_fuel_ratio, double ambient_pressure, double ambient_temp,
+                 double heating_value, double R, double gamma, double g,
+                 double combustion_efficiency, double valve_discharge_coeff,
+                 double exhaust_efficiency, double end_correction_factor,
+                 double mixing_efficiency, double heat_transfer_factor):
+    """
+    Whole scalar analysis chain in one call (see pulse_jet_models._analysis_kernel)
+
+    Returns (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+    specific_impulse, propulsive_power, thermal_efficiency, specific_fuel_consumption).
+    Callers must pass an ambient temperature above absolute zero.
+    """
+    cdef double temp_kelvin = ambient_temp + 273.15
+    cdef double sound_speed, total_neck_length, frequency
+    cdef double pressure_pa, air_density, effective_valve_area, characteristic_velocity
+    cdef double duty_cycle, volumetric_flow, air_mass_flow, fuel_mass_flow
+    cdef double energy_release_rate, net_energy_rate, adiabatic_flame_temp, total_mass_flow
+    cdef double specific_energy, exhaust_velocity
+    cdef double pressure_ratio, thrust, specific_impulse
+    cdef double propulsive_power, fuel_power, thermal_efficiency, sfc
+
+    # Operating frequency
+    sound_speed = sqrt(gamma * R * temp_kelvin)
+    total_neck_length = (exhaust_length + end_correction_factor * exhaust_diameter +
+                         end_correction_factor * intake_diameter)  # cm
+    frequency = _helmholtz_frequency(sound_speed, combustion_volume, exhaust_area, total_neck_length)
+
+    # Mass flows
+    pressure_pa = ambient_pressure * _KPA_TO_PA
+    air_density = pressure_pa / (R * temp_kelvin)
+    effective_valve_area = valve_area * valve_discharge_coeff * _CM2_TO_M2
+    characteristic_velocity = sqrt(2 * pressure_pa / air_density)
+    if frequency > 0:
+        duty_cycle = min(0.4, 50 / frequency)
+    else:
+        duty_cycle = 0.3
+    volumetric_flow = effective_valve_area * characteristic_velocity * duty_cycle
+    air_mass_flow = air_density * volumetric_flow * mixing_efficiency
+    fuel_mass_flow = air_mass_flow / air_fuel_ratio
+
+    # Combustion
+    energy_release_rate = fuel_mass_flow * heating_value * _KJ_TO_J
+    net_energy_rate = energy_release_rate * combustion_efficiency * heat_transfer_factor
+    adiabatic_flame_temp = 2200 + ambient_temp
+    total_mass_flow = air_mass_flow + fuel_mass_flow
+
+    # Exhaust velocity
+    if total_mass_flow > 0:
+        specific_energy = net_energy_rate / total_mass_flow
+    else:
+        specific_energy = 0.0
+    # Capped at 0.8x the flame-temperature sound speed (squared form, one sqrt)
+    exhaust_velocity = sqrt(min(2 * specific_energy * exhaust_efficiency,
+                                gamma * R * adiabatic_flame_temp * 0.64))
+
+    # Thrust: momentum plus pressure thrust, clipped at zero
+    pressure_ratio = min(1.2, exhaust_velocity / 300)
+    thrust = max(0.0, total_mass_flow * exhaust_velocity +
+                 pressure_pa * (pressure_ratio - 1) * (exhaust_area * _CM2_TO_M2))
+
+    # Performance metrics
+    if fuel_mass_flow > 0:
+        specific_impulse = thrust / (fuel_mass_flow * g)
+    else:
+        specific_impulse = 0.0
+    propulsive_power = 0.5 * total_mass_flow * exhaust_velocity * exhaust_velocity * _W_TO_KW * 0.5
+    fuel_power = energy_release_rate * _W_TO_KW
+    if fuel_power > 0:
+        thermal_efficiency = (propulsive_power / fuel_power) * 100
+    else:
+        thermal_efficiency = 0.0
+    if propulsive_power > 0:
+        sfc = fuel_mass_flow * _PER_S_TO_PER_H / propulsive_power
+    else:
+        sfc = INFINITY
+
+    return (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+            specific_impulse, propulsive_power, thermal_efficiency, sfc)
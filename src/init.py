@@ -72,36 +72,52 @@ __maintainer__ = "Pulse Jet Modeler Team"
 __url__ = "https://github.com/your-username/pulse-jet-modeler"
 __description__ = "A comprehensive tool for pulse jet engine design and performance modeling"
 
-# Import main classes and functions for easy access
-from .pulse_jet_models import (
-    PulseJetModel,
-    EngineGeometry,
-    ValveSystem,
-    OperatingConditions,
-    PerformanceResults,
-    OptimizationAnalyzer
-)
-
-from .utils import (
-    load_config,
-    load_fuel_properties,
-    save_configuration,
-    load_configuration,
-    export_results_to_csv,
-    format_parameter_value,
-    calculate_design_score,
-    generate_design_report,
-    create_comparison_table
-)
-
-from .validators import (
-    validate_geometry_parameters,
-    validate_valve_parameters,
-    validate_operating_conditions,
-    validate_all_parameters,
-    show_validation_results,
-    sanitize_input
-)
+import importlib
+import importlib.util
+
+# Main classes and functions are loaded lazily (PEP 562) so that importing the
+# package, e.g. for __version__ or the constants below, does not pull in
+# numpy, pandas, streamlit and friends until a public name is first used
+_LAZY_IMPORTS = {name: '.pulse_jet_models' for name in (
+    'PulseJetModel',
+    'EngineGeometry',
+    'ValveSystem',
+    'OperatingConditions',
+    'PerformanceResults',
+    'OptimizationAnalyzer'
+)}
+
+_LAZY_IMPORTS.update({name: '.utils' for name in (
+    'load_config',
+    'load_fuel_properties',
+    'save_configuration',
+    'load_configuration',
+    'export_results_to_csv',
+    'format_parameter_value',
+    'calculate_design_score',
+    'generate_design_report',
+    'create_comparison_table'
+)})
+
+_LAZY_IMPORTS.update({name: '.validators' for name in (
+    'validate_geometry_parameters',
+    'validate_valve_parameters',
+    'validate_operating_conditions',
+    'validate_all_parameters',
+    'show_validation_results',
+    'sanitize_input'
+)})
+
+def __getattr__(name):
+    """Import lazily exported names from their submodule on first access"""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value  # Later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 # Define what gets imported with "from src import *"
 __all__ = [
@@ -150,21 +166,34 @@ SUPPORTED_FUELS = ["Gasoline", "Propane", "Hydrogen", "Kerosene"]
 # Supported valve types
 SUPPORTED_VALVE_TYPES = ["Reed Valves", "Flapper Valves", "Rotary Valves"]
 
-# Physical constants used throughout the package
+# Physical constants used throughout the package, as bare floats so hot code
+# reads them with a plain global lookup instead of a dict key hash
+R_AIR = 287.0  # Specific gas constant for air (J/kg·K)
+GAMMA = 1.4  # Heat capacity ratio for air
+G = 9.81  # Standard gravity (m/s²)
+STD_PRESSURE = 101325.0  # Standard atmospheric pressure (Pa)
+STD_TEMPERATURE = 288.15  # Standard temperature (K)
+
+# Model default parameters
+COMBUSTION_EFFICIENCY = 0.85
+VALVE_DISCHARGE_COEFFICIENT = 0.8
+EXHAUST_EFFICIENCY = 0.95
+FREQUENCY_CONSTANT = 17000.0
+
+# Dict forms of the constants above, kept for existing callers
 PHYSICAL_CONSTANTS = {
-    'R_air': 287,  # Specific gas constant for air (J/kg·K)
-    'gamma': 1.4,  # Heat capacity ratio for air
-    'g': 9.81,     # Standard gravity (m/s²)
-    'std_pressure': 101325,  # Standard atmospheric pressure (Pa)
-    'std_temperature': 288.15,  # Standard temperature (K)
+    'R_air': R_AIR,
+    'gamma': GAMMA,
+    'g': G,
+    'std_pressure': STD_PRESSURE,
+    'std_temperature': STD_TEMPERATURE,
 }
 
-# Model default parameters
 MODEL_DEFAULTS = {
-    'combustion_efficiency': 0.85,
-    'valve_discharge_coefficient': 0.8,
-    'exhaust_efficiency': 0.95,
-    'frequency_constant': 17000
+    'combustion_efficiency': COMBUSTION_EFFICIENCY,
+    'valve_discharge_coefficient': VALVE_DISCHARGE_COEFFICIENT,
+    'exhaust_efficiency': EXHAUST_EFFICIENCY,
+    'frequency_constant': FREQUENCY_CONSTANT
 }
 
 def get_version_info():
@@ -199,12 +228,10 @@ def check_dependencies():
         'scipy': False
     }
     
+    # find_spec only locates the module; nothing is imported or executed
     for dep in dependencies:
-        try:
-            __import__(dep)
-            dependencies[dep] = True
-        except ImportError:
-            dependencies[dep] = False
+        module_name = 'yaml' if dep == 'pyyaml' else dep
+        dependencies[dep] = importlib.util.find_spec(module_name) is not None
     
     return dependencies
 
@@ -231,8 +258,33 @@ def create_default_model():
     Returns:
         PulseJetModel: Configured model instance
     """
+    from .pulse_jet_models import PulseJetModel
+    
     return PulseJetModel()
 
+# Parameters of the sample engines returned by create_sample_engine
+_SAMPLE_ENGINE_PARAMS = {
+    'small': (
+        {'combustion_chamber_length': 30, 'combustion_chamber_diameter': 8,
+         'intake_diameter': 4, 'exhaust_diameter': 5, 'exhaust_length': 40},
+        {'valve_type': "Reed Valves", 'num_valves': 2, 'valve_area': 8}
+    ),
+    'medium': (
+        {'combustion_chamber_length': 50, 'combustion_chamber_diameter': 15,
+         'intake_diameter': 8, 'exhaust_diameter': 10, 'exhaust_length': 80},
+        {'valve_type': "Reed Valves", 'num_valves': 4, 'valve_area': 20}
+    ),
+    'large': (
+        {'combustion_chamber_length': 80, 'combustion_chamber_diameter': 25,
+         'intake_diameter': 12, 'exhaust_diameter': 16, 'exhaust_length': 120},
+        {'valve_type': "Reed Valves", 'num_valves': 8, 'valve_area': 40}
+    )
+}
+
+# Sample engine objects, built on first use (keeps the model import lazy).
+# The dataclasses are frozen, so the same instances are handed to every caller.
+_SAMPLE_ENGINES = {}
+
 def create_sample_engine(engine_type="medium"):
     """
     Create sample engine configurations
@@ -243,73 +295,39 @@ def create_sample_engine(engine_type="medium"):
     Returns:
         tuple: (EngineGeometry, ValveSystem, OperatingConditions)
     """
-    if engine_type == "small":
-        geometry = EngineGeometry(
-            combustion_chamber_length=30,
-            combustion_chamber_diameter=8,
-            intake_diameter=4,
-            exhaust_diameter=5,
-            exhaust_length=40
-        )
-        valves = ValveSystem(
-            valve_type="Reed Valves",
-            num_valves=2,
-            valve_area=8
-        )
-    elif engine_type == "large":
-        geometry = EngineGeometry(
-            combustion_chamber_length=80,
-            combustion_chamber_diameter=25,
-            intake_diameter=12,
-            exhaust_diameter=16,
-            exhaust_length=120
-        )
-        valves = ValveSystem(
-            valve_type="Reed Valves",
-            num_valves=8,
-            valve_area=40
-        )
-    else:  # medium (default)
-        geometry = EngineGeometry(
-            combustion_chamber_length=50,
-            combustion_chamber_diameter=15,
-            intake_diameter=8,
-            exhaust_diameter=10,
-            exhaust_length=80
-        )
-        valves = ValveSystem(
-            valve_type="Reed Valves",
-            num_valves=4,
-            valve_area=20
+    if not _SAMPLE_ENGINES:
+        from .pulse_jet_models import EngineGeometry, ValveSystem, OperatingConditions
+        
+        # Standard operating conditions
+        conditions = OperatingConditions(
+            fuel_type="Gasoline",
+            air_fuel_ratio=14.7,
+            ambient_pressure=101.3,
+            ambient_temp=20
         )
+        
+        for name, (geometry_params, valve_params) in _SAMPLE_ENGINE_PARAMS.items():
+            _SAMPLE_ENGINES[name] = (
+                EngineGeometry(**geometry_params),
+                ValveSystem(**valve_params),
+                conditions
+            )
     
-    # Standard operating conditions
-    conditions = OperatingConditions(
-        fuel_type="Gasoline",
-        air_fuel_ratio=14.7,
-        ambient_pressure=101.3,
-        ambient_temp=20
-    )
-    
-    return geometry, valves, conditions
+    return _SAMPLE_ENGINES.get(engine_type, _SAMPLE_ENGINES['medium'])
 
 # Package initialization
 def _initialize_package():
-    """Initialize package on import"""
-    import warnings
+    """Initialize package on import (set PJ_SKIP_INIT_CHECK to skip the dependency check)"""
+    import os
     
-    # Filter specific warnings if needed
-    warnings.filterwarnings('ignore', category=UserWarning, module='plotly')
+    # The plotly UserWarning filter is installed by app.py, which does the
+    # plotting, not on `import src`
+    if os.environ.get('PJ_SKIP_INIT_CHECK'):
+        return
     
-    # Check for critical dependencies
+    # Check for critical dependencies without importing them
     critical_deps = ['numpy', 'pandas', 'streamlit']
-    missing_deps = []
-    
-    for dep in critical_deps:
-        try:
-            __import__(dep)
-        except ImportError:
-            missing_deps.append(dep)
+    missing_deps = [dep for dep in critical_deps if importlib.util.find_spec(dep) is None]
     
     if missing_deps:
         raise ImportError(
@@ -352,18 +370,14 @@ consistent and reproducible results across different environments.
 
 __version__ = "1.0.0"
 
-import sys
 import os
 from pathlib import Path
 
-# Add src directory to path for imports during testing
+# Test paths (conftest.py adds SRC_DIR to sys.path for the test session)
 TEST_DIR = Path(__file__).parent
 PROJECT_ROOT = TEST_DIR.parent
 SRC_DIR = PROJECT_ROOT / 'src'
 
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
 # Test configuration
 TEST_CONFIG = {
     'tolerance': {
@@ -523,38 +537,95 @@ class TestDataGenerator:
             raise ValueError(f"Unknown parameter: {param_name}")
     
     @staticmethod
-    def generate_test_configurations(num_configs=5):
-        """Generate random test configurations"""
-        import random
+    def generate_test_configurations(num_configs=5, as_arrays=False):
+        """
+        Generate random test configurations
+        
+        All parameters are drawn in one batch per field with NumPy.
+        
+        Args:
+            num_configs (int): Number of configurations to generate
+            as_arrays (bool): Return a dict of per-field arrays instead of
+                a list of nested configuration dicts
+        
+        Returns:
+            list or dict: Configuration dicts, or arrays keyed by field name
+        """
+        import numpy as np
+        
+        rng = np.random.default_rng()
+        arrays = {
+            'combustion_chamber_length': rng.uniform(20, 100, num_configs),
+            'combustion_chamber_diameter': rng.uniform(8, 25, num_configs),
+            'intake_diameter': rng.uniform(4, 15, num_configs),
+            'exhaust_diameter': rng.uniform(5, 20, num_configs),
+            'exhaust_length': rng.uniform(30, 150, num_configs),
+            'valve_type': rng.choice(['Reed Valves', 'Flapper Valves'], num_configs),
+            'num_valves': rng.integers(2, 9, num_configs),
+            'valve_area': rng.uniform(10, 40, num_configs),
+            'fuel_type': rng.choice(['Gasoline', 'Propane'], num_configs),
+            'air_fuel_ratio': rng.uniform(12, 18, num_configs),
+            'ambient_pressure': rng.uniform(90, 110, num_configs),
+            'ambient_temp': rng.uniform(0, 40, num_configs)
+        }
+        
+        if as_arrays:
+            return arrays
         
-        configs = []
-        for i in range(num_configs):
-            config = {
+        # tolist() converts each column to Python scalars in one call
+        columns = {name: values.tolist() for name, values in arrays.items()}
+        return [
+            {
                 'geometry': {
-                    'combustion_chamber_length': random.uniform(20, 100),
-                    'combustion_chamber_diameter': random.uniform(8, 25),
-                    'intake_diameter': random.uniform(4, 15),
-                    'exhaust_diameter': random.uniform(5, 20),
-                    'exhaust_length': random.uniform(30, 150)
+                    'combustion_chamber_length': columns['combustion_chamber_length'][i],
+                    'combustion_chamber_diameter': columns['combustion_chamber_diameter'][i],
+                    'intake_diameter': columns['intake_diameter'][i],
+                    'exhaust_diameter': columns['exhaust_diameter'][i],
+                    'exhaust_length': columns['exhaust_length'][i]
                 },
                 'valves': {
-                    'valve_type': random.choice(['Reed Valves', 'Flapper Valves']),
-                    'num_valves': random.randint(2, 8),
-                    'valve_area': random.uniform(10, 40)
+                    'valve_type': columns['valve_type'][i],
+                    'num_valves': columns['num_valves'][i],
+                    'valve_area': columns['valve_area'][i]
                 },
                 'operating': {
-                    'fuel_type': random.choice(['Gasoline', 'Propane']),
-                    'air_fuel_ratio': random.uniform(12, 18),
-                    'ambient_pressure': random.uniform(90, 110),
-                    'ambient_temp': random.uniform(0, 40)
+                    'fuel_type': columns['fuel_type'][i],
+                    'air_fuel_ratio': columns['air_fuel_ratio'][i],
+                    'ambient_pressure': columns['ambient_pressure'][i],
+                    'ambient_temp': columns['ambient_temp'][i]
                 }
             }
-            configs.append(config)
-        
-        return configs
+            for i in range(num_configs)
+        ]
+
+---
 
-# Initialize test environment on import
-setup_test_environment()
+# tests/conftest.py
+"""
+Shared pytest configuration for the test package
+
+The test directories are created once per test session by an autouse
+fixture rather than on import of the tests package, so collection-only
+runs do not touch the filesystem.
+"""
+
+import sys
+
+import pytest
+
+from . import SRC_DIR, setup_test_environment, cleanup_test_environment
+
+# Add src directory to path for imports during testing
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_environment():
+    """Set up the test directories for the session and clean up afterwards"""
+    setup_test_environment()
+    yield
+    cleanup_test_environment()
 
 ---
 
@@ -582,52 +653,86 @@ Usage:
 
 __version__ = "1.0.0"
 
+import functools
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
+
+# Parse and write JSON with orjson when available. Both parsers take the raw
+# bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
 
 # Data directory path
 DATA_DIR = Path(__file__).parent
 
-def load_fuel_data(filename: str = "fuel_properties.json") -> Dict[str, Dict]:
+@functools.lru_cache(maxsize=16)
+def _resolve(filename: str) -> Optional[Path]:
+    """Path of a data file, or None if it does not exist (checked once per name)"""
+    file_path = DATA_DIR / filename
+    return file_path if file_path.is_file() else None
+
+@functools.lru_cache(maxsize=8)
+def load_fuel_data(filename: str = "fuel_properties.json") -> Mapping[str, Mapping]:
     """
     Load fuel properties from JSON file
     
+    The parsed result is cached per filename and shared between callers,
+    so it is returned as a read-only view; save_fuel_data clears the cache.
+    
     Args:
         filename (str): Name of the fuel properties file
         
     Returns:
-        dict: Fuel properties dictionary
+        Mapping: Read-only fuel properties mapping
     """
-    file_path = DATA_DIR / filename
+    file_path = _resolve(filename)
     
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
+    if file_path is None:
         # Return default fuel properties if file not found
-        return get_default_fuel_properties()
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in fuel properties file: {e}")
+        fuel_data = get_default_fuel_properties()
+    else:
+        try:
+            fuel_data = _loads(file_path.read_bytes())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in fuel properties file: {e}")
+    
+    return MappingProxyType({
+        name: MappingProxyType(props) if isinstance(props, dict) else props
+        for name, props in fuel_data.items()
+    })
 
+@functools.lru_cache(maxsize=8)
 def load_sample_configs(filename: str = "sample_configurations.json") -> List[Dict]:
     """
     Load sample configurations from JSON file
     
+    The parsed result is cached per filename and shared between callers,
+    so treat it as read-only; save_sample_configs clears the cache.
+    
     Args:
         filename (str): Name of the sample configurations file
         
     Returns:
         list: List of sample configuration dictionaries
     """
-    file_path = DATA_DIR / filename
+    file_path = _resolve(filename)
     
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            return data.get('configurations', [])
-    except FileNotFoundError:
+    if file_path is None:
         return get_default_configurations()
+    
+    try:
+        return _loads(file_path.read_bytes()).get('configurations', [])
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in sample configurations file: {e}")
 
@@ -735,8 +840,14 @@ def save_fuel_data(fuel_data: Dict[str, Dict], filename: str = "fuel_properties.
     file_path = DATA_DIR / filename
     
     try:
-        with open(file_path, 'w') as f:
-            json.dump(fuel_data, f, indent=2)
+        # dict() copies also accept the read-only views from load_fuel_data
+        file_path.write_bytes(_dumps({
+            name: dict(props) if isinstance(props, Mapping) else props
+            for name, props in fuel_data.items()
+        }))
+        _resolve.cache_clear()
+        load_fuel_data.cache_clear()
+        fuel_table.cache_clear()
         return True
     except Exception as e:
         print(f"Error saving fuel data: {e}")
@@ -757,8 +868,9 @@ def save_sample_configs(configs: List[Dict], filename: str = "sample_configurati
     
     try:
         data = {"configurations": configs}
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        file_path.write_bytes(_dumps(data))
+        _resolve.cache_clear()
+        load_sample_configs.cache_clear()
         return True
     except Exception as e:
         print(f"Error saving sample configurations: {e}")
@@ -774,17 +886,14 @@ def validate_fuel_properties(fuel_data: Dict[str, Dict]) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    required_fields = [
-        'heating_value', 'density', 'stoich_ratio', 
-        'molecular_weight', 'autoignition_temp'
-    ]
-    
     for fuel_name, properties in fuel_data.items():
-        for field in required_fields:
-            if field not in properties:
-                print(f"Missing field '{field}' for fuel '{fuel_name}'")
-                return False
-            
+        missing = REQUIRED_FUEL_PROPERTIES_SET - properties.keys()
+        if missing:
+            field = next(f for f in REQUIRED_FUEL_PROPERTIES if f in missing)
+            print(f"Missing field '{field}' for fuel '{fuel_name}'")
+            return False
+        
+        for field in REQUIRED_FUEL_PROPERTIES:
             if not isinstance(properties[field], (int, float)):
                 print(f"Invalid type for field '{field}' in fuel '{fuel_name}'")
                 return False
@@ -811,6 +920,55 @@ def get_fuel_property(fuel_type: str, property_name: str, default: Optional[floa
     
     return default
 
+@functools.lru_cache(maxsize=8)
+def fuel_table(filename: str = "fuel_properties.json"):
+    """
+    Fuel properties packed into a NumPy structured array
+    
+    One float64 field per REQUIRED_FUEL_PROPERTIES entry and one row per
+    fuel, so columns such as table['heating_value'] can be used directly
+    in vectorized formulas. Entries lacking a required property are left out.
+    
+    Args:
+        filename (str): Name of the fuel properties file
+        
+    Returns:
+        tuple: (dict mapping fuel name to row index, structured np.ndarray)
+    """
+    import numpy as np
+    
+    fuel_data = load_fuel_data(filename)
+    fuels = [
+        (name, props) for name, props in fuel_data.items()
+        if isinstance(props, Mapping) and REQUIRED_FUEL_PROPERTIES_SET <= props.keys()
+    ]
+    
+    dtype = np.dtype([(field, 'f8') for field in REQUIRED_FUEL_PROPERTIES])
+    table = np.array(
+        [tuple(props[field] for field in REQUIRED_FUEL_PROPERTIES) for _, props in fuels],
+        dtype=dtype
+    )
+    table.flags.writeable = False  # Shared through the cache
+    
+    return {name: i for i, (name, _) in enumerate(fuels)}, table
+
+def get_fuel_row(fuel_type: str, filename: str = "fuel_properties.json"):
+    """
+    Get the packed property row of one fuel
+    
+    Args:
+        fuel_type (str): Type of fuel
+        filename (str): Name of the fuel properties file
+        
+    Returns:
+        np.void: Structured row with the required fuel properties
+        
+    Raises:
+        KeyError: If the fuel is not in the table
+    """
+    index, table = fuel_table(filename)
+    return table[index[fuel_type]]
+
 def list_available_fuels() -> List[str]:
     """
     Get list of available fuel types
@@ -837,6 +995,7 @@ REQUIRED_FUEL_PROPERTIES = [
     'heating_value', 'density', 'stoich_ratio', 
     'molecular_weight', 'autoignition_temp'
 ]
+REQUIRED_FUEL_PROPERTIES_SET = frozenset(REQUIRED_FUEL_PROPERTIES)
 
 __all__ = [
     'load_fuel_data',
@@ -847,6 +1006,8 @@ __all__ = [
     'save_sample_configs',
     'validate_fuel_properties',
     'get_fuel_property',
+    'fuel_table',
+    'get_fuel_row',
     'list_available_fuels',
     'list_sample_configurations',
     'SUPPORTED_FUELS',
@@ -62,11 +62,17 @@ Version: 1.0.0
 """
 
 import numpy as np
+import bisect
+import itertools
 import math
+import sys
 import warnings
-from typing import Dict, Tuple, Any, Optional, List
-from dataclasses import dataclass, field
+from typing import Dict, Tuple, Any, Optional, List, Final, Mapping
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 import json
 
 # Try to import utils for fuel properties, with fallback
@@ -84,7 +90,222 @@ except ImportError:
         }
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _sound_speed(temp_kelvin: float, gamma_R: float) -> float:
+    """Speed of sound in m/s, memoized over the few temperatures a sweep visits"""
+    return math.sqrt(gamma_R * temp_kelvin)
+
+
+# Try to import numba for JIT-compiled kernels, with fallback to plain Python
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Unit conversion factors, applied as multiplications
+_KPA_TO_PA: Final = 1e3
+_KJ_TO_J: Final = 1e3
+_W_TO_KW: Final = 1e-3
+_CM_TO_M: Final = 1e-2
+_CM2_TO_M2: Final = 1e-4
+_CM3_TO_L: Final = 1e-3
+_PER_S_TO_PER_H: Final = 3600.0
+
+# Helmholtz constants: 1/(2π), and the cm²/(L·cm) to 1/m² conversion folded
+# into one factor ((1/10000) / ((1/1000) * (1/100)) = 10)
+_INV_TWO_PI: Final = 1.0 / (2.0 * math.pi)
+_HELMHOLTZ_UNIT_FACTOR: Final = 10.0
+
+
+# Numeric kernels (scalar floats in, floats out) used by PulseJetModel. They
+# release the GIL, so callers may run them from worker threads.
+@njit(cache=True, fastmath=True, nogil=True)
+def _helmholtz_frequency_kernel(sound_speed: float, volume_l: float,
+                                neck_area_cm2: float, neck_length_cm: float) -> float:
+    """Helmholtz resonator frequency in Hz (volume in L, neck area in cm², length in cm)"""
+    if volume_l > 0 and neck_length_cm > 0:
+        return sound_speed * _INV_TWO_PI * math.sqrt(
+            _HELMHOLTZ_UNIT_FACTOR * neck_area_cm2 / (volume_l * neck_length_cm))
+    return 0.0
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _thrust_kernel(total_mass_flow: float, exhaust_velocity: float,
+                   pressure_pa: float, exhaust_area_m2: float) -> float:
+    """Momentum plus pressure thrust in N, clipped at zero"""
+    momentum_thrust = total_mass_flow * exhaust_velocity
+    pressure_ratio = min(1.2, exhaust_velocity / 300)  # Empirical relationship
+    pressure_thrust = pressure_pa * (pressure_ratio - 1) * exhaust_area_m2
+    return max(0.0, momentum_thrust + pressure_thrust)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _thermal_efficiency_kernel(total_mass_flow: float, exhaust_velocity: float,
+                               energy_release_rate: float) -> Tuple[float, float, float]:
+    """Jet power (kW), propulsive power (kW) and thermal efficiency (%)"""
+    jet_power = 0.5 * total_mass_flow * exhaust_velocity * exhaust_velocity * _W_TO_KW
+    propulsive_power = jet_power * 0.5
+    fuel_power = energy_release_rate * _W_TO_KW
+    if fuel_power > 0:
+        thermal_efficiency = (propulsive_power / fuel_power) * 100
+    else:
+        thermal_efficiency = 0.0
+    return jet_power, propulsive_power, thermal_efficiency
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _analysis_kernel(combustion_volume: float, exhaust_area: float, intake_diameter: float,
+                     exhaust_diameter: float, exhaust_length: float, valve_area: float,
+                     air_fuel_ratio: float, ambient_pressure: float, ambient_temp: float,
+                     heating_value: float, R: float, gamma: float, g: float,
+                     combustion_efficiency: float, valve_discharge_coeff: float,
+                     exhaust_efficiency: float, end_correction_factor: float,
+                     mixing_efficiency: float, heat_transfer_factor: float) -> Tuple[float, ...]:
+    """
+    Whole scalar analysis chain, calculate_operating_frequency through
+    calculate_performance_metrics, in one compiled call
+
+    Returns (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+    specific_impulse, propulsive_power, thermal_efficiency, specific_fuel_consumption).
+    Callers must pass an ambient temperature above absolute zero.
+    """
+    temp_kelvin = ambient_temp + 273.15
+
+    # Operating frequency
+    sound_speed = math.sqrt(gamma * R * temp_kelvin)
+    total_neck_length = (exhaust_length + end_correction_factor * exhaust_diameter +
+                         end_correction_factor * intake_diameter)  # cm
+    frequency = _helmholtz_frequency_kernel(sound_speed, combustion_volume, exhaust_area, total_neck_length)
+
+    # Mass flows
+    pressure_pa = ambient_pressure * _KPA_TO_PA
+    air_density = pressure_pa / (R * temp_kelvin)
+    effective_valve_area = valve_area * valve_discharge_coeff * _CM2_TO_M2
+    characteristic_velocity = math.sqrt(2 * pressure_pa / air_density)
+    if frequency > 0:
+        duty_cycle = min(0.4, 50 / frequency)
+    else:
+        duty_cycle = 0.3
+    volumetric_flow = effective_valve_area * characteristic_velocity * duty_cycle
+    air_mass_flow = air_density * volumetric_flow * mixing_efficiency
+    fuel_mass_flow = air_mass_flow / air_fuel_ratio
+
+    # Combustion
+    energy_release_rate = fuel_mass_flow * heating_value * _KJ_TO_J
+    net_energy_rate = energy_release_rate * combustion_efficiency * heat_transfer_factor
+    adiabatic_flame_temp = 2200 + ambient_temp
+    total_mass_flow = air_mass_flow + fuel_mass_flow
+
+    # Exhaust velocity
+    if total_mass_flow > 0:
+        specific_energy = net_energy_rate / total_mass_flow
+    else:
+        specific_energy = 0.0
+    # Capped at 0.8x the flame-temperature sound speed, compared in squared
+    # form so only one sqrt is taken
+    exhaust_velocity = math.sqrt(min(2 * specific_energy * exhaust_efficiency,
+                                     gamma * R * adiabatic_flame_temp * 0.64))
+
+    # Thrust
+    thrust = _thrust_kernel(total_mass_flow, exhaust_velocity, pressure_pa, exhaust_area * _CM2_TO_M2)
+
+    # Performance metrics
+    if fuel_mass_flow > 0:
+        specific_impulse = thrust / (fuel_mass_flow * g)
+    else:
+        specific_impulse = 0.0
+    jet_power, propulsive_power, thermal_efficiency = _thermal_efficiency_kernel(
+        total_mass_flow, exhaust_velocity, energy_release_rate)
+    if propulsive_power > 0:
+        sfc = fuel_mass_flow * _PER_S_TO_PER_H / propulsive_power
+    else:
+        sfc = math.inf
+
+    return (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+            specific_impulse, propulsive_power, thermal_efficiency, sfc)
+
+
+# Scalar analysis used by run_complete_analysis: the optional Cython build
+# (src/_pulse_jet_kernel.pyx, same signature) when installed, otherwise
+# _analysis_kernel, compiled by numba when available
+try:
+    from ._pulse_jet_kernel import run_analysis as _run_analysis
+except ImportError:
+    _run_analysis = _analysis_kernel
+
+
+@njit(cache=True, fastmath=True, nogil=True, parallel=True)
+def _analysis_batch_kernel(inputs: np.ndarray, valid: np.ndarray, heating_value: float,
+                           R: float, gamma: float, g: float, combustion_efficiency: float,
+                           valve_discharge_coeff: float, exhaust_efficiency: float,
+                           end_correction_factor: float, mixing_efficiency: float,
+                           heat_transfer_factor: float) -> np.ndarray:
+    """
+    _analysis_kernel over the rows of an (N, 9) input array, split across cores
+
+    Input columns follow _analysis_kernel's leading arguments (combustion volume
+    through ambient temperature); output columns follow its return tuple. Rows
+    where valid is False, or not above absolute zero, are left as zeros.
+    """
+    n = inputs.shape[0]
+    out = np.zeros((n, 9))
+    for i in prange(n):
+        row = inputs[i]
+        if not valid[i] or row[8] + 273.15 <= 0:
+            continue
+        result = _analysis_kernel(
+            row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8],
+            heating_value, R, gamma, g, combustion_efficiency, valve_discharge_coeff,
+            exhaust_efficiency, end_correction_factor, mixing_efficiency, heat_transfer_factor)
+        for j in range(9):
+            out[i, j] = result[j]
+    return out
+
+
+def warm_up_kernels():
+    """Compile the numeric kernels ahead of the first analysis (no-op without numba)"""
+    _helmholtz_frequency_kernel(340.0, 8.8, 78.5, 90.0)
+    _thrust_kernel(0.1, 500.0, 101300.0, 0.008)
+    _thermal_efficiency_kernel(0.1, 500.0, 300000.0)
+    _analysis_kernel(8.8, 78.5, 8.0, 10.0, 80.0, 20.0, 14.7, 101.3, 20.0, 44.0,
+                     287.0, 1.4, 9.81, 0.85, 0.8, 0.95, 0.6, 0.9, 0.85)
+    _analysis_batch_kernel(np.array([[8.8, 78.5, 8.0, 10.0, 80.0, 20.0, 14.7, 101.3, 20.0]]),
+                           np.ones(1, dtype=bool), 44.0,
+                           287.0, 1.4, 9.81, 0.85, 0.8, 0.95, 0.6, 0.9, 0.85)
+
+
+# Array form of the Helmholtz kernel: a compiled ufunc with numba, otherwise
+# PulseJetModel._helmholtz_frequency falls back to plain NumPy expressions
+if NUMBA_AVAILABLE:
+    _helmholtz_frequency_ufunc = vectorize(
+        ['float64(float64, float64, float64, float64)'], cache=True
+    )(_helmholtz_frequency_kernel.py_func)
+else:
+    _helmholtz_frequency_ufunc = None
+
+
+# Accepted valve and fuel names: tuples keep the documented order for error
+# messages, frozensets give allocation-free O(1) membership checks
+_VALVE_TYPES = ("Reed Valves", "Flapper Valves", "Rotary Valves")
+_FUEL_TYPES = ("Gasoline", "Propane", "Hydrogen", "Kerosene")
+_VALID_VALVE_TYPES = frozenset(_VALVE_TYPES)
+_VALID_FUELS = frozenset(_FUEL_TYPES)
+
+# Slotted dataclasses drop the per-instance __dict__ (smaller objects,
+# faster attribute access); dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class EngineGeometry:
     """
     Engine geometry parameters
@@ -95,6 +316,12 @@ class EngineGeometry:
         intake_diameter (float): Diameter of intake (cm)
         exhaust_diameter (float): Diameter of exhaust (cm)
         exhaust_length (float): Length of exhaust pipe (cm)
+        combustion_volume (float): Combustion chamber volume (L), derived
+        intake_area (float): Intake cross-sectional area (cm²), derived
+        exhaust_area (float): Exhaust cross-sectional area (cm²), derived
+        ld_ratio (float): Chamber length-to-diameter ratio, derived
+        area_ratio (float): Exhaust-to-intake area ratio, derived
+        surface_area (float): Chamber surface area (m²), derived
     """
     combustion_chamber_length: float  # cm
     combustion_chamber_diameter: float  # cm
@@ -102,46 +329,51 @@ class EngineGeometry:
     exhaust_diameter: float  # cm
     exhaust_length: float  # cm
     
+    # Derived values, computed once in __post_init__
+    combustion_volume: float = field(init=False, repr=False, compare=False)  # L
+    intake_area: float = field(init=False, repr=False, compare=False)  # cm²
+    exhaust_area: float = field(init=False, repr=False, compare=False)  # cm²
+    ld_ratio: float = field(init=False, repr=False, compare=False)
+    area_ratio: float = field(init=False, repr=False, compare=False)
+    surface_area: float = field(init=False, repr=False, compare=False)  # m²
+    
     def __post_init__(self):
         """Validate geometry parameters after initialization"""
-        if self.combustion_chamber_length <= 0:
-            raise ValueError("Combustion chamber length must be positive")
-        if self.combustion_chamber_diameter <= 0:
-            raise ValueError("Combustion chamber diameter must be positive")
-        if self.intake_diameter <= 0:
-            raise ValueError("Intake diameter must be positive")
-        if self.exhaust_diameter <= 0:
-            raise ValueError("Exhaust diameter must be positive")
-        if self.exhaust_length <= 0:
-            raise ValueError("Exhaust length must be positive")
-    
-    @property
-    def combustion_volume(self) -> float:
-        """Calculate combustion chamber volume in liters"""
-        return math.pi * (self.combustion_chamber_diameter/2)**2 * self.combustion_chamber_length / 1000
-    
-    @property
-    def intake_area(self) -> float:
-        """Calculate intake cross-sectional area in cm²"""
-        return math.pi * (self.intake_diameter/2)**2
-    
-    @property
-    def exhaust_area(self) -> float:
-        """Calculate exhaust cross-sectional area in cm²"""
-        return math.pi * (self.exhaust_diameter/2)**2
-    
-    @property
-    def ld_ratio(self) -> float:
-        """Calculate length-to-diameter ratio"""
-        return self.combustion_chamber_length / self.combustion_chamber_diameter
-    
-    @property
-    def area_ratio(self) -> float:
-        """Calculate exhaust-to-intake area ratio"""
-        return self.exhaust_area / self.intake_area
+        # One comparison for the common all-valid case; name the offending
+        # dimension only on failure
+        dimensions = (self.combustion_chamber_length, self.combustion_chamber_diameter,
+                      self.intake_diameter, self.exhaust_diameter, self.exhaust_length)
+        if min(dimensions) <= 0:
+            labels = ("Combustion chamber length", "Combustion chamber diameter",
+                      "Intake diameter", "Exhaust diameter", "Exhaust length")
+            for label, value in zip(labels, dimensions):
+                if value <= 0:
+                    raise ValueError(f"{label} must be positive")
+        
+        # Derived geometry (the dataclass is frozen, so bypass __setattr__)
+        length = self.combustion_chamber_length
+        diameter = self.combustion_chamber_diameter
+        chamber_radius = diameter * 0.5
+        intake_radius = self.intake_diameter * 0.5
+        exhaust_radius = self.exhaust_diameter * 0.5
+        intake_area = math.pi * intake_radius * intake_radius
+        exhaust_area = math.pi * exhaust_radius * exhaust_radius
+        
+        # Cylindrical chamber surface area with both ends, in m²
+        radius_m = chamber_radius * _CM_TO_M
+        length_m = length * _CM_TO_M
+        surface_area = 2 * math.pi * radius_m * (radius_m + length_m)
+        
+        object.__setattr__(self, 'combustion_volume',
+                           math.pi * chamber_radius * chamber_radius * length * _CM3_TO_L)
+        object.__setattr__(self, 'intake_area', intake_area)
+        object.__setattr__(self, 'exhaust_area', exhaust_area)
+        object.__setattr__(self, 'ld_ratio', length / diameter)
+        object.__setattr__(self, 'area_ratio', exhaust_area / intake_area)
+        object.__setattr__(self, 'surface_area', surface_area)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ValveSystem:
     """
     Valve system parameters
@@ -157,9 +389,8 @@ class ValveSystem:
     
     def __post_init__(self):
         """Validate valve parameters after initialization"""
-        valid_types = ["Reed Valves", "Flapper Valves", "Rotary Valves"]
-        if self.valve_type not in valid_types:
-            raise ValueError(f"Valve type must be one of: {valid_types}")
+        if self.valve_type not in _VALID_VALVE_TYPES:
+            raise ValueError(f"Valve type must be one of: {list(_VALVE_TYPES)}")
         if self.num_valves <= 0:
             raise ValueError("Number of valves must be positive")
         if self.valve_area <= 0:
@@ -171,7 +402,7 @@ class ValveSystem:
         return self.valve_area / self.num_valves
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class OperatingConditions:
     """
     Operating condition parameters
@@ -189,9 +420,8 @@ class OperatingConditions:
     
     def __post_init__(self):
         """Validate operating conditions after initialization"""
-        valid_fuels = ["Gasoline", "Propane", "Hydrogen", "Kerosene"]
-        if self.fuel_type not in valid_fuels:
-            raise ValueError(f"Fuel type must be one of: {valid_fuels}")
+        if self.fuel_type not in _VALID_FUELS:
+            raise ValueError(f"Fuel type must be one of: {list(_FUEL_TYPES)}")
         if self.air_fuel_ratio <= 0:
             raise ValueError("Air-fuel ratio must be positive")
         if self.ambient_pressure <= 0:
@@ -203,7 +433,7 @@ class OperatingConditions:
         return self.ambient_temp + 273.15
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PerformanceResults:
     """
     Engine performance results
@@ -240,7 +470,16 @@ class PerformanceResults:
         
         self.thrust_to_weight_ratio = self.thrust / (estimated_engine_weight * 9.81)
         self.power_to_weight_ratio = self.power / estimated_engine_weight
-        self.fuel_consumption_rate = self.fuel_mass_flow * 3600  # kg/h
+        self.fuel_consumption_rate = self.fuel_mass_flow * _PER_S_TO_PER_H  # kg/h
+
+
+# Result reported when an analysis cannot run; callers get a copy
+_ZERO_RESULTS = PerformanceResults(
+    combustion_volume=0, intake_area=0, exhaust_area=0,
+    frequency=0, air_mass_flow=0, fuel_mass_flow=0, exhaust_velocity=0,
+    thrust=0, specific_impulse=0, power=0, thermal_efficiency=0,
+    specific_fuel_consumption=float('inf')
+)
 
 
 class PulseJetModel:
@@ -262,6 +501,28 @@ class PulseJetModel:
         constants (dict): Physical and model constants
     """
     
+    # Numeric inputs that run_batch_analysis can vary along an array axis
+    BATCH_PARAMETERS = frozenset({
+        'combustion_chamber_length', 'combustion_chamber_diameter',
+        'intake_diameter', 'exhaust_diameter', 'exhaust_length',
+        'num_valves', 'valve_area',
+        'air_fuel_ratio', 'ambient_pressure', 'ambient_temp'
+    })
+    
+    # Default model constants, shared read-only by all instances
+    _DEFAULT_CONSTANTS = MappingProxyType({
+        'R': 287,  # Specific gas constant for air (J/kg·K)
+        'gamma': 1.4,  # Heat capacity ratio for air
+        'g': 9.81,  # Standard gravity (m/s²)
+        'frequency_constant': 17000,  # Helmholtz resonator constant
+        'combustion_efficiency': 0.85,  # Combustion efficiency (0-1)
+        'valve_discharge_coeff': 0.8,  # Valve discharge coefficient (0-1)
+        'exhaust_efficiency': 0.95,  # Exhaust nozzle efficiency (0-1)
+        'end_correction_factor': 0.6,  # End correction for Helmholtz calculation
+        'mixing_efficiency': 0.9,  # Air-fuel mixing efficiency (0-1)
+        'heat_transfer_factor': 0.85  # Heat transfer efficiency (0-1)
+    })
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize the pulse jet model
@@ -269,6 +530,8 @@ class PulseJetModel:
         Args:
             config_file (str, optional): Path to configuration file
         """
+        # Each model gets its own copy; utils caches the parse by file mtime,
+        # so edits to the fuel data are picked up by new models
         self.fuel_properties = load_fuel_properties()
         
         # Load constants from config or use defaults
@@ -293,18 +556,7 @@ class PulseJetModel:
     
     def _get_default_constants(self) -> Dict[str, float]:
         """Get default model constants"""
-        return {
-            'R': 287,  # Specific gas constant for air (J/kg·K)
-            'gamma': 1.4,  # Heat capacity ratio for air
-            'g': 9.81,  # Standard gravity (m/s²)
-            'frequency_constant': 17000,  # Helmholtz resonator constant
-            'combustion_efficiency': 0.85,  # Combustion efficiency (0-1)
-            'valve_discharge_coeff': 0.8,  # Valve discharge coefficient (0-1)
-            'exhaust_efficiency': 0.95,  # Exhaust nozzle efficiency (0-1)
-            'end_correction_factor': 0.6,  # End correction for Helmholtz calculation
-            'mixing_efficiency': 0.9,  # Air-fuel mixing efficiency (0-1)
-            'heat_transfer_factor': 0.85  # Heat transfer efficiency (0-1)
-        }
+        return dict(self._DEFAULT_CONSTANTS)
     
     def calculate_geometry_parameters(self, geometry: EngineGeometry) -> Dict[str, float]:
         """
@@ -322,19 +574,14 @@ class PulseJetModel:
             'exhaust_area': geometry.exhaust_area,
             'area_ratio': geometry.area_ratio,
             'ld_ratio': geometry.ld_ratio,
-            'surface_area': self._calculate_surface_area(geometry),
-            'volume_to_surface_ratio': geometry.combustion_volume / self._calculate_surface_area(geometry)
+            'surface_area': geometry.surface_area,
+            'volume_to_surface_ratio': geometry.combustion_volume / geometry.surface_area
         }
     
     def _calculate_surface_area(self, geometry: EngineGeometry) -> float:
         """Calculate combustion chamber surface area for heat transfer"""
-        # Cylindrical chamber surface area in m²
-        radius = geometry.combustion_chamber_diameter / 200  # Convert cm to m
-        length = geometry.combustion_chamber_length / 100   # Convert cm to m
-        
-        # Surface area = 2πr² + 2πrh (cylinder with both ends)
-        surface_area = 2 * math.pi * radius**2 + 2 * math.pi * radius * length
-        return surface_area
+        # Precomputed by EngineGeometry: 2πr(r + h) in m²
+        return geometry.surface_area
     
     def calculate_operating_frequency(self, geometry: EngineGeometry, 
                                     conditions: OperatingConditions) -> float:
@@ -354,11 +601,14 @@ class PulseJetModel:
             float: Operating frequency in Hz
         """
         # Calculate sound speed at operating temperature
+        constants = self.constants
+        gamma, R = constants['gamma'], constants['R']
+        end_correction = constants['end_correction_factor']
+        
         temp_kelvin = conditions.ambient_temp_kelvin
-        sound_speed = math.sqrt(self.constants['gamma'] * self.constants['R'] * temp_kelvin)
+        sound_speed = _sound_speed(temp_kelvin, gamma * R)
         
         # Calculate effective lengths with end corrections
-        end_correction = self.constants['end_correction_factor']
         effective_exhaust_length = (geometry.exhaust_length + 
                                    end_correction * geometry.exhaust_diameter)  # cm
         effective_intake_length = end_correction * geometry.intake_diameter  # cm
@@ -366,21 +616,12 @@ class PulseJetModel:
         # Total effective neck length
         total_neck_length = effective_exhaust_length + effective_intake_length  # cm
         
-        # Convert to meters for calculation
-        volume_m3 = geometry.combustion_volume / 1000  # L to m³
-        neck_area_m2 = geometry.exhaust_area / 10000   # cm² to m²
-        neck_length_m = total_neck_length / 100        # cm to m
-        
-        # Helmholtz frequency calculation
-        if volume_m3 > 0 and neck_length_m > 0:
-            frequency = (sound_speed / (2 * math.pi)) * math.sqrt(neck_area_m2 / (volume_m3 * neck_length_m))
-        else:
-            frequency = 0
-        
-        return frequency
+        # Helmholtz frequency calculation (unit conversion folded into the kernel)
+        return _helmholtz_frequency_kernel(
+            sound_speed, geometry.combustion_volume, geometry.exhaust_area, total_neck_length)
     
     def calculate_mass_flows(self, geometry: EngineGeometry, valves: ValveSystem,
-                           conditions: OperatingConditions, frequency: float) -> Tuple[float, float]:
+                           conditions: OperatingConditions, frequency: float) -> Tuple[float, float, float]:
         """
         Calculate air and fuel mass flow rates
         
@@ -397,15 +638,20 @@ class PulseJetModel:
             frequency (float): Operating frequency in Hz
             
         Returns:
-            tuple: (air_mass_flow, fuel_mass_flow) in kg/s
+            tuple: (air_mass_flow, fuel_mass_flow, total_mass_flow) in kg/s
         """
+        constants = self.constants
+        R = constants['R']
+        valve_discharge_coeff = constants['valve_discharge_coeff']
+        mixing_efficiency = constants['mixing_efficiency']
+        
         # Calculate air density at ambient conditions
         temp_kelvin = conditions.ambient_temp_kelvin
-        pressure_pa = conditions.ambient_pressure * 1000  # kPa to Pa
-        air_density = pressure_pa / (self.constants['R'] * temp_kelvin)  # kg/m³
+        pressure_pa = conditions.ambient_pressure * _KPA_TO_PA
+        air_density = pressure_pa / (R * temp_kelvin)  # kg/m³
         
         # Effective valve area accounting for discharge coefficient and number of valves
-        effective_valve_area = (valves.valve_area * self.constants['valve_discharge_coeff'] / 10000)  # m²
+        effective_valve_area = valves.valve_area * valve_discharge_coeff * _CM2_TO_M2  # m²
         
         # Characteristic velocity for compressible flow
         # This is a simplified model - real valve dynamics are much more complex
@@ -422,89 +668,94 @@ class PulseJetModel:
         volumetric_flow = effective_valve_area * characteristic_velocity * duty_cycle  # m³/s
         
         # Air mass flow rate
-        air_mass_flow = air_density * volumetric_flow * self.constants['mixing_efficiency']  # kg/s
+        air_mass_flow = air_density * volumetric_flow * mixing_efficiency  # kg/s
         
         # Fuel mass flow rate based on air-fuel ratio
         fuel_mass_flow = air_mass_flow / conditions.air_fuel_ratio  # kg/s
         
-        return air_mass_flow, fuel_mass_flow
+        return air_mass_flow, fuel_mass_flow, air_mass_flow + fuel_mass_flow
     
     def calculate_combustion_parameters(self, conditions: OperatingConditions,
-                                      air_mass_flow: float, fuel_mass_flow: float) -> Dict[str, float]:
+                                      fuel_mass_flow: float) -> Dict[str, float]:
         """
         Calculate combustion-related parameters
         
         Args:
             conditions (OperatingConditions): Operating conditions
-            air_mass_flow (float): Air mass flow rate (kg/s)
             fuel_mass_flow (float): Fuel mass flow rate (kg/s)
             
         Returns:
             dict: Combustion parameters
         """
         fuel_props = self.fuel_properties[conditions.fuel_type]
+        combustion_efficiency = self.constants['combustion_efficiency']
+        heat_transfer_factor = self.constants['heat_transfer_factor']
         
         # Energy release rate
-        energy_release_rate = fuel_mass_flow * fuel_props['heating_value'] * 1000  # W (kJ/kg to J/kg)
+        energy_release_rate = fuel_mass_flow * fuel_props['heating_value'] * _KJ_TO_J  # W
         
         # Effective energy after combustion efficiency
-        effective_energy_rate = energy_release_rate * self.constants['combustion_efficiency']
+        effective_energy_rate = energy_release_rate * combustion_efficiency
         
         # Estimate combustion temperature (simplified)
         # This is a very simplified model - real combustion analysis is much more complex
         adiabatic_flame_temp = 2200 + conditions.ambient_temp  # K (rough estimate)
         
         # Heat transfer losses
-        heat_transfer_factor = self.constants['heat_transfer_factor']
         net_energy_rate = effective_energy_rate * heat_transfer_factor
         
         return {
             'energy_release_rate': energy_release_rate,
             'effective_energy_rate': effective_energy_rate,
             'net_energy_rate': net_energy_rate,
-            'adiabatic_flame_temp': adiabatic_flame_temp,
-            'total_mass_flow': air_mass_flow + fuel_mass_flow
+            'adiabatic_flame_temp': adiabatic_flame_temp
         }
     
     def calculate_exhaust_velocity(self, conditions: OperatingConditions,
-                                 combustion_params: Dict[str, float]) -> float:
+                                 combustion_params: Dict[str, float],
+                                 total_mass_flow: float) -> float:
         """
         Calculate exhaust velocity based on energy conversion
         
         Args:
             conditions (OperatingConditions): Operating conditions
             combustion_params (dict): Combustion parameters
+            total_mass_flow (float): Air plus fuel mass flow rate (kg/s)
             
         Returns:
             float: Exhaust velocity in m/s
         """
+        constants = self.constants
+        gamma, R = constants['gamma'], constants['R']
+        exhaust_efficiency = constants['exhaust_efficiency']
+        
         # Available kinetic energy per unit mass flow
-        if combustion_params['total_mass_flow'] > 0:
-            specific_energy = (combustion_params['net_energy_rate'] / 
-                             combustion_params['total_mass_flow'])  # J/kg
+        if total_mass_flow > 0:
+            specific_energy = combustion_params['net_energy_rate'] / total_mass_flow  # J/kg
         else:
             specific_energy = 0
         
         # Convert to exhaust velocity using kinetic energy relationship
         # v = sqrt(2 * specific_energy * exhaust_efficiency)
-        exhaust_velocity = math.sqrt(2 * specific_energy * self.constants['exhaust_efficiency'])
+        velocity_sq = 2 * specific_energy * exhaust_efficiency
         
-        # Limit to reasonable values (speed of sound at combustion temperature is upper limit)
-        max_velocity = math.sqrt(self.constants['gamma'] * self.constants['R'] * 
-                               combustion_params['adiabatic_flame_temp'])
-        exhaust_velocity = min(exhaust_velocity, max_velocity * 0.8)  # Subsonic limit
+        # Limit to reasonable values (speed of sound at combustion temperature is upper limit).
+        # The cap is compared in squared form (0.8² = 0.64); when it applies, the
+        # flame-temperature sound speed comes from the shared cache instead of a sqrt
+        flame_temp = combustion_params['adiabatic_flame_temp']
+        gamma_R = gamma * R
+        if velocity_sq > gamma_R * flame_temp * 0.64:
+            return 0.8 * _sound_speed(flame_temp, gamma_R)  # Subsonic limit
         
-        return exhaust_velocity
+        return math.sqrt(velocity_sq)
     
-    def calculate_thrust(self, air_mass_flow: float, fuel_mass_flow: float, 
-                        exhaust_velocity: float, conditions: OperatingConditions,
-                        geometry: EngineGeometry) -> float:
+    def calculate_thrust(self, total_mass_flow: float, exhaust_velocity: float,
+                        conditions: OperatingConditions, geometry: EngineGeometry) -> float:
         """
         Calculate thrust using momentum theory with corrections
         
         Args:
-            air_mass_flow (float): Air mass flow rate (kg/s)
-            fuel_mass_flow (float): Fuel mass flow rate (kg/s)
+            total_mass_flow (float): Air plus fuel mass flow rate (kg/s)
             exhaust_velocity (float): Exhaust velocity (m/s)
             conditions (OperatingConditions): Operating conditions
             geometry (EngineGeometry): Engine geometry
@@ -512,29 +763,16 @@ class PulseJetModel:
         Returns:
             float: Total thrust in N
         """
-        # Total mass flow
-        total_mass_flow = air_mass_flow + fuel_mass_flow
-        
-        # Momentum thrust (primary component)
-        momentum_thrust = total_mass_flow * exhaust_velocity
+        # Momentum thrust plus a simplified pressure thrust term
+        # (assumes some expansion occurs), clipped to be non-negative
+        pressure_pa = conditions.ambient_pressure * _KPA_TO_PA
+        exhaust_area_m2 = geometry.exhaust_area * _CM2_TO_M2
         
-        # Pressure thrust (secondary component for unchoked flow)
-        # This is simplified - assumes some expansion occurs
-        pressure_pa = conditions.ambient_pressure * 1000
-        exhaust_area_m2 = geometry.exhaust_area / 10000
-        
-        # Estimate pressure difference (very simplified)
-        pressure_ratio = min(1.2, exhaust_velocity / 300)  # Empirical relationship
-        pressure_diff = pressure_pa * (pressure_ratio - 1)
-        pressure_thrust = pressure_diff * exhaust_area_m2
-        
-        # Total thrust
-        total_thrust = momentum_thrust + pressure_thrust
-        
-        return max(0, total_thrust)  # Ensure non-negative
+        return _thrust_kernel(total_mass_flow, exhaust_velocity, pressure_pa, exhaust_area_m2)
     
-    def calculate_performance_metrics(self, thrust: float, fuel_mass_flow: float, 
-                                    exhaust_velocity: float, combustion_params: Dict[str, float],
+    def calculate_performance_metrics(self, thrust: float, fuel_mass_flow: float,
+                                    total_mass_flow: float, exhaust_velocity: float,
+                                    combustion_params: Dict[str, float],
                                     conditions: OperatingConditions) -> Dict[str, float]:
         """
         Calculate additional performance metrics
@@ -542,6 +780,7 @@ class PulseJetModel:
         Args:
             thrust (float): Thrust in N
             fuel_mass_flow (float): Fuel mass flow rate (kg/s)
+            total_mass_flow (float): Air plus fuel mass flow rate (kg/s)
             exhaust_velocity (float): Exhaust velocity (m/s)
             combustion_params (dict): Combustion parameters
             conditions (OperatingConditions): Operating conditions
@@ -549,29 +788,23 @@ class PulseJetModel:
         Returns:
             dict: Performance metrics dictionary
         """
+        g = self.constants['g']
+        
         # Specific impulse
         if fuel_mass_flow > 0:
-            specific_impulse = thrust / (fuel_mass_flow * self.constants['g'])
+            specific_impulse = thrust / (fuel_mass_flow * g)
         else:
             specific_impulse = 0
         
-        # Jet power (kinetic power of exhaust)
-        jet_power = 0.5 * combustion_params['total_mass_flow'] * exhaust_velocity**2 / 1000  # kW
-        
-        # Propulsive power (thrust power)
-        # For static conditions, this is zero, so we use a fraction of jet power
-        propulsive_power = jet_power * 0.5  # Rough estimate for propulsive efficiency
-        
-        # Thermal efficiency
-        fuel_power = combustion_params['energy_release_rate'] / 1000  # kW
-        if fuel_power > 0:
-            thermal_efficiency = (propulsive_power / fuel_power) * 100
-        else:
-            thermal_efficiency = 0
+        # Jet power (kinetic power of exhaust), propulsive power and thermal efficiency
+        # For static conditions propulsive power is zero, so a fraction of jet power is used
+        energy_release_rate = combustion_params['energy_release_rate']
+        jet_power, propulsive_power, thermal_efficiency = _thermal_efficiency_kernel(
+            total_mass_flow, exhaust_velocity, energy_release_rate)
         
         # Specific fuel consumption
         if propulsive_power > 0:
-            sfc = fuel_mass_flow * 3600 / propulsive_power  # kg/kW·h
+            sfc = fuel_mass_flow * _PER_S_TO_PER_H / propulsive_power  # kg/kW·h
         else:
             sfc = float('inf')
         
@@ -595,68 +828,496 @@ class PulseJetModel:
             geometry (EngineGeometry): Engine geometry parameters
             valves (ValveSystem): Valve system parameters
             conditions (OperatingConditions): Operating conditions
-            
+        
         Returns:
             PerformanceResults: Complete set of performance results
         """
-        try:
-            # Step 1: Calculate geometry parameters
-            geom_params = self.calculate_geometry_parameters(geometry)
-            
-            # Step 2: Calculate operating frequency
-            frequency = self.calculate_operating_frequency(geometry, conditions)
-            
-            # Step 3: Calculate mass flows
-            air_mass_flow, fuel_mass_flow = self.calculate_mass_flows(
-                geometry, valves, conditions, frequency)
+        if not self._validate_inputs(geometry, valves, conditions):
+            return replace(_ZERO_RESULTS)
+        
+        # The whole numeric chain runs as one compiled kernel; it mirrors
+        # the calculate_* methods, which remain for step-by-step use
+        c = self.constants
+        heating_value = self.fuel_properties[conditions.fuel_type]['heating_value']
+        combustion_volume = geometry.combustion_volume
+        exhaust_area = geometry.exhaust_area
+        
+        (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+         specific_impulse, power, thermal_efficiency, sfc) = _run_analysis(
+            float(combustion_volume), float(exhaust_area),
+            float(geometry.intake_diameter), float(geometry.exhaust_diameter),
+            float(geometry.exhaust_length), float(valves.valve_area),
+            float(conditions.air_fuel_ratio), float(conditions.ambient_pressure),
+            float(conditions.ambient_temp), float(heating_value),
+            float(c['R']), float(c['gamma']), float(c['g']),
+            float(c['combustion_efficiency']), float(c['valve_discharge_coeff']),
+            float(c['exhaust_efficiency']), float(c['end_correction_factor']),
+            float(c['mixing_efficiency']), float(c['heat_transfer_factor']))
+        
+        # Create and return results
+        results = PerformanceResults(
+            # Geometry-derived
+            combustion_volume=combustion_volume,
+            intake_area=geometry.intake_area,
+            exhaust_area=exhaust_area,
             
-            # Step 4: Calculate combustion parameters
-            combustion_params = self.calculate_combustion_parameters(
-                conditions, air_mass_flow, fuel_mass_flow)
+            # Operating parameters
+            frequency=frequency,
+            air_mass_flow=air_mass_flow,
+            fuel_mass_flow=fuel_mass_flow,
+            exhaust_velocity=exhaust_velocity,
             
-            # Step 5: Calculate exhaust velocity
-            exhaust_velocity = self.calculate_exhaust_velocity(conditions, combustion_params)
-            
-            # Step 6: Calculate thrust
-            thrust = self.calculate_thrust(
-                air_mass_flow, fuel_mass_flow, exhaust_velocity, conditions, geometry)
-            
-            # Step 7: Calculate performance metrics
-            performance_metrics = self.calculate_performance_metrics(
-                thrust, fuel_mass_flow, exhaust_velocity, combustion_params, conditions)
-            
-            # Create and return results
-            results = PerformanceResults(
-                # Geometry-derived
-                combustion_volume=geom_params['combustion_volume'],
-                intake_area=geom_params['intake_area'],
-                exhaust_area=geom_params['exhaust_area'],
-                
-                # Operating parameters
-                frequency=frequency,
-                air_mass_flow=air_mass_flow,
-                fuel_mass_flow=fuel_mass_flow,
-                exhaust_velocity=exhaust_velocity,
-                
-                # Performance metrics
-                thrust=thrust,
-                specific_impulse=performance_metrics['specific_impulse'],
-                power=performance_metrics['propulsive_power'],
-                thermal_efficiency=performance_metrics['thermal_efficiency'],
-                specific_fuel_consumption=performance_metrics['specific_fuel_consumption']
-            )
-            
-            return results
-            
-        except Exception as e:
-            # Log error and return zero results rather than failing
-            warnings.warn(f"Analysis failed: {str(e)}")
-            return PerformanceResults(
-                combustion_volume=0, intake_area=0, exhaust_area=0,
-                frequency=0, air_mass_flow=0, fuel_mass_flow=0, exhaust_velocity=0,
-                thrust=0, specific_impulse=0, power=0, thermal_efficiency=0,
-                specific_fuel_consumption=float('inf')
-            )
+            # Performance metrics
+            thrust=thrust,
+            specific_impulse=specific_impulse,
+            power=power,
+            thermal_efficiency=thermal_efficiency,
+            specific_fuel_consumption=sfc
+        )
+        
+        return results
+
+    def _validate_inputs(self, geometry: EngineGeometry, valves: ValveSystem,
+                         conditions: OperatingConditions) -> bool:
+        """
+        Check the preconditions the dataclasses cannot enforce on their own
+        
+        Returns:
+            bool: True if the analysis can run; otherwise a warning is issued
+        """
+        if conditions.fuel_type not in self.fuel_properties:
+            warnings.warn(f"Analysis failed: no fuel properties for {conditions.fuel_type}")
+            return False
+        if conditions.ambient_temp_kelvin <= 0:
+            warnings.warn("Analysis failed: ambient temperature is not above absolute zero")
+            return False
+        return True
+
+    def calculate_operating_frequency_vec(self, geometry: EngineGeometry,
+                                          conditions: OperatingConditions,
+                                          exhaust_lengths: np.ndarray) -> np.ndarray:
+        """
+        Calculate operating frequency for an array of exhaust lengths
+
+        Vectorized form of calculate_operating_frequency: all other geometry
+        and operating parameters are taken from the given objects.
+
+        Args:
+            geometry (EngineGeometry): Base engine geometry
+            conditions (OperatingConditions): Operating conditions
+            exhaust_lengths (np.ndarray): Exhaust lengths to evaluate (cm)
+
+        Returns:
+            np.ndarray: Operating frequency in Hz for each exhaust length
+        """
+        exhaust_lengths = np.asarray(exhaust_lengths, dtype=float)
+        return self._helmholtz_frequency(
+            geometry.combustion_volume, geometry.exhaust_area, geometry.exhaust_diameter,
+            geometry.intake_diameter, exhaust_lengths, conditions.ambient_temp_kelvin)
+
+    def _helmholtz_frequency(self, combustion_volume, exhaust_area, exhaust_diameter,
+                             intake_diameter, exhaust_length, temp_kelvin) -> np.ndarray:
+        """Helmholtz frequency on NumPy arrays (same model as calculate_operating_frequency)"""
+        constants = self.constants
+        gamma, R = constants['gamma'], constants['R']
+        end_correction = constants['end_correction_factor']
+
+        sound_speed = np.sqrt(gamma * R * temp_kelvin)
+
+        total_neck_length = (exhaust_length + end_correction * exhaust_diameter +
+                             end_correction * intake_diameter)  # cm
+
+        if _helmholtz_frequency_ufunc is not None:
+            return np.asarray(_helmholtz_frequency_ufunc(
+                sound_speed, combustion_volume, exhaust_area, total_neck_length))
+
+        valid = (combustion_volume > 0) & (total_neck_length > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frequency = sound_speed * _INV_TWO_PI * np.sqrt(
+                _HELMHOLTZ_UNIT_FACTOR * exhaust_area / (combustion_volume * total_neck_length))
+        return np.where(valid, frequency, 0.0)
+
+    def _analyze_arrays(self, inputs: Dict[str, np.ndarray], combustion_volume: np.ndarray,
+                        exhaust_area: np.ndarray, heating_value: float) -> Tuple[np.ndarray, ...]:
+        """NumPy form of _analysis_kernel, used by run_batch_analysis without numba"""
+        c = self.constants
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # Frequency
+            temp_kelvin = inputs['ambient_temp'] + 273.15
+            frequency = self._helmholtz_frequency(
+                combustion_volume, exhaust_area, inputs['exhaust_diameter'],
+                inputs['intake_diameter'], inputs['exhaust_length'], temp_kelvin)
+
+            # Mass flows
+            pressure_pa = inputs['ambient_pressure'] * _KPA_TO_PA
+            air_density = pressure_pa / (c['R'] * temp_kelvin)
+            effective_valve_area = inputs['valve_area'] * c['valve_discharge_coeff'] * _CM2_TO_M2
+            characteristic_velocity = np.sqrt(2 * pressure_pa / air_density)
+            duty_cycle = np.where(frequency > 0, np.minimum(0.4, 50 / frequency), 0.3)
+            volumetric_flow = effective_valve_area * characteristic_velocity * duty_cycle
+            air_mass_flow = air_density * volumetric_flow * c['mixing_efficiency']
+            fuel_mass_flow = air_mass_flow / inputs['air_fuel_ratio']
+
+            # Combustion
+            energy_release_rate = fuel_mass_flow * heating_value * _KJ_TO_J
+            net_energy_rate = energy_release_rate * c['combustion_efficiency'] * c['heat_transfer_factor']
+            adiabatic_flame_temp = 2200 + inputs['ambient_temp']
+            total_mass_flow = air_mass_flow + fuel_mass_flow
+
+            # Exhaust velocity
+            specific_energy = np.where(total_mass_flow > 0, net_energy_rate / total_mass_flow, 0.0)
+            exhaust_velocity = np.sqrt(np.minimum(2 * specific_energy * c['exhaust_efficiency'],
+                                                  c['gamma'] * c['R'] * adiabatic_flame_temp * 0.64))
+
+            # Thrust
+            pressure_ratio = np.minimum(1.2, exhaust_velocity / 300)
+            pressure_thrust = pressure_pa * (pressure_ratio - 1) * (exhaust_area * _CM2_TO_M2)
+            thrust = np.maximum(0, total_mass_flow * exhaust_velocity + pressure_thrust)
+
+            # Performance metrics
+            specific_impulse = np.where(fuel_mass_flow > 0, thrust / (fuel_mass_flow * c['g']), 0.0)
+            propulsive_power = 0.5 * (0.5 * total_mass_flow * exhaust_velocity * exhaust_velocity * _W_TO_KW)
+            fuel_power = energy_release_rate * _W_TO_KW
+            thermal_efficiency = np.where(fuel_power > 0, propulsive_power / fuel_power * 100, 0.0)
+            sfc = np.where(propulsive_power > 0, fuel_mass_flow * _PER_S_TO_PER_H / propulsive_power, np.inf)
+
+        return (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+                specific_impulse, propulsive_power, thermal_efficiency, sfc)
+
+    def analyze_batch(self, geometry: Dict[str, Any], valves: Dict[str, Any],
+                      conditions: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Run the complete analysis on arrays of designs (structure of arrays)
+
+        Each mapping holds the constructor fields of EngineGeometry,
+        ValveSystem and OperatingConditions. Numeric fields may be scalars or
+        arrays and are broadcast against each other, so any combination of
+        inputs can vary at once; fuel_type must be a single fuel name and
+        valve_type is not used. Points that would fail dataclass validation
+        (non-positive dimensions, valve count, valve area, air-fuel ratio or
+        pressure) yield the same zero results as a failed scalar analysis.
+
+        Args:
+            geometry (dict): Geometry fields, scalars or arrays
+            valves (dict): Valve fields, scalars or arrays
+            conditions (dict): Operating condition fields, scalars or arrays
+
+        Returns:
+            dict: float64 arrays of the broadcast shape, keyed by
+                PerformanceResults field name
+
+        Raises:
+            ValueError: If a numeric field or fuel_type is missing from all mappings
+        """
+        names = sorted(self.BATCH_PARAMETERS)
+        sources = (geometry, valves, conditions)
+        missing = [name for name in names if not any(name in source for source in sources)]
+        if 'fuel_type' not in conditions:
+            missing.append('fuel_type')
+        if missing:
+            raise ValueError(f"Missing parameters: {missing}")
+
+        values = [next(source[name] for source in sources if name in source) for name in names]
+        arrays = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+        inputs = dict(zip(names, arrays))
+        shape = arrays[0].shape
+
+        c = self.constants
+        fuel_props = self.fuel_properties[conditions['fuel_type']]
+
+        # Inputs that must be positive for the dataclasses to accept them,
+        # and temperatures the scalar analysis can evaluate
+        valid = np.ones(shape, dtype=bool)
+        for name, value in inputs.items():
+            if name != 'ambient_temp':
+                valid &= value > 0
+        valid &= inputs['ambient_temp'] + 273.15 > 0
+
+        # Geometry
+        chamber_diameter = inputs['combustion_chamber_diameter']
+        chamber_radius = chamber_diameter * 0.5
+        intake_radius = inputs['intake_diameter'] * 0.5
+        exhaust_radius = inputs['exhaust_diameter'] * 0.5
+        combustion_volume = math.pi * chamber_radius * chamber_radius * inputs['combustion_chamber_length'] * _CM3_TO_L
+        intake_area = math.pi * intake_radius * intake_radius
+        exhaust_area = math.pi * exhaust_radius * exhaust_radius
+
+        if NUMBA_AVAILABLE:
+            # One compiled scalar analysis per point, spread across cores
+            columns = np.column_stack([np.ravel(column) for column in (
+                combustion_volume, exhaust_area, inputs['intake_diameter'],
+                inputs['exhaust_diameter'], inputs['exhaust_length'], inputs['valve_area'],
+                inputs['air_fuel_ratio'], inputs['ambient_pressure'], inputs['ambient_temp'])])
+            outputs = _analysis_batch_kernel(
+                columns, valid.ravel(), float(fuel_props['heating_value']),
+                float(c['R']), float(c['gamma']), float(c['g']),
+                float(c['combustion_efficiency']), float(c['valve_discharge_coeff']),
+                float(c['exhaust_efficiency']), float(c['end_correction_factor']),
+                float(c['mixing_efficiency']), float(c['heat_transfer_factor']))
+            (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+             specific_impulse, propulsive_power, thermal_efficiency, sfc) = (
+                column.reshape(shape) for column in outputs.T)
+        else:
+            (frequency, air_mass_flow, fuel_mass_flow, exhaust_velocity, thrust,
+             specific_impulse, propulsive_power, thermal_efficiency, sfc) = self._analyze_arrays(
+                inputs, combustion_volume, exhaust_area, fuel_props['heating_value'])
+
+        # Derived metrics (as in PerformanceResults.__post_init__)
+        estimated_engine_weight = np.maximum(propulsive_power * 5, 10)
+
+        results = {
+            'combustion_volume': combustion_volume,
+            'intake_area': intake_area,
+            'exhaust_area': exhaust_area,
+            'frequency': frequency,
+            'air_mass_flow': air_mass_flow,
+            'fuel_mass_flow': fuel_mass_flow,
+            'exhaust_velocity': exhaust_velocity,
+            'thrust': thrust,
+            'specific_impulse': specific_impulse,
+            'power': propulsive_power,
+            'thermal_efficiency': thermal_efficiency,
+            'specific_fuel_consumption': sfc,
+            'thrust_to_weight_ratio': thrust / (estimated_engine_weight * 9.81),
+            'power_to_weight_ratio': propulsive_power / estimated_engine_weight,
+            'fuel_consumption_rate': fuel_mass_flow * _PER_S_TO_PER_H
+        }
+
+        # Failed points report zeros, matching run_complete_analysis
+        valid &= np.isfinite(thrust)
+        for name, array in results.items():
+            fill = np.inf if name == 'specific_fuel_consumption' else 0.0
+            results[name] = np.where(valid, array, fill)
+
+        return results
+
+    def run_batch_analysis(self, geometry: EngineGeometry, valves: ValveSystem,
+                           conditions: OperatingConditions, parameter_name: str,
+                           parameter_values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Run the complete analysis for many values of one numeric parameter
+
+        Evaluates the same equations as run_complete_analysis on NumPy arrays
+        (see analyze_batch), so a sweep costs a single pass instead of one
+        Python call per point.
+
+        Args:
+            geometry (EngineGeometry): Base geometry configuration
+            valves (ValveSystem): Base valve configuration
+            conditions (OperatingConditions): Base operating conditions
+            parameter_name (str): Name of the numeric parameter to vary
+            parameter_values (np.ndarray): Values of that parameter
+
+        Returns:
+            dict: Arrays keyed by PerformanceResults field name
+
+        Raises:
+            ValueError: If parameter_name is not a numeric model input
+        """
+        if parameter_name not in self.BATCH_PARAMETERS:
+            raise ValueError(f"Unknown parameter: {parameter_name}")
+
+        return self.analyze_grid(geometry, valves, conditions,
+                                 **{parameter_name: parameter_values})
+
+    def analyze_grid(self, geometry: EngineGeometry, valves: ValveSystem,
+                     conditions: OperatingConditions, **arrays: Any) -> Dict[str, np.ndarray]:
+        """
+        Run the complete analysis with any numeric inputs replaced by arrays
+
+        Every keyword overrides the field of that name on the base objects and
+        may be a scalar or an array; all are broadcast together, so sampled
+        ensembles (1-D arrays of equal length) and full grids (arrays shaped
+        to broadcast, e.g. exhaust_length=L[:, None], ambient_temp=T[None, :])
+        are both evaluated in one vectorized pass.
+
+        Args:
+            geometry (EngineGeometry): Base geometry configuration
+            valves (ValveSystem): Base valve configuration
+            conditions (OperatingConditions): Base operating conditions
+            **arrays: Numeric model inputs (see BATCH_PARAMETERS) to vary
+
+        Returns:
+            dict: Arrays of the broadcast shape, keyed by PerformanceResults field name
+
+        Raises:
+            ValueError: If a keyword is not a numeric model input
+        """
+        unknown = set(arrays) - self.BATCH_PARAMETERS
+        if unknown:
+            raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+
+        geometry_fields, valve_fields, condition_fields = (
+            {f.name: getattr(obj, f.name) for f in fields(obj) if f.init}
+            for obj in (geometry, valves, conditions))
+        for source in (geometry_fields, valve_fields, condition_fields):
+            for name in source.keys() & arrays.keys():
+                source[name] = np.asarray(arrays[name], dtype=float)
+
+        return self.analyze_batch(geometry_fields, valve_fields, condition_fields)
+
+
+# multi_parameter_optimization objectives: the PerformanceResults field each
+# one reads and whether lower values are better. Unknown names use thrust.
+_OBJECTIVES = MappingProxyType({
+    'thrust': ('thrust', False),
+    'efficiency': ('thermal_efficiency', False),
+    'specific_impulse': ('specific_impulse', False),
+    'specific_fuel_consumption': ('specific_fuel_consumption', True)
+})
+
+
+def _evaluate_combination(model: 'PulseJetModel', base_geometry: 'EngineGeometry',
+                          base_valves: 'ValveSystem', base_conditions: 'OperatingConditions',
+                          param_names: List[str], geometry_mask: Tuple[bool, ...],
+                          param_values: Tuple[float, ...], objective_field: str,
+                          keep_performance: bool = True):
+    """
+    Evaluate one grid-search point of OptimizationAnalyzer.multi_parameter_optimization
+    
+    Errors are returned rather than raised, so one failing point does not
+    abort the search.
+    
+    Args:
+        model (PulseJetModel): Model used for the analysis
+        base_geometry (EngineGeometry): Base geometry configuration
+        base_valves (ValveSystem): Base valve configuration
+        base_conditions (OperatingConditions): Base operating conditions
+        param_names (list): Names of the parameters being varied
+        geometry_mask (tuple): Per parameter, whether it is an EngineGeometry
+            field (resolved once per search)
+        param_values (tuple): Values for param_names at this grid point
+        objective_field (str): PerformanceResults field being optimized
+        keep_performance (bool): Include the full PerformanceResults in the entry
+        
+    Returns:
+        dict or Exception: Result entry, or the exception the point raised
+    """
+    try:
+        # Create configuration with modified parameters, applying all
+        # geometry changes in a single copy
+        geometry_changes = dict(itertools.compress(zip(param_names, param_values), geometry_mask))
+        geometry = replace(base_geometry, **geometry_changes) if geometry_changes else base_geometry
+        
+        # Run analysis
+        performance = model.run_complete_analysis(geometry, base_valves, base_conditions)
+        
+        result = {
+            'parameters': dict(zip(param_names, param_values)),
+            'objective_value': getattr(performance, objective_field)
+        }
+        if keep_performance:
+            result['performance'] = performance
+        return result
+        
+    except Exception as e:
+        return e
+
+
+def _inclusive(bound: float) -> float:
+    """Smallest float above bound, so a bisect_right band ends at bound inclusive"""
+    return float(np.nextafter(bound, np.inf))
+
+
+# Rules behind OptimizationAnalyzer.design_optimization_suggestions, as
+# (suggestion key, source, attribute, band boundaries, band messages). A value
+# falls in band bisect_right(boundaries, value), i.e. bands include their lower
+# bound; a None message means no suggestion for that band.
+_SUGGESTION_RULES = (
+    ('ld_ratio', 'geometry', 'ld_ratio', (2.0, _inclusive(5.0)), (
+        "L/D ratio is low ({value:.1f}). Consider increasing chamber length for better combustion completeness.",
+        "L/D ratio ({value:.1f}) is in good range for pulse jets.",
+        "L/D ratio is high ({value:.1f}). This may cause excessive heat transfer losses and weight.")),
+    ('frequency', 'performance', 'frequency', (30, 50, _inclusive(150), _inclusive(250)), (
+        "Low operating frequency may reduce power density. Consider shortening exhaust length.",
+        None,
+        "Operating frequency ({value:.0f} Hz) is in optimal range.",
+        None,
+        "High operating frequency may cause structural stress and wear. Consider lengthening exhaust.")),
+    ('area_ratio', 'geometry', 'area_ratio', (1.0, 1.2, _inclusive(2.5), _inclusive(3.0)), (
+        "Exhaust area smaller than intake - this may restrict flow and reduce performance.",
+        None,
+        "Area ratio ({value:.2f}) is well-balanced.",
+        None,
+        "Very large exhaust/intake area ratio may affect resonance tuning.")),
+    ('efficiency', 'performance', 'thermal_efficiency', (10, 15, _inclusive(25), _inclusive(35)), (
+        "Low thermal efficiency. Consider optimizing combustion chamber geometry and air-fuel mixing.",
+        None,
+        "Thermal efficiency ({value:.1f}%) is typical for pulse jets.",
+        None,
+        "Excellent thermal efficiency ({value:.1f}%)!")),
+    ('thrust_to_weight', 'performance', 'thrust_to_weight_ratio', (2, _inclusive(8)), (
+        "Low thrust-to-weight ratio. Consider increasing chamber diameter or optimizing valve area.",
+        None,
+        "Excellent thrust-to-weight ratio ({value:.1f})!")),
+    ('specific_impulse', 'performance', 'specific_impulse', (80, _inclusive(200)), (
+        "Low specific impulse indicates poor fuel efficiency. Optimize air-fuel ratio and combustion.",
+        None,
+        "Outstanding specific impulse ({value:.0f} s)!"))
+)
+
+
+# Static content returned by OptimizationAnalyzer.trade_off_analysis, built
+# once and shared read-only
+_TRADE_OFFS = MappingProxyType({
+    'exhaust_length': MappingProxyType({
+        'parameter': 'Exhaust Length',
+        'increase_benefits': (
+            'Lower operating frequency',
+            'Better resonance tuning potential',
+            'Improved expansion efficiency'
+        ),
+        'increase_drawbacks': (
+            'Increased weight and complexity',
+            'Higher heat transfer losses',
+            'More difficult mounting and integration'
+        ),
+        'optimal_range': '2-4 times chamber diameter'
+    }),
+    'chamber_diameter': MappingProxyType({
+        'parameter': 'Chamber Diameter',
+        'increase_benefits': (
+            'Higher thrust potential',
+            'Better combustion volume',
+            'Improved mixing characteristics'
+        ),
+        'increase_drawbacks': (
+            'Increased weight',
+            'Higher fuel consumption',
+            'Larger frontal area'
+        ),
+        'optimal_range': 'L/D ratio of 2.5-4.5'
+    }),
+    'valve_area': MappingProxyType({
+        'parameter': 'Valve Area',
+        'increase_benefits': (
+            'Better engine breathing',
+            'Higher mass flow potential',
+            'Improved performance at high frequencies'
+        ),
+        'increase_drawbacks': (
+            'Structural complexity',
+            'Potential for valve flutter',
+            'Reduced pressure rise'
+        ),
+        'optimal_range': '80-150% of intake area'
+    }),
+    'air_fuel_ratio': MappingProxyType({
+        'parameter': 'Air-Fuel Ratio',
+        'increase_benefits': (
+            'Better fuel economy',
+            'Cleaner combustion',
+            'Lower emissions'
+        ),
+        'increase_drawbacks': (
+            'Reduced power output',
+            'Potential for misfire',
+            'Incomplete combustion'
+        ),
+        'optimal_range': 'Near stoichiometric ratio'
+    })
+})
 
 
 class OptimizationAnalyzer:
@@ -667,6 +1328,27 @@ class OptimizationAnalyzer:
     parameter sweeps, and generating optimization recommendations.
     """
     
+    # Position of the input object that owns each constructor field, in
+    # (geometry, valves, conditions) order
+    _PARAMETER_OWNERS = {
+        f.name: position
+        for position, cls in enumerate((EngineGeometry, ValveSystem, OperatingConditions))
+        for f in fields(cls) if f.init
+    }
+    
+    # parameter_sweep result keys and the PerformanceResults fields they hold
+    _SWEEP_METRICS = (
+        ('thrust', 'thrust'),
+        ('frequency', 'frequency'),
+        ('specific_impulse', 'specific_impulse'),
+        ('thermal_efficiency', 'thermal_efficiency'),
+        ('power', 'power'),
+        ('fuel_consumption', 'fuel_consumption_rate')
+    )
+    
+    # Reads all _SWEEP_METRICS attributes of a PerformanceResults as one tuple
+    _sweep_metric_values = attrgetter(*(attribute for _, attribute in _SWEEP_METRICS))
+    
     def __init__(self, model: PulseJetModel):
         """
         Initialize optimization analyzer
@@ -692,193 +1374,228 @@ class OptimizationAnalyzer:
         Returns:
             dict: Dictionary containing sweep results
         """
-        results = {
-            'parameter_values': parameter_range.tolist(),
-            'thrust': [],
-            'frequency': [],
-            'specific_impulse': [],
-            'thermal_efficiency': [],
-            'power': [],
-            'fuel_consumption': []
-        }
-        
-        for param_value in parameter_range:
-            try:
-                # Create modified configuration
-                if hasattr(base_geometry, parameter_name):
-                    # Geometry parameter
-                    geometry_dict = {
-                        'combustion_chamber_length': base_geometry.combustion_chamber_length,
-                        'combustion_chamber_diameter': base_geometry.combustion_chamber_diameter,
-                        'intake_diameter': base_geometry.intake_diameter,
-                        'exhaust_diameter': base_geometry.exhaust_diameter,
-                        'exhaust_length': base_geometry.exhaust_length
-                    }
-                    geometry_dict[parameter_name] = param_value
-                    geometry = EngineGeometry(**geometry_dict)
-                    valves = base_valves
-                    conditions = base_conditions
+        # Metrics are written by index into one preallocated array; points
+        # that fail keep their zeros
+        metrics = np.zeros((len(self._SWEEP_METRICS), len(parameter_range)))
+        points = range(len(parameter_range))
+        
+        # Numeric model inputs are evaluated for the whole range in one
+        # vectorized pass. Points the dataclasses would reject are then run
+        # one by one, so they warn with the same error as the per-point sweep
+        if (parameter_name in self.model.BATCH_PARAMETERS
+                and base_conditions.fuel_type in self.model.fuel_properties
+                and base_conditions.ambient_temp_kelvin > 0):
+            sweep = self.parameter_sweep_vec(base_geometry, base_valves, base_conditions,
+                                             parameter_name, parameter_range)
+            for row, (name, _) in zip(metrics, self._SWEEP_METRICS):
+                row[:] = sweep[name]
+            
+            values = sweep['parameter_values']
+            if parameter_name == 'ambient_temp':
+                values = values + 273.15
+            points = np.flatnonzero(~(values > 0)).tolist()
+        
+        # Resolve which input object the parameter belongs to once; an
+        # unknown name fails every point without running any analysis
+        owner = self._PARAMETER_OWNERS.get(parameter_name)
+        if owner is None:
+            for param_value in parameter_range:
+                warnings.warn(f"Error in parameter sweep at {parameter_name}={param_value}: "
+                              f"Unknown parameter: {parameter_name}")
+        else:
+            configuration = [base_geometry, base_valves, base_conditions]
+            base_owner = configuration[owner]
+            
+            for i in points:
+                param_value = parameter_range[i]
+                try:
+                    # Create modified configuration
+                    configuration[owner] = replace(base_owner, **{parameter_name: param_value})
                     
-                elif hasattr(base_valves, parameter_name):
-                    # Valve parameter
-                    valve_dict = {
-                        'valve_type': base_valves.valve_type,
-                        'num_valves': base_valves.num_valves,
-                        'valve_area': base_valves.valve_area
-                    }
-                    valve_dict[parameter_name] = param_value
-                    geometry = base_geometry
-                    valves = ValveSystem(**valve_dict)
-                    conditions = base_conditions
+                    # Run analysis
+                    performance = self.model.run_complete_analysis(*configuration)
                     
-                elif hasattr(base_conditions, parameter_name):
-                    # Operating condition parameter
-                    condition_dict = {
-                        'fuel_type': base_conditions.fuel_type,
-                        'air_fuel_ratio': base_conditions.air_fuel_ratio,
-                        'ambient_pressure': base_conditions.ambient_pressure,
-                        'ambient_temp': base_conditions.ambient_temp
-                    }
-                    condition_dict[parameter_name] = param_value
-                    geometry = base_geometry
-                    valves = base_valves
-                    conditions = OperatingConditions(**condition_dict)
+                    # Store results
+                    metrics[:, i] = self._sweep_metric_values(performance)
                     
-                else:
-                    raise ValueError(f"Unknown parameter: {parameter_name}")
-                
-                # Run analysis
-                performance = self.model.run_complete_analysis(geometry, valves, conditions)
-                
-                # Store results
-                results['thrust'].append(performance.thrust)
-                results['frequency'].append(performance.frequency)
-                results['specific_impulse'].append(performance.specific_impulse)
-                results['thermal_efficiency'].append(performance.thermal_efficiency)
-                results['power'].append(performance.power)
-                results['fuel_consumption'].append(performance.fuel_consumption_rate)
-                
-            except Exception as e:
-                # Handle errors gracefully by appending zeros
-                warnings.warn(f"Error in parameter sweep at {parameter_name}={param_value}: {e}")
-                results['thrust'].append(0)
-                results['frequency'].append(0)
-                results['specific_impulse'].append(0)
-                results['thermal_efficiency'].append(0)
-                results['power'].append(0)
-                results['fuel_consumption'].append(0)
+                except Exception as e:
+                    # Handle errors gracefully by leaving zeros
+                    warnings.warn(f"Error in parameter sweep at {parameter_name}={param_value}: {e}")
+        
+        results = {'parameter_values': parameter_range.tolist()}
+        for (name, _), values in zip(self._SWEEP_METRICS, metrics):
+            results[name] = values.tolist()
+        
+        return results
+    
+    def parameter_sweep_vec(self, base_geometry: EngineGeometry, base_valves: ValveSystem,
+                            base_conditions: OperatingConditions,
+                            parameter_name: str, parameter_range: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Perform parameter sweep analysis in a single vectorized pass
+        
+        Same inputs and result keys as parameter_sweep, but every entry is a
+        NumPy array computed by PulseJetModel.run_batch_analysis.
+        
+        Args:
+            base_geometry (EngineGeometry): Base geometry configuration
+            base_valves (ValveSystem): Base valve configuration
+            base_conditions (OperatingConditions): Base operating conditions
+            parameter_name (str): Name of numeric parameter to sweep
+            parameter_range (np.ndarray): Range of parameter values to test
+            
+        Returns:
+            dict: Dictionary containing sweep results as arrays
+        """
+        parameter_range = np.asarray(parameter_range, dtype=float)
+        performance = self.model.run_batch_analysis(
+            base_geometry, base_valves, base_conditions, parameter_name, parameter_range)
+        
+        results = {'parameter_values': parameter_range}
+        for name, attribute in self._SWEEP_METRICS:
+            results[name] = performance[attribute]
         
         return results
     
     def multi_parameter_optimization(self, base_geometry: EngineGeometry, 
                                    base_valves: ValveSystem, base_conditions: OperatingConditions,
                                    parameters: Dict[str, Tuple[float, float]], 
-                                   objective: str = 'thrust') -> Dict[str, Any]:
+                                   objective: str = 'thrust', keep_full: bool = False,
+                                   method: str = 'grid', n_samples: int = 128, seed: Optional[int] = None,
+                                   refine_levels: int = 1) -> Dict[str, Any]:
         """
-        Perform multi-parameter optimization using grid search
+        Perform multi-parameter optimization using grid or sampled search
+        
+        The 'grid' method evaluates 5 points per parameter (5^N in total);
+        'random' and 'sobol' evaluate n_samples points drawn uniformly or from
+        a scrambled Sobol sequence, which covers higher-dimensional spaces far
+        better for the same budget. With refine_levels > 1 the grid method
+        searches coarse-to-fine: a 3-point grid, then refine_levels - 1
+        5-point grids, each spanning one step of the previous grid either side
+        of the best point so far.
+        
+        Searches over numeric geometry fields are evaluated in one batched
+        analysis (PulseJetModel.analyze_grid, parallel when numba is
+        installed); any other search is evaluated point by point.
         
         Args:
             base_geometry (EngineGeometry): Base geometry configuration
             base_valves (ValveSystem): Base valve configuration
             base_conditions (OperatingConditions): Base operating conditions
             parameters (dict): Dictionary of parameter names and their (min, max) ranges
-            objective (str): Objective function ('thrust', 'efficiency', 'specific_impulse')
+            objective (str): Objective function ('thrust', 'efficiency', 'specific_impulse',
+                'specific_fuel_consumption')
+            keep_full (bool): Keep the PerformanceResults of every grid point in
+                all_results; by default only the best configuration has one
+            method (str): Search method ('grid', 'random', 'sobol')
+            n_samples (int): Points to evaluate for 'random' and 'sobol' (rounded
+                up to a power of two for 'sobol')
+            seed (int, optional): Random seed for 'random' and 'sobol'
+            refine_levels (int): Grid passes for 'grid'; 1 is a single 5-point grid
             
         Returns:
             dict: Optimization results including best configuration
+            
+        Raises:
+            ValueError: If method is unknown, or n_samples < 1 for a sampled method
         """
-        best_value = 0 if objective != 'specific_fuel_consumption' else float('inf')
+        objective_field, minimize = _OBJECTIVES.get(objective, _OBJECTIVES['thrust'])
+        best_value = float('inf') if minimize else 0
         best_config = None
-        all_results = []
-        
-        # Simple grid search (for demonstration - real optimization would use better algorithms)
-        grid_points = 5  # Points per parameter
         
-        # Generate parameter combinations
         param_names = list(parameters.keys())
-        param_ranges = []
         
-        for param_name in param_names:
-            min_val, max_val = parameters[param_name]
-            param_ranges.append(np.linspace(min_val, max_val, grid_points))
-        
-        # Evaluate all combinations
-        total_combinations = grid_points ** len(param_names)
-        evaluated = 0
+        # Only geometry fields are varied, resolved once for the whole search;
+        # when they are all numeric model inputs, the whole grid runs as one
+        # batched (prange) analysis
+        geometry_mask = tuple(hasattr(base_geometry, name) for name in param_names)
+        geometry_names = list(itertools.compress(param_names, geometry_mask))
+        evaluate = (self.model, base_geometry, base_valves, base_conditions, param_names,
+                    geometry_mask)
+        batchable = (geometry_names
+                     and all(name in self.model.BATCH_PARAMETERS for name in geometry_names)
+                     and base_conditions.fuel_type in self.model.fuel_properties
+                     and base_conditions.ambient_temp_kelvin > 0)
+        
+        if method == 'grid':
+            # Simple grid search (for demonstration - real optimization would use better algorithms).
+            # With refinement, a coarse 3-point grid comes first and each later
+            # 5-point grid spans one step of the previous grid around the best point
+            passes = max(refine_levels, 1)
+            bounds = [(min(parameters[name]), max(parameters[name])) for name in param_names]
+            ranges = bounds
+        elif method in ('random', 'sobol'):
+            if n_samples < 1:
+                raise ValueError(f"n_samples must be at least 1, got {n_samples}")
+            passes = 1
+        else:
+            raise ValueError(f"Unknown optimization method: {method}")
         
-        def evaluate_combination(param_values):
-            nonlocal best_value, best_config
-            
-            try:
-                # Create configuration with modified parameters
-                geometry = base_geometry
-                valves = base_valves
-                conditions = base_conditions
-                
-                # Apply parameter changes
-                for i, param_name in enumerate(param_names):
-                    param_value = param_values[i]
-                    
-                    if hasattr(base_geometry, param_name):
-                        geometry_dict = {
-                            'combustion_chamber_length': geometry.combustion_chamber_length,
-                            'combustion_chamber_diameter': geometry.combustion_chamber_diameter,
-                            'intake_diameter': geometry.intake_diameter,
-                            'exhaust_diameter': geometry.exhaust_diameter,
-                            'exhaust_length': geometry.exhaust_length
-                        }
-                        geometry_dict[param_name] = param_value
-                        geometry = EngineGeometry(**geometry_dict)
-                
-                # Run analysis
-                performance = self.model.run_complete_analysis(geometry, valves, conditions)
+        all_results = []
+        evaluated = set()  # Points of earlier passes, when refining
+        for level in range(passes):
+            # Generate parameter combinations
+            if method == 'grid':
+                grid_points = 3 if level == 0 and passes > 1 else 5  # Points per parameter
+                # Plain floats: scalar model arithmetic on np.float64 is much slower
+                param_ranges = [np.linspace(low, high, grid_points).tolist() for low, high in ranges]
                 
-                # Evaluate objective
-                if objective == 'thrust':
-                    obj_value = performance.thrust
-                    is_better = obj_value > best_value
-                elif objective == 'efficiency':
-                    obj_value = performance.thermal_efficiency
-                    is_better = obj_value > best_value
-                elif objective == 'specific_impulse':
-                    obj_value = performance.specific_impulse
-                    is_better = obj_value > best_value
-                elif objective == 'specific_fuel_consumption':
-                    obj_value = performance.specific_fuel_consumption
-                    is_better = obj_value < best_value
+                # The grid is generated lazily, in C, for any number of parameters
+                combinations = itertools.product(*param_ranges)
+            else:
+                combinations = self._sample_parameters(parameters, param_names, method,
+                                                       n_samples, seed)
+            
+            if passes > 1:
+                # Refined grids share points with the grids before them; each
+                # point is evaluated (and reported) once
+                combinations = [combination for combination in combinations
+                                if combination not in evaluated]
+                evaluated.update(combinations)
+            
+            # Evaluate all combinations
+            if batchable:
+                outcomes = self._evaluate_grid(base_geometry, base_valves, base_conditions,
+                                               param_names, geometry_mask, list(combinations),
+                                               objective_field, keep_full)
+            else:
+                outcomes = [_evaluate_combination(*evaluate, combination, objective_field, keep_full)
+                            for combination in combinations]
+            
+            level_results = []
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    warnings.warn(f"Error in optimization evaluation: {outcome}")
                 else:
-                    obj_value = performance.thrust
-                    is_better = obj_value > best_value
-                
-                # Store result
-                result = {
-                    'parameters': dict(zip(param_names, param_values)),
-                    'objective_value': obj_value,
-                    'performance': performance
-                }
-                all_results.append(result)
-                
-                # Update best if improved
-                if is_better:
-                    best_value = obj_value
-                    best_config = result
-                    
-            except Exception as e:
-                warnings.warn(f"Error in optimization evaluation: {e}")
-        
-        # Generate and evaluate all combinations
-        if len(param_names) == 1:
-            for val in param_ranges[0]:
-                evaluate_combination([val])
-        elif len(param_names) == 2:
-            for val1 in param_ranges[0]:
-                for val2 in param_ranges[1]:
-                    evaluate_combination([val1, val2])
-        elif len(param_names) == 3:
-            for val1 in param_ranges[0]:
-                for val2 in param_ranges[1]:
-                    for val3 in param_ranges[2]:
-                        evaluate_combination([val1, val2, val3])
+                    level_results.append(outcome)
+            all_results.extend(level_results)
+            
+            # Best point in one serial pass; the first of equal values wins, and
+            # it must strictly improve on the best value so far
+            if level_results:
+                choose = min if minimize else max
+                candidate = choose(level_results, key=lambda result: result['objective_value'])
+                candidate_value = candidate['objective_value']
+                if (candidate_value < best_value) if minimize else (candidate_value > best_value):
+                    best_value = candidate_value
+                    best_config = candidate
+            
+            if best_config is None or level + 1 == passes:
+                break
+            
+            # Narrow each range to one grid step either side of the best
+            # point, within the requested bounds
+            ranges = []
+            for (low, high), (lower_bound, upper_bound), value in zip(
+                    [(row[0], row[-1]) for row in param_ranges], bounds,
+                    best_config['parameters'].values()):
+                step = (high - low) / (grid_points - 1)
+                ranges.append((max(lower_bound, value - step), min(upper_bound, value + step)))
+        
+        if best_config is not None and not keep_full:
+            # Only the best point is re-run for its full results
+            best_config = _evaluate_combination(
+                *evaluate, tuple(best_config['parameters'].values()), objective_field)
         
         return {
             'best_configuration': best_config,
@@ -888,6 +1605,97 @@ class OptimizationAnalyzer:
             'parameters_tested': param_names
         }
     
+    @staticmethod
+    def _sample_parameters(parameters: Dict[str, Tuple[float, float]], param_names: List[str],
+                           method: str, n_samples: int,
+                           seed: Optional[int]) -> List[Tuple[float, ...]]:
+        """
+        Draw sampled search points inside the (min, max) parameter ranges
+        
+        Args:
+            parameters (dict): Parameter names and their (min, max) ranges
+            param_names (list): Order of the parameters in each point
+            method (str): 'random' (uniform) or 'sobol' (scrambled Sobol sequence)
+            n_samples (int): Number of points
+            seed (int, optional): Random seed
+            
+        Returns:
+            list: One tuple of parameter values per point
+        """
+        dimensions = len(param_names)
+        unit_points = None
+        
+        if method == 'sobol':
+            try:
+                from scipy.stats import qmc
+                
+                sampler = qmc.Sobol(d=max(dimensions, 1), scramble=True, seed=seed)
+                m = max(0, math.ceil(math.log2(n_samples)))
+                unit_points = sampler.random_base2(m=m)[:, :dimensions]
+            except ImportError:
+                warnings.warn("SciPy not available for Sobol sampling. Using random sampling.")
+        
+        if unit_points is None:
+            unit_points = np.random.default_rng(seed).random((n_samples, dimensions))
+        
+        lows = np.array([parameters[name][0] for name in param_names], dtype=float)
+        highs = np.array([parameters[name][1] for name in param_names], dtype=float)
+        
+        # Plain float tuples, as the grid method produces
+        return list(map(tuple, (lows + unit_points * (highs - lows)).tolist()))
+    
+    def _evaluate_grid(self, base_geometry: EngineGeometry, base_valves: ValveSystem,
+                       base_conditions: OperatingConditions, param_names: List[str],
+                       geometry_mask: Tuple[bool, ...], combinations: List[Tuple[float, ...]],
+                       objective_field: str, keep_performance: bool = True) -> List[Any]:
+        """
+        Evaluate grid-search points with a single PulseJetModel.analyze_grid call
+        
+        Every varied geometry field must be in PulseJetModel.BATCH_PARAMETERS.
+        Points with a non-positive dimension are passed to
+        _evaluate_combination, which reports the same validation error as
+        the per-point search.
+        
+        Returns:
+            list: One result entry (or exception) per combination, as
+                _evaluate_combination returns
+        """
+        grid = np.array(combinations, dtype=float).reshape(len(combinations), len(param_names))
+        geometry_columns = {name: grid[:, j] for j, name in enumerate(param_names)
+                            if geometry_mask[j]}
+        batch = self.model.analyze_grid(base_geometry, base_valves, base_conditions,
+                                        **geometry_columns)
+        
+        invalid = np.zeros(len(grid), dtype=bool)
+        for column in geometry_columns.values():
+            invalid |= ~(column > 0)
+        
+        objective_values = batch[objective_field].tolist()
+        if keep_performance:
+            columns = [batch[f.name].tolist() for f in fields(PerformanceResults) if f.init]
+            performances = (PerformanceResults(*values) for values in zip(*columns))
+        else:
+            performances = itertools.repeat(None)
+        
+        outcomes = []
+        for combination, is_invalid, objective_value, performance in zip(
+                combinations, invalid.tolist(), objective_values, performances):
+            if is_invalid:
+                outcomes.append(_evaluate_combination(self.model, base_geometry, base_valves,
+                                                      base_conditions, param_names, geometry_mask,
+                                                      combination, objective_field))
+                continue
+            
+            result = {
+                'parameters': dict(zip(param_names, combination)),
+                'objective_value': objective_value
+            }
+            if keep_performance:
+                result['performance'] = performance
+            outcomes.append(result)
+        
+        return outcomes
+    
     def design_optimization_suggestions(self, geometry: EngineGeometry, 
                                       performance: PerformanceResults) -> Dict[str, str]:
         """
@@ -900,58 +1708,22 @@ class OptimizationAnalyzer:
         Returns:
             dict: Dictionary of suggestion categories and recommendations
         """
+        sources = {'geometry': geometry, 'performance': performance}
         suggestions = {}
         
-        # L/D ratio analysis
-        ld_ratio = geometry.ld_ratio
-        if ld_ratio < 2.0:
-            suggestions['ld_ratio'] = f"L/D ratio is low ({ld_ratio:.1f}). Consider increasing chamber length for better combustion completeness."
-        elif ld_ratio > 5.0:
-            suggestions['ld_ratio'] = f"L/D ratio is high ({ld_ratio:.1f}). This may cause excessive heat transfer losses and weight."
-        elif 2.0 <= ld_ratio <= 5.0:
-            suggestions['ld_ratio'] = f"L/D ratio ({ld_ratio:.1f}) is in good range for pulse jets."
-        
-        # Frequency analysis
-        if performance.frequency < 30:
-            suggestions['frequency'] = "Low operating frequency may reduce power density. Consider shortening exhaust length."
-        elif performance.frequency > 250:
-            suggestions['frequency'] = "High operating frequency may cause structural stress and wear. Consider lengthening exhaust."
-        elif 50 <= performance.frequency <= 150:
-            suggestions['frequency'] = f"Operating frequency ({performance.frequency:.0f} Hz) is in optimal range."
-        
-        # Area ratio analysis
-        area_ratio = geometry.area_ratio
-        if area_ratio < 1.0:
-            suggestions['area_ratio'] = "Exhaust area smaller than intake - this may restrict flow and reduce performance."
-        elif area_ratio > 3.0:
-            suggestions['area_ratio'] = "Very large exhaust/intake area ratio may affect resonance tuning."
-        elif 1.2 <= area_ratio <= 2.5:
-            suggestions['area_ratio'] = f"Area ratio ({area_ratio:.2f}) is well-balanced."
-        
-        # Efficiency analysis
-        if performance.thermal_efficiency < 10:
-            suggestions['efficiency'] = "Low thermal efficiency. Consider optimizing combustion chamber geometry and air-fuel mixing."
-        elif performance.thermal_efficiency > 35:
-            suggestions['efficiency'] = f"Excellent thermal efficiency ({performance.thermal_efficiency:.1f}%)!"
-        elif 15 <= performance.thermal_efficiency <= 25:
-            suggestions['efficiency'] = f"Thermal efficiency ({performance.thermal_efficiency:.1f}%) is typical for pulse jets."
-        
-        # Thrust-to-weight analysis
-        if performance.thrust_to_weight_ratio < 2:
-            suggestions['thrust_to_weight'] = "Low thrust-to-weight ratio. Consider increasing chamber diameter or optimizing valve area."
-        elif performance.thrust_to_weight_ratio > 8:
-            suggestions['thrust_to_weight'] = f"Excellent thrust-to-weight ratio ({performance.thrust_to_weight_ratio:.1f})!"
-        
-        # Specific impulse analysis
-        if performance.specific_impulse < 80:
-            suggestions['specific_impulse'] = "Low specific impulse indicates poor fuel efficiency. Optimize air-fuel ratio and combustion."
-        elif performance.specific_impulse > 200:
-            suggestions['specific_impulse'] = f"Outstanding specific impulse ({performance.specific_impulse:.0f} s)!"
+        # One band lookup per rule; NaN values match no band
+        for key, source, attribute, boundaries, messages in _SUGGESTION_RULES:
+            value = getattr(sources[source], attribute)
+            if math.isnan(value):
+                continue
+            message = messages[bisect.bisect_right(boundaries, value)]
+            if message is not None:
+                suggestions[key] = message.format(value=value)
         
         return suggestions
     
     def trade_off_analysis(self, geometry: EngineGeometry, valves: ValveSystem,
-                          conditions: OperatingConditions) -> Dict[str, Dict]:
+                          conditions: OperatingConditions) -> Mapping[str, Mapping[str, Any]]:
         """
         Analyze design trade-offs for key parameters
         
@@ -961,68 +1733,10 @@ class OptimizationAnalyzer:
             conditions (OperatingConditions): Operating conditions
             
         Returns:
-            dict: Trade-off analysis results
+            mapping: Trade-off analysis results (shared and read-only; benefit
+                and drawback lists are tuples)
         """
-        trade_offs = {
-            'exhaust_length': {
-                'parameter': 'Exhaust Length',
-                'increase_benefits': [
-                    'Lower operating frequency',
-                    'Better resonance tuning potential',
-                    'Improved expansion efficiency'
-                ],
-                'increase_drawbacks': [
-                    'Increased weight and complexity',
-                    'Higher heat transfer losses',
-                    'More difficult mounting and integration'
-                ],
-                'optimal_range': '2-4 times chamber diameter'
-            },
-            'chamber_diameter': {
-                'parameter': 'Chamber Diameter',
-                'increase_benefits': [
-                    'Higher thrust potential',
-                    'Better combustion volume',
-                    'Improved mixing characteristics'
-                ],
-                'increase_drawbacks': [
-                    'Increased weight',
-                    'Higher fuel consumption',
-                    'Larger frontal area'
-                ],
-                'optimal_range': 'L/D ratio of 2.5-4.5'
-            },
-            'valve_area': {
-                'parameter': 'Valve Area',
-                'increase_benefits': [
-                    'Better engine breathing',
-                    'Higher mass flow potential',
-                    'Improved performance at high frequencies'
-                ],
-                'increase_drawbacks': [
-                    'Structural complexity',
-                    'Potential for valve flutter',
-                    'Reduced pressure rise'
-                ],
-                'optimal_range': '80-150% of intake area'
-            },
-            'air_fuel_ratio': {
-                'parameter': 'Air-Fuel Ratio',
-                'increase_benefits': [
-                    'Better fuel economy',
-                    'Cleaner combustion',
-                    'Lower emissions'
-                ],
-                'increase_drawbacks': [
-                    'Reduced power output',
-                    'Potential for misfire',
-                    'Incomplete combustion'
-                ],
-                'optimal_range': 'Near stoichiometric ratio'
-            }
-        }
-        
-        return trade_offs
+        return _TRADE_OFFS
     
     def sensitivity_analysis(self, geometry: EngineGeometry, valves: ValveSystem,
                            conditions: OperatingConditions, 
@@ -1043,14 +1757,43 @@ class OptimizationAnalyzer:
             parameters = ['exhaust_length', 'combustion_chamber_diameter', 
                          'air_fuel_ratio', 'valve_area']
         
-        # Get baseline performance
-        baseline = self.model.run_complete_analysis(geometry, valves, conditions)
-        baseline_thrust = baseline.thrust
+        delta_percent = 0.01  # 1% change
+        
+        # Numeric model inputs are perturbed together in one batched call:
+        # point 0 is the baseline and point k+1 perturbs only parameter k
+        batched = []
+        if conditions.fuel_type in self.model.fuel_properties:
+            batched = list(dict.fromkeys(
+                param_name for param_name in parameters
+                if param_name in self.model.BATCH_PARAMETERS))
         
         sensitivity = {}
-        delta_percent = 0.01  # 1% change
+        if batched:
+            points = len(batched) + 1
+            arrays = {}
+            for k, param_name in enumerate(batched):
+                owner = (geometry, valves, conditions)[self._PARAMETER_OWNERS[param_name]]
+                current_value = getattr(owner, param_name)
+                column = np.full(points, current_value, dtype=float)
+                column[k + 1] = current_value + current_value * delta_percent
+                arrays[param_name] = column
+            
+            thrust = self.model.analyze_grid(geometry, valves, conditions, **arrays)['thrust']
+            baseline_thrust = thrust[0]
+            if baseline_thrust > 0:
+                thrust_change_percent = ((thrust[1:] - baseline_thrust) / baseline_thrust) * 100
+                coefficients = (thrust_change_percent / (delta_percent * 100)).tolist()
+            else:
+                coefficients = [0] * len(batched)
+            sensitivity.update(zip(batched, coefficients))
+        
+        # Remaining parameters are perturbed one scalar analysis at a time
+        baseline_thrust = None
         
         for param_name in parameters:
+            if param_name in sensitivity:
+                continue
+            
             try:
                 # Get current parameter value
                 if hasattr(geometry, param_name):
@@ -1065,44 +1808,27 @@ class OptimizationAnalyzer:
                 else:
                     continue
                 
+                # Get baseline performance on first use
+                if baseline_thrust is None:
+                    baseline_thrust = self.model.run_complete_analysis(geometry, valves, conditions).thrust
+                
                 # Calculate perturbed value
                 delta_value = current_value * delta_percent
                 perturbed_value = current_value + delta_value
                 
                 # Create perturbed configuration
                 if obj == geometry:
-                    geometry_dict = {
-                        'combustion_chamber_length': geometry.combustion_chamber_length,
-                        'combustion_chamber_diameter': geometry.combustion_chamber_diameter,
-                        'intake_diameter': geometry.intake_diameter,
-                        'exhaust_diameter': geometry.exhaust_diameter,
-                        'exhaust_length': geometry.exhaust_length
-                    }
-                    geometry_dict[param_name] = perturbed_value
-                    perturbed_geometry = EngineGeometry(**geometry_dict)
+                    perturbed_geometry = replace(geometry, **{param_name: perturbed_value})
                     perturbed_valves = valves
                     perturbed_conditions = conditions
                 elif obj == valves:
-                    valve_dict = {
-                        'valve_type': valves.valve_type,
-                        'num_valves': valves.num_valves,
-                        'valve_area': valves.valve_area
-                    }
-                    valve_dict[param_name] = perturbed_value
                     perturbed_geometry = geometry
-                    perturbed_valves = ValveSystem(**valve_dict)
+                    perturbed_valves = replace(valves, **{param_name: perturbed_value})
                     perturbed_conditions = conditions
                 else:  # conditions
-                    condition_dict = {
-                        'fuel_type': conditions.fuel_type,
-                        'air_fuel_ratio': conditions.air_fuel_ratio,
-                        'ambient_pressure': conditions.ambient_pressure,
-                        'ambient_temp': conditions.ambient_temp
-                    }
-                    condition_dict[param_name] = perturbed_value
                     perturbed_geometry = geometry
                     perturbed_valves = valves
-                    perturbed_conditions = OperatingConditions(**condition_dict)
+                    perturbed_conditions = replace(conditions, **{param_name: perturbed_value})
                 
                 # Run perturbed analysis
                 perturbed_results = self.model.run_complete_analysis(
@@ -1121,7 +1847,9 @@ class OptimizationAnalyzer:
                 warnings.warn(f"Error in sensitivity analysis for {param_name}: {e}")
                 sensitivity[param_name] = 0
         
-        return sensitivity
+        # Report in the order the parameters were requested
+        return {param_name: sensitivity[param_name]
+                for param_name in parameters if param_name in sensitivity}
 
 
 # Utility functions for model validation and testing
@@ -1214,5 +1942,6 @@ __all__ = [
     'PulseJetModel',
     'OptimizationAnalyzer',
     'validate_model_inputs',
-    'create_performance_summary'
+    'create_performance_summary',
+    'warm_up_kernels'
 ]
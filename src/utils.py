@@ -45,17 +45,22 @@ License: MIT
 Version: 1.0.0
 """
 
+import copy
+import csv
 import json
 import yaml
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Union, Optional, Tuple
 import warnings
 from datetime import datetime
-import csv
+import importlib
+import importlib.util
 import io
 import math
+import os
 import re
 
 # Try to import streamlit for UI functions, with fallback
@@ -76,6 +81,128 @@ except ImportError:
         def info(msg): print(f"INFO: {msg}")
     st = MockStreamlit()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Use orjson for JSON encoding and decoding when available, with stdlib json as fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# openpyxl is only needed for Excel export; probe for it without paying its
+# import cost at startup (pandas imports it when the writer is created)
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+
+# scipy submodules by name, imported on first use; None records a failed import
+_SCIPY_MODULES: Dict[str, Any] = {}
+
+
+def _scipy(submodule: str) -> Any:
+    """
+    Return scipy.<submodule>, importing it on first use
+    
+    Raises:
+        ImportError: If scipy (or the submodule) is not installed; the failed
+            import is remembered, so later calls raise without searching again
+    """
+    if submodule not in _SCIPY_MODULES:
+        try:
+            _SCIPY_MODULES[submodule] = importlib.import_module(f'scipy.{submodule}')
+        except ImportError:
+            _SCIPY_MODULES[submodule] = None
+    
+    module = _SCIPY_MODULES[submodule]
+    if module is None:
+        raise ImportError(f"No module named 'scipy.{submodule}'")
+    return module
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether obj contains a NaN or infinite float anywhere (numpy included)"""
+    if isinstance(obj, (float, np.floating)):
+        return not math.isfinite(obj)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'f':
+            return not np.isfinite(obj).all()
+        return obj.dtype.kind == 'O' and any(map(_has_non_finite, obj.flat))
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return False
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON bytes (numpy scalars/arrays allowed)
+    
+    orjson writes NaN and infinities as null, so payloads containing them go
+    through stdlib json, which writes NaN/Infinity and reads them back.
+    """
+    if ORJSON_AVAILABLE and not _has_non_finite(data):
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _loads_json(data: bytes) -> Any:
+    """Decode JSON bytes"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which only stdlib json accepts
+    return json.loads(data)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for numpy types with stdlib json"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Parsed file contents keyed by (absolute path, parser), each stored with the
+# (st_mtime_ns, st_size) it was read at. Streamlit calls the loaders on every
+# rerun, so an unchanged file costs one stat() and a copy instead of a parse.
+_PARSE_CACHE: Dict[Tuple[str, Any], Tuple[Tuple[int, int], Any]] = {}
+_PARSE_CACHE_SIZE = 64
+
+
+def _parse_yaml(data: bytes) -> Any:
+    """Parse YAML document bytes"""
+    return yaml.load(data, Loader=_YAML_LOADER)
+
+
+def _cached_parse(path: Path, parser) -> Any:
+    """
+    Parse a file, reusing the previous result while its mtime and size are unchanged
+    
+    Each call returns a deep copy, so callers may modify the result without
+    affecting the cache. Parse errors propagate and are not cached.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (os.path.abspath(path), parser)
+    
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+    
+    parsed = parser(Path(path).read_bytes())
+    _PARSE_CACHE.pop(key, None)
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+    _PARSE_CACHE[key] = (signature, parsed)
+    return copy.deepcopy(parsed)
+
 
 # Configuration Management Functions
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
@@ -98,9 +225,8 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
             st.warning(f"Configuration file {config_path} not found. Using defaults.")
             return get_default_config()
         
-        with open(config_file, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
-            
+        config = _cached_parse(config_file, _parse_yaml)
+        
         # Validate configuration structure
         if not isinstance(config, dict):
             raise ValueError("Configuration file must contain a dictionary")
@@ -211,8 +337,7 @@ def save_configuration(config_data: Dict[str, Any], filename: str,
         
         # Save to file
         filepath = config_dir / f"{filename}.json"
-        with open(filepath, 'w', encoding='utf-8') as file:
-            json.dump(enhanced_config, file, indent=2, ensure_ascii=False)
+        filepath.write_bytes(_dumps_json(enhanced_config))
             
         return True
         
@@ -243,9 +368,8 @@ def load_configuration(filename: str, directory: str = "saved_configs") -> Dict[
             st.error(f"Configuration file {filename} not found.")
             return {}
             
-        with open(filepath, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            
+        data = _cached_parse(filepath, _loads_json)
+        
         # Extract configuration from enhanced format or return as-is
         if 'configuration' in data:
             return data['configuration']
@@ -271,16 +395,16 @@ def list_saved_configurations(directory: str = "saved_configs") -> List[str]:
         list: List of configuration filenames (without extension)
     """
     try:
-        config_dir = Path(directory)
-        if not config_dir.exists():
-            return []
-            
-        config_files = []
-        for file_path in config_dir.glob("*.json"):
-            config_files.append(file_path.stem)
-            
-        return sorted(config_files)
-        
+        # scandir entries carry the file type from the directory listing, so
+        # filtering needs no per-file stat() or Path objects
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            )
+        
+    except (FileNotFoundError, NotADirectoryError):
+        return []
     except Exception as e:
         st.warning(f"Error listing configurations: {e}")
         return []
@@ -300,9 +424,8 @@ def load_fuel_properties(file_path: str = "data/fuel_properties.json") -> Dict[s
     try:
         fuel_file = Path(file_path)
         if fuel_file.exists():
-            with open(fuel_file, 'r', encoding='utf-8') as file:
-                fuel_data = json.load(file)
-                
+            fuel_data = _cached_parse(fuel_file, _loads_json)
+            
             # Validate fuel data structure
             if validate_fuel_properties(fuel_data):
                 return fuel_data
@@ -415,7 +538,7 @@ def validate_fuel_properties(fuel_data: Dict[str, Dict]) -> bool:
 
 # Export and Import Functions
 def export_results_to_csv(results_dict: Dict[str, Any], filename: str = None, 
-                         directory: str = "exports") -> str:
+                         directory: str = "exports") -> bytes:
     """
     Export results to CSV format with enhanced formatting
     
@@ -425,7 +548,7 @@ def export_results_to_csv(results_dict: Dict[str, Any], filename: str = None,
         directory (str): Export directory
         
     Returns:
-        str: CSV data as string
+        bytes: UTF-8 encoded CSV data
     """
     try:
         # Generate filename if not provided
@@ -438,18 +561,20 @@ def export_results_to_csv(results_dict: Dict[str, Any], filename: str = None,
         export_dir.mkdir(parents=True, exist_ok=True)
         
         # Prepare data for CSV
-        csv_data = []
+        header = ['Parameter', 'Value']
+        result_rows = []
         for key, value in results_dict.items():
             # Format key for better readability
             formatted_key = format_parameter_name(key)
             
             # Format value with appropriate precision
             if isinstance(value, float):
-                if abs(value) < 0.001:
+                magnitude = abs(value)
+                if magnitude < 0.001:
                     formatted_value = f"{value:.6f}"
-                elif abs(value) < 1:
+                elif magnitude < 1:
                     formatted_value = f"{value:.4f}"
-                elif abs(value) < 100:
+                elif magnitude < 100:
                     formatted_value = f"{value:.2f}"
                 else:
                     formatted_value = f"{value:.1f}"
@@ -461,31 +586,46 @@ def export_results_to_csv(results_dict: Dict[str, Any], filename: str = None,
             if units:
                 formatted_value += f" {units}"
             
-            csv_data.append([formatted_key, formatted_value])
-        
-        # Add metadata
-        csv_data.insert(0, ['Parameter', 'Value'])
-        csv_data.insert(1, ['Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-        csv_data.insert(2, ['Software', 'Pulse Jet Modeler v1.0.0'])
-        csv_data.insert(3, ['', ''])  # Empty row for separation
-        
-        # Create DataFrame and save
-        df = pd.DataFrame(csv_data[4:], columns=['Parameter', 'Value'])
+            result_rows.append([formatted_key, formatted_value])
         
-        # Save to file
+        # Save the results rows to file
         filepath = export_dir / filename
-        df.to_csv(filepath, index=False)
-        
-        # Return CSV string
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerows(csv_data)
-        
-        return output.getvalue()
+        with open(filepath, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file, lineterminator=os.linesep)
+            writer.writerow(header)
+            writer.writerows(result_rows)
+        
+        # Returned CSV carries metadata rows ahead of the results
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows((
+            header,
+            ['Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Software', 'Pulse Jet Modeler v1.0.0'],
+            ['', ''],  # Empty row for separation
+        ))
+        writer.writerows(result_rows)
+        
+        return buffer.getvalue().encode('utf-8')
         
     except Exception as e:
         st.error(f"Error exporting results: {e}")
-        return ""
+        return b""
+
+
+def _excel_value(value: Any) -> Any:
+    """Map a value to what pandas' to_excel would store in its cell"""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        if math.isnan(value):
+            return None  # Empty cell
+        if math.isinf(value):
+            return 'inf' if value > 0 else '-inf'
+        return value.item() if isinstance(value, np.generic) else value
+    if value is None or isinstance(value, (str, datetime)):
+        return value
+    return str(value)
 
 
 def export_results_to_excel(results_dict: Dict[str, Any], filename: str = None,
@@ -503,9 +643,7 @@ def export_results_to_excel(results_dict: Dict[str, Any], filename: str = None,
     """
     try:
         # Check if openpyxl is available
-        try:
-            import openpyxl
-        except ImportError:
+        if not OPENPYXL_AVAILABLE:
             st.warning("openpyxl not available. Install with: pip install openpyxl")
             return False
         
@@ -518,24 +656,30 @@ def export_results_to_excel(results_dict: Dict[str, Any], filename: str = None,
         export_dir = Path(directory)
         export_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create Excel writer
-        filepath = export_dir / filename
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # Main results sheet
-            results_df = pd.DataFrame([results_dict]).T
-            results_df.columns = ['Value']
-            results_df.index.name = 'Parameter'
-            results_df.to_excel(writer, sheet_name='Performance Results')
-            
-            # Metadata sheet
-            metadata = {
-                'Generated': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-                'Software': ['Pulse Jet Modeler v1.0.0'],
-                'Version': ['1.0.0'],
-                'Description': ['Pulse jet engine performance analysis results']
-            }
-            metadata_df = pd.DataFrame(metadata)
-            metadata_df.to_excel(writer, sheet_name='Metadata', index=False)
+        # Write the sheets row by row with a write-only workbook (no
+        # DataFrames, no in-memory cell grid)
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        
+        # Main results sheet
+        results_sheet = workbook.create_sheet('Performance Results')
+        results_sheet.append(('Parameter', 'Value'))
+        for key, value in results_dict.items():
+            results_sheet.append((_excel_value(key), _excel_value(value)))
+        
+        # Metadata sheet
+        metadata = {
+            'Generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'Software': 'Pulse Jet Modeler v1.0.0',
+            'Version': '1.0.0',
+            'Description': 'Pulse jet engine performance analysis results'
+        }
+        metadata_sheet = workbook.create_sheet('Metadata')
+        metadata_sheet.append(tuple(metadata))
+        metadata_sheet.append(tuple(metadata.values()))
+        
+        workbook.save(export_dir / filename)
         
         return True
         
@@ -544,6 +688,10 @@ def export_results_to_excel(results_dict: Dict[str, Any], filename: str = None,
         return False
 
 
+# Everything except the characters of a plain decimal number
+_UNIT_STRIP_RE = re.compile(r'[^\d.-]')
+
+
 def import_configuration_from_csv(filepath: str) -> Dict[str, Any]:
     """
     Import configuration from CSV file
@@ -557,16 +705,14 @@ def import_configuration_from_csv(filepath: str) -> Dict[str, Any]:
     try:
         df = pd.read_csv(filepath)
         
-        # Convert back to dictionary format
+        # Convert back to dictionary format, walking the two columns directly
+        # rather than materializing a Series per row
         config = {}
-        for _, row in df.iterrows():
-            key = row.iloc[0]
-            value = row.iloc[1]
-            
+        for key, value in zip(df.iloc[:, 0].tolist(), df.iloc[:, 1].tolist()):
             # Try to convert to appropriate type
             if isinstance(value, str):
                 # Remove units and convert to float if possible
-                clean_value = re.sub(r'[^\d.-]', '', value)
+                clean_value = _UNIT_STRIP_RE.sub('', value)
                 try:
                     value = float(clean_value)
                 except ValueError:
@@ -582,6 +728,20 @@ def import_configuration_from_csv(filepath: str) -> Dict[str, Any]:
 
 
 # Mathematical Utility Functions
+# Design score terms as (metric, weight, reference value for normalization).
+# Weights sum to 1.0 and follow typical pulse jet design priorities; a None
+# reference scores the metric by distance from _FREQUENCY_RANGE instead.
+_DESIGN_SCORE_TERMS = (
+    ('thrust', 0.25, 100.0),                 # Primary performance metric, N
+    ('specific_impulse', 0.20, 150.0),       # Fuel efficiency, s
+    ('thermal_efficiency', 0.20, 25.0),      # Energy conversion efficiency, %
+    ('frequency', 0.15, None),               # Operating characteristics, Hz
+    ('thrust_to_weight_ratio', 0.10, 3.0),   # Power density
+    ('power', 0.10, 10.0),                   # Absolute power output, kW
+)
+_FREQUENCY_RANGE = (80, 120)  # Hz
+
+
 def calculate_design_score(performance_results: Dict[str, float]) -> float:
     """
     Calculate overall design score based on performance metrics
@@ -596,54 +756,20 @@ def calculate_design_score(performance_results: Dict[str, float]) -> float:
         float: Design score (0-100)
     """
     try:
-        # Scoring weights (must sum to 1.0)
-        weights = {
-            'thrust': 0.25,              # Primary performance metric
-            'specific_impulse': 0.20,    # Fuel efficiency
-            'thermal_efficiency': 0.20,  # Energy conversion efficiency
-            'frequency': 0.15,           # Operating characteristics
-            'thrust_to_weight_ratio': 0.10,  # Power density
-            'power': 0.10                # Absolute power output
-        }
-        
-        # Reference values for normalization (typical good values)
-        references = {
-            'thrust': 100.0,                    # N
-            'specific_impulse': 150.0,          # s
-            'thermal_efficiency': 25.0,         # %
-            'frequency': 100.0,                 # Hz (optimal range center)
-            'thrust_to_weight_ratio': 3.0,      # Dimensionless
-            'power': 10.0                       # kW
-        }
-        
-        # Calculate normalized scores
-        normalized_scores = {}
-        
-        for metric, weight in weights.items():
-            if metric in performance_results:
-                value = performance_results[metric]
-                reference = references[metric]
-                
-                if metric == 'frequency':
-                    # Frequency has an optimal range (80-120 Hz)
-                    if 80 <= value <= 120:
-                        normalized_scores[metric] = 1.0
-                    else:
-                        # Penalty for being outside optimal range
-                        distance = min(abs(value - 80), abs(value - 120))
-                        normalized_scores[metric] = max(0, 1.0 - distance / 50)
-                else:
-                    # Linear normalization with saturation at reference value
-                    normalized_scores[metric] = min(value / reference, 1.0)
+        # Weighted sum of normalized scores, in table order
+        total_score = 0.0
+        for metric, weight, reference in _DESIGN_SCORE_TERMS:
+            if metric not in performance_results:
+                continue
+            value = performance_results[metric]
+            
+            if reference is None:
+                # Optimal range with a linear penalty by distance outside it
+                distance = max(_FREQUENCY_RANGE[0] - value, value - _FREQUENCY_RANGE[1], 0)
+                total_score += weight * max(0, 1.0 - distance / 50)
             else:
-                normalized_scores[metric] = 0.0
-        
-        # Calculate weighted score
-        total_score = sum(weights[metric] * normalized_scores[metric] 
-                         for metric in weights.keys())
-        
-        # Convert to percentage and apply quality curve
-        score_percentage = total_score * 100
+                # Linear normalization with saturation at reference value
+                total_score += weight * min(value / reference, 1.0)
         
         # Apply a quality curve to make scores more discriminating
         # This makes it harder to achieve very high scores
@@ -672,7 +798,7 @@ def interpolate_data(x_data: np.ndarray, y_data: np.ndarray,
         float or np.ndarray: Interpolated values
     """
     try:
-        from scipy import interpolate
+        interpolate = _scipy('interpolate')
         
         if method == 'linear':
             f = interpolate.interp1d(x_data, y_data, kind='linear', 
@@ -696,6 +822,32 @@ def interpolate_data(x_data: np.ndarray, y_data: np.ndarray,
         return x_new * 0  # Return zeros with same shape
 
 
+# Window size from which the cumulative-sum moving average beats np.convolve
+_CUMSUM_MIN_WINDOW = 32
+
+
+def _moving_average(data: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    Centered moving average, equal to np.convolve(data, ones/window_size, mode='same')
+    
+    Wide windows over at least window_size points use a running sum (O(N)
+    instead of O(N*W)); the cumulative sum is stored with window_size // 2
+    leading zeros and trailing copies of the total, so the zero-padded edges
+    of mode='same' fall out of one subtraction. Shorter data goes through
+    np.convolve, whose 'same' output then has window_size elements.
+    """
+    data = np.asarray(data)
+    n = len(data)
+    if window_size < _CUMSUM_MIN_WINDOW or window_size > n:
+        return np.convolve(data, np.ones(window_size)/window_size, mode='same')
+    
+    lead = window_size // 2
+    cumulative = np.zeros(n + window_size, dtype=np.result_type(data, float))
+    np.cumsum(data, out=cumulative[lead + 1:lead + 1 + n])
+    cumulative[lead + 1 + n:] = cumulative[lead + n]
+    return (cumulative[window_size:] - cumulative[:n]) / window_size
+
+
 def smooth_data(data: np.ndarray, window_size: int = 5, method: str = 'moving_average') -> np.ndarray:
     """
     Smooth data using various methods
@@ -714,31 +866,56 @@ def smooth_data(data: np.ndarray, window_size: int = 5, method: str = 'moving_av
         
         if method == 'moving_average':
             # Simple moving average
-            smoothed = np.convolve(data, np.ones(window_size)/window_size, mode='same')
+            smoothed = _moving_average(data, window_size)
         elif method == 'gaussian':
             # Gaussian smoothing
-            from scipy import ndimage
+            ndimage = _scipy('ndimage')
             sigma = window_size / 3.0
             smoothed = ndimage.gaussian_filter1d(data, sigma)
         elif method == 'savgol':
             # Savitzky-Golay filter
-            from scipy import signal
+            signal = _scipy('signal')
             smoothed = signal.savgol_filter(data, window_size, 3)
         else:
             st.warning(f"Unknown smoothing method: {method}. Using moving average.")
-            smoothed = np.convolve(data, np.ones(window_size)/window_size, mode='same')
+            smoothed = _moving_average(data, window_size)
         
         return smoothed
         
     except ImportError:
         st.warning("SciPy not available for advanced smoothing. Using simple moving average.")
-        return np.convolve(data, np.ones(window_size)/window_size, mode='same')
+        return _moving_average(data, window_size)
     except Exception as e:
         st.error(f"Error in data smoothing: {e}")
         return data
 
 
 # Unit Conversion Functions
+# Factors to each dimension's base unit (m, kg, Pa)
+_LENGTH_TO_METERS = {
+    'mm': 0.001, 'cm': 0.01, 'm': 1.0, 'km': 1000.0,
+    'in': 0.0254, 'ft': 0.3048, 'yd': 0.9144, 'mi': 1609.34
+}
+_MASS_TO_KG = {
+    'g': 0.001, 'kg': 1.0, 'lb': 0.453592, 'oz': 0.0283495, 't': 1000.0
+}
+_PRESSURE_TO_PA = {
+    'Pa': 1.0, 'kPa': 1000.0, 'MPa': 1e6, 'bar': 1e5,
+    'psi': 6894.76, 'atm': 101325.0, 'mmHg': 133.322, 'Torr': 133.322
+}
+_TEMPERATURE_UNITS = frozenset(('C', 'F', 'K'))
+
+# (from_unit, to_unit) -> (from factor, to factor) for every same-dimension
+# pair, so a conversion is one lookup. The factors are kept separate rather
+# than pre-divided so results match converting through the base unit exactly.
+_UNIT_PAIR_FACTORS = {
+    (from_unit, to_unit): (from_factor, to_factor)
+    for table in (_LENGTH_TO_METERS, _MASS_TO_KG, _PRESSURE_TO_PA)
+    for from_unit, from_factor in table.items()
+    for to_unit, to_factor in table.items()
+}
+
+
 def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     """
     Convert between different units
@@ -751,39 +928,14 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     Returns:
         float: Converted value
     """
-    # Length conversions
-    length_to_meters = {
-        'mm': 0.001, 'cm': 0.01, 'm': 1.0, 'km': 1000.0,
-        'in': 0.0254, 'ft': 0.3048, 'yd': 0.9144, 'mi': 1609.34
-    }
-    
-    # Mass conversions
-    mass_to_kg = {
-        'g': 0.001, 'kg': 1.0, 'lb': 0.453592, 'oz': 0.0283495, 't': 1000.0
-    }
-    
-    # Pressure conversions
-    pressure_to_pa = {
-        'Pa': 1.0, 'kPa': 1000.0, 'MPa': 1e6, 'bar': 1e5,
-        'psi': 6894.76, 'atm': 101325.0, 'mmHg': 133.322, 'Torr': 133.322
-    }
-    
     # Temperature conversions (special case)
-    if from_unit in ['C', 'F', 'K'] and to_unit in ['C', 'F', 'K']:
+    if from_unit in _TEMPERATURE_UNITS and to_unit in _TEMPERATURE_UNITS:
         return convert_temperature(value, from_unit, to_unit)
     
-    # General conversion using dictionaries
-    conversion_tables = {
-        'length': length_to_meters,
-        'mass': mass_to_kg,
-        'pressure': pressure_to_pa
-    }
-    
-    for table_name, table in conversion_tables.items():
-        if from_unit in table and to_unit in table:
-            # Convert to base unit then to target unit
-            base_value = value * table[from_unit]
-            return base_value / table[to_unit]
+    factors = _UNIT_PAIR_FACTORS.get((from_unit, to_unit))
+    if factors is not None:
+        # Convert to base unit then to target unit
+        return value * factors[0] / factors[1]
     
     # If no conversion found, return original value
     st.warning(f"No conversion available from {from_unit} to {to_unit}")
@@ -835,27 +987,22 @@ def format_parameter_value(value: float, unit: str = "", decimals: int = 2,
         str: Formatted value string
     """
     try:
-        if math.isnan(value) or math.isinf(value):
+        magnitude = abs(value)
+        if magnitude == math.inf or value != value:  # inf or NaN
             return f"--{' ' + unit if unit else ''}"
         
-        if use_si_prefix and abs(value) >= 1000:
-            if abs(value) >= 1000000000:
-                formatted_value = f"{value/1000000000:.{decimals}f}G"
-            elif abs(value) >= 1000000:
-                formatted_value = f"{value/1000000:.{decimals}f}M"
-            elif abs(value) >= 1000:
-                formatted_value = f"{value/1000:.{decimals}f}k"
-            else:
-                formatted_value = f"{value:.{decimals}f}"
-        elif use_si_prefix and abs(value) < 1 and value != 0:
-            if abs(value) < 0.001:
-                formatted_value = f"{value*1000000:.{decimals}f}μ"
-            elif abs(value) < 1:
-                formatted_value = f"{value*1000:.{decimals}f}m"
-            else:
-                formatted_value = f"{value:.{decimals}f}"
-        else:
+        if not use_si_prefix or 1 <= magnitude < 1000 or value == 0:
             formatted_value = f"{value:.{decimals}f}"
+        elif magnitude >= 1000000000:
+            formatted_value = f"{value/1000000000:.{decimals}f}G"
+        elif magnitude >= 1000000:
+            formatted_value = f"{value/1000000:.{decimals}f}M"
+        elif magnitude >= 1000:
+            formatted_value = f"{value/1000:.{decimals}f}k"
+        elif magnitude < 0.001:
+            formatted_value = f"{value*1000000:.{decimals}f}μ"
+        else:
+            formatted_value = f"{value*1000:.{decimals}f}m"
         
         return f"{formatted_value}{' ' + unit if unit else ''}"
         
@@ -864,6 +1011,64 @@ def format_parameter_value(value: float, unit: str = "", decimals: int = 2,
         return f"{value}{' ' + unit if unit else ''}"
 
 
+# Display names and units for known parameters (read-only)
+_PARAMETER_NAMES = MappingProxyType({
+    'thrust': 'Thrust',
+    'specific_impulse': 'Specific Impulse',
+    'thermal_efficiency': 'Thermal Efficiency',
+    'frequency': 'Operating Frequency',
+    'air_mass_flow': 'Air Mass Flow',
+    'fuel_mass_flow': 'Fuel Mass Flow',
+    'exhaust_velocity': 'Exhaust Velocity',
+    'power': 'Power Output',
+    'combustion_volume': 'Combustion Volume',
+    'intake_area': 'Intake Area',
+    'exhaust_area': 'Exhaust Area',
+    'combustion_chamber_length': 'Chamber Length',
+    'combustion_chamber_diameter': 'Chamber Diameter',
+    'intake_diameter': 'Intake Diameter',
+    'exhaust_diameter': 'Exhaust Diameter',
+    'exhaust_length': 'Exhaust Length',
+    'valve_area': 'Valve Area',
+    'num_valves': 'Number of Valves',
+    'air_fuel_ratio': 'Air-Fuel Ratio',
+    'ambient_pressure': 'Ambient Pressure',
+    'ambient_temp': 'Ambient Temperature',
+    'fuel_consumption_rate': 'Fuel Consumption Rate',
+    'specific_fuel_consumption': 'Specific Fuel Consumption',
+    'thrust_to_weight_ratio': 'Thrust-to-Weight Ratio',
+    'power_to_weight_ratio': 'Power-to-Weight Ratio'
+})
+
+_PARAMETER_UNITS = MappingProxyType({
+    'thrust': 'N',
+    'specific_impulse': 's',
+    'thermal_efficiency': '%',
+    'frequency': 'Hz',
+    'air_mass_flow': 'kg/s',
+    'fuel_mass_flow': 'kg/s',
+    'exhaust_velocity': 'm/s',
+    'power': 'kW',
+    'combustion_volume': 'L',
+    'intake_area': 'cm²',
+    'exhaust_area': 'cm²',
+    'combustion_chamber_length': 'cm',
+    'combustion_chamber_diameter': 'cm',
+    'intake_diameter': 'cm',
+    'exhaust_diameter': 'cm',
+    'exhaust_length': 'cm',
+    'valve_area': 'cm²',
+    'num_valves': '',
+    'air_fuel_ratio': '',
+    'ambient_pressure': 'kPa',
+    'ambient_temp': '°C',
+    'fuel_consumption_rate': 'kg/h',
+    'specific_fuel_consumption': 'kg/kW·h',
+    'thrust_to_weight_ratio': '',
+    'power_to_weight_ratio': 'kW/kg'
+})
+
+
 def format_parameter_name(param_name: str) -> str:
     """
     Format parameter name for display
@@ -874,38 +1079,9 @@ def format_parameter_name(param_name: str) -> str:
     Returns:
         str: Formatted parameter name
     """
-    # Dictionary of parameter name mappings
-    name_mappings = {
-        'thrust': 'Thrust',
-        'specific_impulse': 'Specific Impulse',
-        'thermal_efficiency': 'Thermal Efficiency',
-        'frequency': 'Operating Frequency',
-        'air_mass_flow': 'Air Mass Flow',
-        'fuel_mass_flow': 'Fuel Mass Flow',
-        'exhaust_velocity': 'Exhaust Velocity',
-        'power': 'Power Output',
-        'combustion_volume': 'Combustion Volume',
-        'intake_area': 'Intake Area',
-        'exhaust_area': 'Exhaust Area',
-        'combustion_chamber_length': 'Chamber Length',
-        'combustion_chamber_diameter': 'Chamber Diameter',
-        'intake_diameter': 'Intake Diameter',
-        'exhaust_diameter': 'Exhaust Diameter',
-        'exhaust_length': 'Exhaust Length',
-        'valve_area': 'Valve Area',
-        'num_valves': 'Number of Valves',
-        'air_fuel_ratio': 'Air-Fuel Ratio',
-        'ambient_pressure': 'Ambient Pressure',
-        'ambient_temp': 'Ambient Temperature',
-        'fuel_consumption_rate': 'Fuel Consumption Rate',
-        'specific_fuel_consumption': 'Specific Fuel Consumption',
-        'thrust_to_weight_ratio': 'Thrust-to-Weight Ratio',
-        'power_to_weight_ratio': 'Power-to-Weight Ratio'
-    }
-    
     # Return mapped name or format the original
-    if param_name in name_mappings:
-        return name_mappings[param_name]
+    if param_name in _PARAMETER_NAMES:
+        return _PARAMETER_NAMES[param_name]
     else:
         # Convert snake_case to Title Case
         formatted = param_name.replace('_', ' ').title()
@@ -922,35 +1098,7 @@ def get_parameter_units(param_name: str) -> str:
     Returns:
         str: Units string
     """
-    unit_mappings = {
-        'thrust': 'N',
-        'specific_impulse': 's',
-        'thermal_efficiency': '%',
-        'frequency': 'Hz',
-        'air_mass_flow': 'kg/s',
-        'fuel_mass_flow': 'kg/s',
-        'exhaust_velocity': 'm/s',
-        'power': 'kW',
-        'combustion_volume': 'L',
-        'intake_area': 'cm²',
-        'exhaust_area': 'cm²',
-        'combustion_chamber_length': 'cm',
-        'combustion_chamber_diameter': 'cm',
-        'intake_diameter': 'cm',
-        'exhaust_diameter': 'cm',
-        'exhaust_length': 'cm',
-        'valve_area': 'cm²',
-        'num_valves': '',
-        'air_fuel_ratio': '',
-        'ambient_pressure': 'kPa',
-        'ambient_temp': '°C',
-        'fuel_consumption_rate': 'kg/h',
-        'specific_fuel_consumption': 'kg/kW·h',
-        'thrust_to_weight_ratio': '',
-        'power_to_weight_ratio': 'kW/kg'
-    }
-    
-    return unit_mappings.get(param_name, '')
+    return _PARAMETER_UNITS.get(param_name, '')
 
 
 # Report Generation Functions
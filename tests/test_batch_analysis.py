@@ -0,0 +1,173 @@
+"""Parity tests: batched analysis (analyze_batch / analyze_grid) vs run_complete_analysis"""
+
+import warnings
+from dataclasses import fields, replace
+
+import numpy as np
+import pytest
+
+import src.pulse_jet_models as pulse_jet_models
+from src.pulse_jet_models import (
+    EngineGeometry, OperatingConditions, PerformanceResults, PulseJetModel, ValveSystem,
+    _analysis_batch_kernel, _analysis_kernel
+)
+
+RESULT_FIELDS = [f.name for f in fields(PerformanceResults)]
+DESIGNS = [
+    ('Hydrogen', 1.0),   # Non-zero thrust
+    ('Gasoline', 14.7),
+    ('Propane', 15.7),
+]
+
+
+@pytest.fixture
+def model():
+    return PulseJetModel()
+
+
+@pytest.fixture
+def base():
+    return EngineGeometry(50, 15, 8, 10, 80), ValveSystem('Reed Valves', 4, 20)
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'kernel'])
+def batch_path(request, monkeypatch):
+    """Run analyze_batch through the NumPy expressions and through _analysis_batch_kernel"""
+    monkeypatch.setattr(pulse_jet_models, 'NUMBA_AVAILABLE', request.param)
+
+
+def _scalar_results(model, geometry, valves, conditions):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return model.run_complete_analysis(geometry, valves, conditions)
+
+
+def _assert_point_matches(batch, index, expected):
+    for name in RESULT_FIELDS:
+        np.testing.assert_allclose(batch[name][index], getattr(expected, name),
+                                   rtol=1e-12, atol=0, err_msg=name)
+
+
+@pytest.mark.parametrize('fuel_type, air_fuel_ratio', DESIGNS)
+def test_analyze_grid_matches_scalar_analysis(model, base, batch_path, fuel_type, air_fuel_ratio):
+    geometry, valves = base
+    conditions = OperatingConditions(fuel_type, air_fuel_ratio, 101.3, 20)
+    lengths = np.array([5.0, 40.0, 80.0, 200.0])
+    temps = np.array([-273.0, -20.0, 20.0, 60.0])
+    
+    batch = model.analyze_grid(geometry, valves, conditions,
+                               exhaust_length=lengths[:, None], ambient_temp=temps[None, :])
+    
+    assert all(batch[name].shape == (4, 4) for name in RESULT_FIELDS)
+    for i, length in enumerate(lengths):
+        for j, temp in enumerate(temps):
+            expected = _scalar_results(model, replace(geometry, exhaust_length=length), valves,
+                                       replace(conditions, ambient_temp=temp))
+            _assert_point_matches(batch, (i, j), expected)
+
+
+def test_analyze_batch_ensemble_matches_scalar_analysis(model, base, batch_path):
+    geometry, valves = base
+    rng = np.random.default_rng(0)
+    n = 25
+    samples = {
+        'combustion_chamber_length': rng.uniform(20, 100, n),
+        'combustion_chamber_diameter': rng.uniform(8, 30, n),
+        'exhaust_length': rng.uniform(20, 200, n),
+        'valve_area': rng.uniform(5, 50, n),
+        'air_fuel_ratio': rng.uniform(0.5, 20, n),
+        'ambient_pressure': rng.uniform(80, 120, n),
+    }
+    conditions = OperatingConditions('Hydrogen', 1.0, 101.3, 20)
+    
+    batch = model.analyze_batch(
+        {'combustion_chamber_length': samples['combustion_chamber_length'],
+         'combustion_chamber_diameter': samples['combustion_chamber_diameter'],
+         'intake_diameter': 8, 'exhaust_diameter': 10,
+         'exhaust_length': samples['exhaust_length']},
+        {'num_valves': 4, 'valve_area': samples['valve_area']},
+        {'fuel_type': 'Hydrogen', 'air_fuel_ratio': samples['air_fuel_ratio'],
+         'ambient_pressure': samples['ambient_pressure'], 'ambient_temp': 20})
+    
+    for i in range(n):
+        point = {name: float(values[i]) for name, values in samples.items()}
+        expected = _scalar_results(
+            model,
+            replace(geometry, combustion_chamber_length=point['combustion_chamber_length'],
+                    combustion_chamber_diameter=point['combustion_chamber_diameter'],
+                    exhaust_length=point['exhaust_length']),
+            replace(valves, valve_area=point['valve_area']),
+            replace(conditions, air_fuel_ratio=point['air_fuel_ratio'],
+                    ambient_pressure=point['ambient_pressure']))
+        _assert_point_matches(batch, i, expected)
+
+
+def test_invalid_points_report_failed_analysis_results(model, base, batch_path):
+    geometry, valves = base
+    conditions = OperatingConditions('Hydrogen', 1.0, 101.3, 20)
+    
+    batch = model.analyze_grid(geometry, valves, conditions,
+                               exhaust_length=np.array([-5.0, 0.0, 80.0, 80.0]),
+                               ambient_temp=np.array([20.0, 20.0, -273.15, -400.0]))
+    
+    for name in RESULT_FIELDS:
+        fill = np.inf if name == 'specific_fuel_consumption' else 0.0
+        np.testing.assert_array_equal(batch[name], fill, err_msg=name)
+
+
+def test_run_batch_analysis_is_one_parameter_grid(model, base, batch_path):
+    geometry, valves = base
+    conditions = OperatingConditions('Hydrogen', 1.0, 101.3, 20)
+    values = np.linspace(4, 12, 7)
+    
+    batch = model.run_batch_analysis(geometry, valves, conditions, 'intake_diameter', values)
+    grid = model.analyze_grid(geometry, valves, conditions, intake_diameter=values)
+    
+    for name in RESULT_FIELDS:
+        np.testing.assert_array_equal(batch[name], grid[name])
+
+
+def test_unknown_batch_parameters_raise(model, base):
+    geometry, valves = base
+    conditions = OperatingConditions('Hydrogen', 1.0, 101.3, 20)
+    
+    with pytest.raises(ValueError, match='Unknown parameter'):
+        model.run_batch_analysis(geometry, valves, conditions, 'valve_type', np.ones(2))
+    with pytest.raises(ValueError, match='Unknown parameters'):
+        model.analyze_grid(geometry, valves, conditions, not_a_field=np.ones(2))
+
+
+def test_missing_batch_fields_raise(model):
+    geometry = {'combustion_chamber_length': 50, 'combustion_chamber_diameter': 15,
+                'intake_diameter': 8, 'exhaust_diameter': 10}
+    valves = {'num_valves': 4, 'valve_area': 20}
+    conditions = {'air_fuel_ratio': 1.0, 'ambient_pressure': 101.3, 'ambient_temp': 20}
+    
+    with pytest.raises(ValueError, match=r"\['exhaust_length', 'fuel_type'\]"):
+        model.analyze_batch(geometry, valves, conditions)
+
+
+def test_analysis_batch_kernel_matches_scalar_kernel():
+    constants = (287.0, 1.4, 9.81, 0.85, 0.8, 0.95, 0.6, 0.9, 0.85)
+    rng = np.random.default_rng(1)
+    inputs = np.column_stack([
+        rng.uniform(0, 40, 32),      # combustion volume (L)
+        rng.uniform(10, 300, 32),    # exhaust area (cm²)
+        rng.uniform(2, 15, 32),      # intake diameter
+        rng.uniform(3, 20, 32),      # exhaust diameter
+        rng.uniform(0, 200, 32),     # exhaust length
+        rng.uniform(0, 50, 32),      # valve area
+        rng.uniform(0.5, 20, 32),    # air-fuel ratio
+        rng.uniform(80, 120, 32),    # ambient pressure
+        rng.uniform(-300, 60, 32),   # ambient temperature (some below absolute zero)
+    ])
+    valid = rng.random(32) < 0.8
+    
+    out = _analysis_batch_kernel(inputs, valid, 120.0, *constants)
+    
+    reference = getattr(_analysis_kernel, 'py_func', _analysis_kernel)
+    for row, is_valid, result in zip(inputs, valid, out):
+        if is_valid and row[8] + 273.15 > 0:
+            np.testing.assert_allclose(result, reference(*row, 120.0, *constants), rtol=1e-12, atol=0)
+        else:
+            np.testing.assert_array_equal(result, 0.0)
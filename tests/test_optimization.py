@@ -0,0 +1,177 @@
+"""Tests for OptimizationAnalyzer in src.pulse_jet_models"""
+
+import math
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.pulse_jet_models import (
+    EngineGeometry, OperatingConditions, OptimizationAnalyzer, PulseJetModel, ValveSystem
+)
+
+PARAMETERS = {'exhaust_length': (40.0, 120.0), 'combustion_chamber_length': (30.0, 70.0)}
+
+
+@pytest.fixture
+def analyzer():
+    return OptimizationAnalyzer(PulseJetModel())
+
+
+@pytest.fixture
+def base_design():
+    return (EngineGeometry(50, 15, 8, 10, 80),
+            ValveSystem('Reed Valves', 4, 20),
+            OperatingConditions('Hydrogen', 1.0, 101.3, 20))
+
+
+@pytest.mark.parametrize('parameter, values, failed, message', [
+    ('exhaust_length', [-50.0, 0.0, 80.0], [0, 1], 'Exhaust length must be positive'),
+    ('ambient_temp', [-300.0, 20.0], [0], 'absolute zero'),
+    ('air_fuel_ratio', [0.0, 1.0], [0], 'Air-fuel ratio must be positive'),
+])
+def test_parameter_sweep_warns_once_per_invalid_point(analyzer, base_design, parameter, values,
+                                                      failed, message):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        result = analyzer.parameter_sweep(*base_design, parameter, np.array(values))
+    
+    assert len(caught) == len(failed)
+    assert all(message in str(warning.message) for warning in caught)
+    for i in range(len(values)):
+        assert (result['thrust'][i] == 0) == (i in failed)
+
+
+@pytest.mark.parametrize('method', ('random', 'sobol'))
+@pytest.mark.parametrize('n_samples', (0, -1))
+def test_sampled_search_rejects_non_positive_n_samples(analyzer, base_design, method, n_samples):
+    with pytest.raises(ValueError, match='n_samples'):
+        analyzer.multi_parameter_optimization(*base_design, PARAMETERS, method=method,
+                                              n_samples=n_samples)
+
+
+def test_sobol_search_rounds_samples_up_to_power_of_two(analyzer, base_design):
+    pytest.importorskip('scipy')
+    
+    result = analyzer.multi_parameter_optimization(*base_design, PARAMETERS, method='sobol',
+                                                   n_samples=10, seed=0)
+    
+    assert len(result['all_results']) == 16
+    assert result['best_configuration'] is not None
+    for entry in result['all_results']:
+        for name, (low, high) in PARAMETERS.items():
+            assert low <= entry['parameters'][name] <= high
+    
+    repeat = analyzer.multi_parameter_optimization(*base_design, PARAMETERS, method='sobol',
+                                                   n_samples=10, seed=0)
+    assert [e['parameters'] for e in repeat['all_results']] == \
+        [e['parameters'] for e in result['all_results']]
+
+
+def test_sobol_search_with_single_sample(analyzer, base_design):
+    pytest.importorskip('scipy')
+    
+    result = analyzer.multi_parameter_optimization(*base_design, PARAMETERS, method='sobol',
+                                                   n_samples=1, seed=0)
+    
+    assert len(result['all_results']) == 1
+    assert result['best_configuration'] is not None
+
+
+def _reference_suggestions(geometry, performance):
+    """The if/elif chains _SUGGESTION_RULES replaced, kept as the specification"""
+    suggestions = {}
+    
+    ld_ratio = geometry.ld_ratio
+    if ld_ratio < 2.0:
+        suggestions['ld_ratio'] = f"L/D ratio is low ({ld_ratio:.1f}). Consider increasing chamber length for better combustion completeness."
+    elif ld_ratio > 5.0:
+        suggestions['ld_ratio'] = f"L/D ratio is high ({ld_ratio:.1f}). This may cause excessive heat transfer losses and weight."
+    elif 2.0 <= ld_ratio <= 5.0:
+        suggestions['ld_ratio'] = f"L/D ratio ({ld_ratio:.1f}) is in good range for pulse jets."
+    
+    if performance.frequency < 30:
+        suggestions['frequency'] = "Low operating frequency may reduce power density. Consider shortening exhaust length."
+    elif performance.frequency > 250:
+        suggestions['frequency'] = "High operating frequency may cause structural stress and wear. Consider lengthening exhaust."
+    elif 50 <= performance.frequency <= 150:
+        suggestions['frequency'] = f"Operating frequency ({performance.frequency:.0f} Hz) is in optimal range."
+    
+    area_ratio = geometry.area_ratio
+    if area_ratio < 1.0:
+        suggestions['area_ratio'] = "Exhaust area smaller than intake - this may restrict flow and reduce performance."
+    elif area_ratio > 3.0:
+        suggestions['area_ratio'] = "Very large exhaust/intake area ratio may affect resonance tuning."
+    elif 1.2 <= area_ratio <= 2.5:
+        suggestions['area_ratio'] = f"Area ratio ({area_ratio:.2f}) is well-balanced."
+    
+    if performance.thermal_efficiency < 10:
+        suggestions['efficiency'] = "Low thermal efficiency. Consider optimizing combustion chamber geometry and air-fuel mixing."
+    elif performance.thermal_efficiency > 35:
+        suggestions['efficiency'] = f"Excellent thermal efficiency ({performance.thermal_efficiency:.1f}%)!"
+    elif 15 <= performance.thermal_efficiency <= 25:
+        suggestions['efficiency'] = f"Thermal efficiency ({performance.thermal_efficiency:.1f}%) is typical for pulse jets."
+    
+    if performance.thrust_to_weight_ratio < 2:
+        suggestions['thrust_to_weight'] = "Low thrust-to-weight ratio. Consider increasing chamber diameter or optimizing valve area."
+    elif performance.thrust_to_weight_ratio > 8:
+        suggestions['thrust_to_weight'] = f"Excellent thrust-to-weight ratio ({performance.thrust_to_weight_ratio:.1f})!"
+    
+    if performance.specific_impulse < 80:
+        suggestions['specific_impulse'] = "Low specific impulse indicates poor fuel efficiency. Optimize air-fuel ratio and combustion."
+    elif performance.specific_impulse > 200:
+        suggestions['specific_impulse'] = f"Outstanding specific impulse ({performance.specific_impulse:.0f} s)!"
+    
+    return suggestions
+
+
+def _around(*bounds):
+    """Each bound, its neighbouring floats, and values outside every band"""
+    values = [-1.0, 0.0, 1e6, math.inf, -math.inf, math.nan]
+    for bound in bounds:
+        values += [np.nextafter(bound, -math.inf), float(bound), np.nextafter(bound, math.inf)]
+    return values
+
+
+@pytest.mark.parametrize('attribute, values', [
+    ('ld_ratio', _around(2.0, 5.0)),
+    ('area_ratio', _around(1.0, 1.2, 2.5, 3.0)),
+    ('frequency', _around(30, 50, 150, 250)),
+    ('thermal_efficiency', _around(10, 15, 25, 35)),
+    ('thrust_to_weight_ratio', _around(2, 8)),
+    ('specific_impulse', _around(80, 200)),
+])
+def test_suggestion_bands_match_reference_at_boundaries(analyzer, attribute, values):
+    geometry_values = {'ld_ratio': 3.0, 'area_ratio': 2.0}
+    performance_values = {'frequency': 100.0, 'thermal_efficiency': 20.0,
+                          'thrust_to_weight_ratio': 5.0, 'specific_impulse': 150.0}
+    
+    for value in values:
+        geometry = SimpleNamespace(**geometry_values)
+        performance = SimpleNamespace(**performance_values)
+        setattr(geometry if attribute in geometry_values else performance, attribute, value)
+        
+        assert analyzer.design_optimization_suggestions(geometry, performance) == \
+            _reference_suggestions(geometry, performance), (attribute, value)
+
+
+def test_grid_refinement_evaluates_each_point_once(analyzer, base_design):
+    parameters = {'exhaust_length': (40.0, 120.0), 'combustion_chamber_length': (30.0, 70.0),
+                  'intake_diameter': (4.0, 12.0)}
+    
+    result = analyzer.multi_parameter_optimization(*base_design, parameters, refine_levels=2)
+    
+    # 27 coarse points plus a 125-point refined grid around the corner
+    # optimum, of which 8 points were already in the coarse grid
+    points = [tuple(entry['parameters'].values()) for entry in result['all_results']]
+    assert len(points) == 144
+    assert len(set(points)) == len(points)
+    assert result['best_configuration']['parameters'] == {
+        'exhaust_length': 40.0, 'combustion_chamber_length': 30.0, 'intake_diameter': 4.0}
+
+
+def test_single_level_grid_is_five_points_per_parameter(analyzer, base_design):
+    result = analyzer.multi_parameter_optimization(*base_design, PARAMETERS)
+    
+    assert len(result['all_results']) == 25
@@ -0,0 +1,31 @@
+"""Parity tests for the optional compiled analysis kernel (src/_pulse_jet_kernel.pyx)"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.pulse_jet_models import _analysis_kernel
+
+compiled = pytest.importorskip('src._pulse_jet_kernel')
+
+# Pure-Python reference, also when numba has compiled _analysis_kernel
+reference_kernel = getattr(_analysis_kernel, 'py_func', _analysis_kernel)
+
+MODEL_CONSTANTS = (287.0, 1.4, 9.81, 0.85, 0.8, 0.95, 0.6, 0.9, 0.85)
+
+
+@pytest.mark.parametrize('combustion_volume, exhaust_length, valve_area, air_fuel_ratio, ambient_temp',
+                         list(itertools.product((0.0, 8.8, 50.0), (0.0, 80.0, 200.0), (0.0, 20.0),
+                                                (1.0, 14.7, 34.3), (-273.0, -20.0, 20.0, 60.0))))
+@pytest.mark.parametrize('heating_value', (44.0, 120.0))
+def test_run_analysis_matches_python_kernel(combustion_volume, exhaust_length, valve_area,
+                                            air_fuel_ratio, ambient_temp, heating_value):
+    args = (combustion_volume, 78.5, 8.0, 10.0, exhaust_length, valve_area, air_fuel_ratio,
+            101.3, ambient_temp, heating_value) + MODEL_CONSTANTS
+    
+    expected = reference_kernel(*args)
+    actual = compiled.run_analysis(*args)
+    
+    assert len(actual) == len(expected) == 9
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=0)
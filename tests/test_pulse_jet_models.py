@@ -0,0 +1,38 @@
+"""Tests for src.pulse_jet_models"""
+
+import json
+import os
+
+from src.pulse_jet_models import PulseJetModel
+
+
+def _write_fuel_file(directory, heating_value):
+    fuel_file = directory / 'data' / 'fuel_properties.json'
+    fuel_file.parent.mkdir(exist_ok=True)
+    fuel_file.write_text(json.dumps({
+        'Gasoline': {'heating_value': heating_value, 'density': 0.75,
+                     'stoich_ratio': 14.7, 'molecular_weight': 100}
+    }), encoding='utf-8')
+    return fuel_file
+
+
+def test_models_do_not_share_fuel_properties():
+    a = PulseJetModel()
+    b = PulseJetModel()
+    original = b.fuel_properties['Gasoline']['heating_value']
+    
+    a.fuel_properties['Gasoline']['heating_value'] = 1.0
+    
+    assert b.fuel_properties['Gasoline']['heating_value'] == original
+    assert PulseJetModel().fuel_properties['Gasoline']['heating_value'] == original
+
+
+def test_new_models_see_fuel_file_edits(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fuel_file = _write_fuel_file(tmp_path, 44.0)
+    assert PulseJetModel().fuel_properties['Gasoline']['heating_value'] == 44.0
+    
+    _write_fuel_file(tmp_path, 45.5)
+    stat = fuel_file.stat()
+    os.utime(fuel_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert PulseJetModel().fuel_properties['Gasoline']['heating_value'] == 45.5
@@ -0,0 +1,70 @@
+"""Tests for src.utils"""
+
+import math
+import os
+
+import numpy as np
+import pytest
+
+from src.utils import _moving_average, load_config, load_configuration, save_configuration
+
+
+def test_load_configuration_returns_independent_copies(tmp_path):
+    assert save_configuration({'c': 1, 'nested': {'d': [1, 2]}}, 'cfg', str(tmp_path))
+    
+    first = load_configuration('cfg', str(tmp_path))
+    first['c'] = 99
+    first['nested']['d'].append(3)
+    
+    assert load_configuration('cfg', str(tmp_path)) == {'c': 1, 'nested': {'d': [1, 2]}}
+
+
+def test_load_config_sees_file_changes(tmp_path):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('app:\n  title: first\n', encoding='utf-8')
+    assert load_config(str(config_file))['app']['title'] == 'first'
+    
+    config_file.write_text('app:\n  title: second\n', encoding='utf-8')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(str(config_file))['app']['title'] == 'second'
+
+
+def test_save_configuration_round_trips_non_finite_values(tmp_path):
+    config = {
+        'a': math.inf,
+        'b': math.nan,
+        'c': -math.inf,
+        'values': np.array([1.0, np.inf]),
+        'specific_impulse': np.float64(np.inf),
+        'thrust': 12.5
+    }
+    assert save_configuration(config, 'nonfinite', str(tmp_path))
+    
+    loaded = load_configuration('nonfinite', str(tmp_path))
+    assert loaded['a'] == math.inf
+    assert math.isnan(loaded['b'])
+    assert loaded['c'] == -math.inf
+    assert loaded['values'] == [1.0, math.inf]
+    assert loaded['specific_impulse'] == math.inf
+    assert loaded['thrust'] == 12.5
+
+
+def test_save_configuration_round_trips_finite_numpy_values(tmp_path):
+    config = {'thrust': np.float64(12.5), 'lengths': np.array([1.0, 2.0]), 'count': np.int64(3)}
+    assert save_configuration(config, 'finite', str(tmp_path))
+    
+    assert load_configuration('finite', str(tmp_path)) == {'thrust': 12.5, 'lengths': [1.0, 2.0], 'count': 3}
+
+
+@pytest.mark.parametrize('n, window_size', [
+    (20, 40), (31, 32), (32, 32), (33, 32), (1000, 64), (1000, 33), (1, 32), (5, 3),
+])
+def test_moving_average_matches_convolve(n, window_size):
+    data = np.random.default_rng(n).normal(size=n)
+    expected = np.convolve(data, np.ones(window_size)/window_size, mode='same')
+    
+    result = _moving_average(data, window_size)
+    
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)